@@ -0,0 +1 @@
+"""Shared build tooling for the Arabic Pathways content generation scripts"""
@@ -0,0 +1,278 @@
+"""Command line entry point: python -m arabic_pathways <command>"""
+import argparse
+import asyncio
+import sys
+import time
+
+from arabic_pathways.build import (DEFAULT_BATCH_SIZE, DEFAULT_GAP_MS, DEFAULT_RATE_LIMIT,
+                                   build_targets, day_target, supplementary_target)
+from arabic_pathways.corpus import load_corpus
+from arabic_pathways.dedupe import print_report
+from arabic_pathways.resilience import ResilientBackend, RetryPolicy
+from arabic_pathways.search import DEFAULT_INDEX_PATH, SearchIndex
+from arabic_pathways.store import DEFAULT_DB_PATH, SEARCH_FIELDS, PhraseStore, export_corpus
+from arabic_pathways.tts import BACKENDS, create_backend
+
+
+def parse_day_ranges(value):
+    """Parse "1-7,10,12-14" into a sorted list of day numbers"""
+    days = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                first, last = (int(n) for n in part.split("-", 1))
+                days.update(range(first, last + 1))
+            else:
+                days.add(int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid day range: {part!r}") from None
+    return sorted(days)
+
+
+def parse_categories(value):
+    """Parse "all", "none" or a comma separated list of categories"""
+    if value == "all":
+        return None
+    if value == "none":
+        return []
+    return [category.strip() for category in value.split(",") if category.strip()]
+
+
+def select_targets(days, categories, root=None, corpus=None):
+    """Build targets for the requested days and supplementary categories"""
+    if corpus is None:
+        corpus = load_corpus()
+
+    unknown_days = [day for day in days if day not in corpus.by_day]
+    if unknown_days:
+        raise SystemExit(f"Unknown day(s): {', '.join(map(str, unknown_days))}")
+    if categories is None:
+        categories = corpus.sections()
+    unknown_categories = [c for c in categories if c not in corpus.by_section]
+    if unknown_categories:
+        raise SystemExit(f"Unknown supplementary categories: {', '.join(unknown_categories)}")
+
+    targets = [day_target(day, corpus.day_phrases(day), root) for day in days]
+    targets += [supplementary_target(c, corpus.supplementary_phrases(c), root) for c in categories]
+    return targets
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m arabic_pathways",
+                                     description="Arabic Pathways content tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = commands.add_parser("build", help="Generate text and audio for days and categories")
+    build_cmd.add_argument("--days", type=parse_day_ranges, default=parse_day_ranges("1-40"),
+                           help="Days to build, e.g. 1-40 or 1-7,12 (default: 1-40)")
+    build_cmd.add_argument("--supplementary", type=parse_categories, default=None,
+                           help="Supplementary categories: all, none or a comma separated list "
+                                "(default: all)")
+    build_cmd.add_argument("--text-only", "-t", action="store_true",
+                           help="Generate only text files (no audio)")
+    build_cmd.add_argument("--voice", "-v", type=str,
+                           help="Voice to use for audio generation")
+    build_cmd.add_argument("--language", "-l", type=str, choices=["ar", "en", "both"],
+                           default="both", help="Language to generate audio for")
+    build_cmd.add_argument("--jobs", "-j", type=int, default=4,
+                           help="Number of audio files to generate concurrently (default: 4)")
+    build_cmd.add_argument("--force", "-f", action="store_true",
+                           help="Rebuild every file, even if its phrases have not changed")
+    build_cmd.add_argument("--gap-ms", type=int, default=DEFAULT_GAP_MS,
+                           help=f"Silence between phrases in milliseconds "
+                                f"(default: {DEFAULT_GAP_MS})")
+    build_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                           help=f"Uncached phrases synthesized per TTS request; 1 sends every "
+                                f"phrase on its own (default: {DEFAULT_BATCH_SIZE})")
+    build_cmd.add_argument("--backend", choices=sorted(BACKENDS), default="edge",
+                           help="TTS backend; 'local' is an offline stand-in that returns "
+                                "silent MP3 audio (default: edge)")
+    build_cmd.add_argument("--output-dir", "-o", type=str, default=None,
+                           help="Directory to write text_files/ and audio_files/ into "
+                                "(default: the repository, or build/local for --backend local)")
+    resilience = build_cmd.add_argument_group("retry and rate limit options")
+    resilience.add_argument("--retries", type=int, default=5,
+                            help="Attempts per TTS request before giving up (default: 5)")
+    resilience.add_argument("--backoff", type=float, default=0.5,
+                            help="Base backoff in seconds, doubled per retry (default: 0.5)")
+    resilience.add_argument("--max-backoff", type=float, default=10.0,
+                            help="Upper bound on a single backoff in seconds (default: 10)")
+    resilience.add_argument("--timeout", type=float, default=60.0,
+                            help="Timeout per TTS request in seconds (default: 60)")
+    resilience.add_argument("--rate-limit", type=float, default=None,
+                            help=f"Maximum TTS requests per second, 0 for no limit "
+                                 f"(default: {DEFAULT_RATE_LIMIT} for edge, none for local)")
+    local = build_cmd.add_argument_group("local backend options")
+    local.add_argument("--local-latency", type=float, default=0.3,
+                       help="Median request latency in seconds (default: 0.3)")
+    local.add_argument("--local-jitter", type=float, default=0.5,
+                       help="Log-normal shape of the latency; 0 for constant (default: 0.5)")
+    local.add_argument("--local-handshake", type=float, default=0.1,
+                       help="Seconds to open a new connection (default: 0.1)")
+    local.add_argument("--local-failure-rate", type=float, default=0.0,
+                       help="Probability that a request fails (default: 0)")
+    local.add_argument("--pool-size", type=int, default=None,
+                       help="Warm connections kept for reuse, as a service that allows it "
+                            "would; 0 opens one per request (default: same as --jobs)")
+    local.add_argument("--seed", type=int, default=None,
+                       help="Random seed for reproducible local backend runs")
+
+    dedupe_cmd = commands.add_parser("dedupe", help="Report phrases repeated across days and "
+                                                    "categories")
+    dedupe_cmd.add_argument("--language", "-l", type=str, choices=["ar", "en", "both"],
+                            default="both", help="Language to compare (default: both)")
+
+    export_cmd = commands.add_parser("export-db", help="Export every phrase to an SQLite database")
+    export_cmd.add_argument("--db", type=str, default=DEFAULT_DB_PATH,
+                            help=f"Database path (default: {DEFAULT_DB_PATH})")
+
+    query_cmd = commands.add_parser("query", help="Full-text search of the SQLite phrase database")
+    query_cmd.add_argument("text", help="Words to find, in Arabic, transliteration or English")
+    query_cmd.add_argument("--days", type=parse_day_ranges, default=None,
+                           help="Only search these days, e.g. 20-30")
+    query_cmd.add_argument("--supplementary", type=str, default=None,
+                           help="Only search these supplementary categories (all or a comma "
+                                "separated list)")
+    query_cmd.add_argument("--field", choices=SEARCH_FIELDS, default=None,
+                           help="Only search one field")
+    query_cmd.add_argument("--prefix", action="store_true",
+                           help="Match words starting with the query words")
+    query_cmd.add_argument("--limit", type=int, default=None, help="Maximum number of results")
+    query_cmd.add_argument("--db", type=str, default=DEFAULT_DB_PATH,
+                           help=f"Database path, exported if missing or out of date "
+                                f"(default: {DEFAULT_DB_PATH})")
+
+    search_cmd = commands.add_parser("search", help="Ranked search of every phrase with an "
+                                                    "inverted index")
+    search_cmd.add_argument("text", help="Words to find, in Arabic, transliteration or English")
+    search_cmd.add_argument("--days", type=parse_day_ranges, default=None,
+                            help="Only search these days, e.g. 20-30")
+    search_cmd.add_argument("--supplementary", type=str, default=None,
+                            help="Only search these supplementary categories (all or a comma "
+                                 "separated list)")
+    search_cmd.add_argument("--prefix", action="store_true",
+                            help="Match words starting with the query words")
+    search_cmd.add_argument("--fuzzy", action="store_true",
+                            help="Find transliterations spelled like the query, e.g. "
+                                 "'marhaban' or 'maa salaama'")
+    search_cmd.add_argument("--limit", type=int, default=10,
+                            help="Maximum number of results, 0 for all (default: 10)")
+    search_cmd.add_argument("--index", type=str, default=DEFAULT_INDEX_PATH,
+                            help=f"Index path, rebuilt if missing or out of date "
+                                 f"(default: {DEFAULT_INDEX_PATH})")
+    return parser
+
+
+def backend_from_args(args):
+    if args.backend == "local":
+        pool_size = args.jobs if args.pool_size is None else args.pool_size
+        backend = create_backend("local", latency=args.local_latency, jitter=args.local_jitter,
+                                 failure_rate=args.local_failure_rate, seed=args.seed,
+                                 handshake=args.local_handshake, pool_size=pool_size)
+    else:
+        backend = create_backend(args.backend)
+    retry = RetryPolicy(args.retries, args.backoff, args.max_backoff, seed=args.seed)
+    # The limit protects the edge-tts service; the offline backend has none to protect
+    rate_limit = args.rate_limit
+    if rate_limit is None:
+        rate_limit = DEFAULT_RATE_LIMIT if args.backend == "edge" else 0
+    return ResilientBackend(backend, retry, args.timeout, rate_limit)
+
+
+async def run_build(args):
+    # Keep stand-in audio away from the real lesson files
+    root = args.output_dir
+    if root is None and args.backend == "local":
+        root = "build/local"
+    corpus = load_corpus()
+    targets = select_targets(args.days, args.supplementary, root, corpus)
+    languages = [lang for lang in ["ar", "en"] if args.language in [lang, "both"]]
+    results = await build_targets(targets, languages, args.voice, args.text_only,
+                                  args.jobs, args.force, lambda: backend_from_args(args),
+                                  args.gap_ms, args.batch_size, corpus, args.backend)
+    return 1 if any(not result.ok for result in results) else 0
+
+
+def run_dedupe(args):
+    languages = [lang for lang in ["ar", "en"] if args.language in [lang, "both"]]
+    print_report(load_corpus(), languages)
+    return 0
+
+
+def run_export(args):
+    corpus = load_corpus()
+    export_corpus(corpus, args.db)
+    print(f"✓ Exported {len(corpus)} phrases to {args.db}")
+    return 0
+
+
+def format_phrase(phrase):
+    where = f"Day {phrase.day}" if phrase.day is not None else phrase.section
+    return f"{where} · {phrase.category}: {phrase.ar} | {phrase.transliteration} | {phrase.en}"
+
+
+def scope_sections(value, corpus=None):
+    """Sections of a --supplementary search option; None when not given"""
+    if value is None:
+        return None
+    sections = parse_categories(value)
+    if sections is None:  # "all"
+        sections = (corpus or load_corpus()).sections()
+    return sections
+
+
+def run_query(args):
+    sections = scope_sections(args.supplementary)
+    with PhraseStore.open(args.db) as store:
+        start = time.perf_counter()
+        try:
+            results = store.search(args.text, args.days, sections, args.field, args.prefix,
+                                   args.limit)
+        except ValueError as e:
+            # Punctuation and harakat alone leave no words to match
+            raise SystemExit(f"Cannot search for {args.text!r}: {e}") from e
+        elapsed = time.perf_counter() - start
+    for phrase in results:
+        print(format_phrase(phrase))
+    print(f"\n{len(results)} phrase(s) in {elapsed * 1000:.2f} ms")
+    return 0
+
+
+def run_search(args):
+    corpus = load_corpus()
+    index = SearchIndex.load(corpus, args.index)
+    sections = scope_sections(args.supplementary, corpus)
+    start = time.perf_counter()
+    if args.fuzzy:
+        matches = index.fuzzy(args.text, args.limit, args.days, sections)
+    else:
+        matches = index.search(args.text, args.limit, args.days, sections, args.prefix)
+    elapsed = time.perf_counter() - start
+    for rank, match in enumerate(matches, 1):
+        print(f"{rank:>3}. {format_phrase(match.phrase)}  "
+              f"[{match.score:.2f}, {', '.join(match.fields)}]")
+    source = "cached index" if index.from_cache else "new index"
+    print(f"\n{len(matches)} match(es) in {elapsed * 1000:.2f} ms ({source})")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "build":
+        return asyncio.run(run_build(args))
+    if args.command == "dedupe":
+        return run_dedupe(args)
+    if args.command == "export-db":
+        return run_export(args)
+    if args.command == "query":
+        return run_query(args)
+    if args.command == "search":
+        return run_search(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""One item per topic, maximizing total score while penalizing reuse.
+
+Used to give every day and supplementary category its own lesson video:
+picking each topic's best video in isolation hands the same popular
+video to many topics.
+
+The problem is a min-cost flow. Each topic sends one unit to one of its
+candidate items, and an item passes its k-th unit to the sink at a cost of
+reuse_penalty * (k - 1). Those slot costs grow with k, so they behave like
+parallel arcs used cheapest first. Topics are added one at a time, each
+with a shortest augmenting path found by Dijkstra on reduced costs (as in
+the Hungarian method). The path may move earlier topics to other items. It
+ends where an item takes one more use at the lowest total cost.
+
+Only a topic's top len(topics) + len(used) candidates can be in an optimal
+answer. Among those, some item is used by no other topic and was not used
+before, and it is at least as good as anything further down. So a topic
+with hundreds of candidates costs no more than one with a few dozen.
+"""
+import heapq
+
+DEFAULT_REUSE_PENALTY = 4.0
+
+# Flow graph nodes are tagged so that a topic and an item may share a name
+TOPIC, ITEM = 0, 1
+SINK = (2, None)
+
+
+def reuse_cost(uses, reuse_penalty):
+    """Total penalty of an item used `uses` times"""
+    return reuse_penalty * uses * (uses - 1) / 2
+
+
+def total_score(candidates, assignment, reuse_penalty=DEFAULT_REUSE_PENALTY, used=None):
+    """Sum of the assigned scores minus the reuse penalty of every item"""
+    counts = dict(used or {})
+    for item in assignment.values():
+        counts[item] = counts.get(item, 0) + 1
+    penalty = sum(reuse_cost(count, reuse_penalty) - reuse_cost((used or {}).get(item, 0),
+                                                                reuse_penalty)
+                  for item, count in counts.items())
+    return sum(candidates[topic][item] for topic, item in assignment.items()) - penalty
+
+
+def greedy(candidates):
+    """Every topic's best scoring item, ignoring reuse"""
+    return {topic: max(scores, key=scores.get) for topic, scores in candidates.items() if scores}
+
+
+def prune(candidates, keep):
+    """{topic: [(item, score)]} with only the `keep` best items of each topic"""
+    return {topic: heapq.nlargest(keep, scores.items(), key=lambda entry: entry[1])
+            for topic, scores in candidates.items() if scores}
+
+
+def assign(candidates, reuse_penalty=DEFAULT_REUSE_PENALTY, used=None):
+    """Pick one item for every topic, maximizing total_score.
+
+    candidates maps each topic to {item: score}; used maps items to the
+    number of times they are already used elsewhere, which their next use
+    is penalized for too. Returns {topic: item}, leaving out topics without
+    candidates.
+    """
+    used = {item: count for item, count in (used or {}).items() if count > 0}
+    arcs = prune(candidates, len(candidates) + len(used))
+    # Costs are the score below the topic's best, so all of them start >= 0
+    cost = {topic: {item: entries[0][1] - score for item, score in entries}
+            for topic, entries in arcs.items()}
+
+    uses = dict(used)
+    assigned = {}   # topic -> item
+    holders = {}    # item -> topics assigned to it
+    potential = {}
+
+    def steps(node):
+        """(next node, cost) of every residual arc out of node"""
+        kind, name = node
+        if kind == TOPIC:
+            # On to any item the topic is not assigned to
+            return [((ITEM, item), c) for item, c in cost[name].items()
+                    if assigned.get(name) != item]
+        # One more use of the item, or hand one of its topics over to another item
+        return [(SINK, reuse_penalty * uses.get(name, 0))] + \
+            [((TOPIC, holder), -cost[holder][name]) for holder in holders.get(name, ())]
+
+    for topic in arcs:
+        source = (TOPIC, topic)
+        # The new topic has no incoming arcs, so its potential can be set
+        # high enough to keep the reduced costs of its arcs non-negative.
+        potential[source] = max(potential.get((ITEM, item), 0.0) - c
+                                for item, c in cost[topic].items())
+        dist = {source: 0.0}
+        previous = {}
+        done = set()
+        heap = [(0.0, 0, source)]
+        order = 1
+        while heap:
+            d, _, node = heapq.heappop(heap)
+            if node in done or d > dist[node]:
+                continue
+            done.add(node)
+            if node == SINK:
+                break
+            for target, c in steps(node):
+                reduced = c + potential.get(node, 0.0) - potential.get(target, 0.0)
+                # max() only absorbs floating point rounding; reduced costs are >= 0
+                candidate = d + max(0.0, reduced)
+                if candidate < dist.get(target, float("inf")):
+                    dist[target] = candidate
+                    previous[target] = node
+                    heapq.heappush(heap, (candidate, order, target))
+                    order += 1
+
+        # Nodes settled before the sink move by their distance below it
+        limit = dist[SINK]
+        for node in done:
+            potential[node] = potential.get(node, 0.0) + dist[node] - limit
+
+        # Walk back from the sink: sink <- item <- topic (<- item <- topic ...)
+        _, item = previous[SINK]
+        uses[item] = uses.get(item, 0) + 1
+        while True:
+            _, holder = previous[(ITEM, item)]
+            old = assigned.get(holder)
+            if old is not None:
+                holders[old].remove(holder)
+            assigned[holder] = item
+            holders.setdefault(item, []).append(holder)
+            if holder == topic:
+                break
+            _, item = previous[(TOPIC, holder)]
+    return assigned
@@ -0,0 +1,144 @@
+"""Phrase-level audio synthesis and day file assembly"""
+import asyncio
+
+from arabic_pathways import mp3
+from arabic_pathways.audio_writer import StreamingWriter
+from arabic_pathways.batching import align_phrases, batch_text, cut_points, rebase_words
+from arabic_pathways.segment_cache import TICKS_PER_MS, segment_key
+
+
+async def fetch_segment(key, text, voice, cache, backend, rate="+0%", pitch="+0Hz"):
+    """Synthesize one phrase into the cache under key.
+
+    Audio chunks are written to disk as they arrive, so only one chunk is
+    held in memory at a time. WordBoundary events from the same request are
+    kept as the segment's word timings.
+    """
+    with cache.writer(key) as writer:
+        async for chunk in backend.stream(text, voice, rate, pitch):
+            if chunk["type"] == "audio":
+                writer.write(chunk["data"])
+            elif chunk["type"] == "WordBoundary":
+                writer.add_boundary(chunk)
+    return writer.segment
+
+
+async def synthesize_segment(text, voice, cache, backend, rate="+0%", pitch="+0Hz"):
+    """Return the cached Segment for one phrase, calling the backend only on a miss"""
+    key = segment_key(text, voice, rate, pitch, backend=backend.name)
+    segment = cache.load(key)
+    if segment is not None:
+        return segment
+    return await fetch_segment(key, text, voice, cache, backend, rate, pitch)
+
+
+async def synthesize_batch(texts, keys, voice, cache, backend, rate="+0%", pitch="+0Hz"):
+    """Synthesize several phrases with one request and cache each one separately.
+
+    The word timings of the batch are matched against the phrase texts and
+    the audio is cut at frame boundaries half way through the pause between
+    phrases. If the words cannot be matched, every phrase is synthesized on
+    its own instead. Returns the Segment of each text.
+    """
+    audio = bytearray()
+    words = []
+    async for chunk in backend.stream(batch_text(texts), voice, rate, pitch):
+        if chunk["type"] == "audio":
+            audio += chunk["data"]
+        elif chunk["type"] == "WordBoundary":
+            words.append([chunk["offset"] // TICKS_PER_MS, chunk["duration"] // TICKS_PER_MS,
+                          chunk["text"]])
+
+    aligned = align_phrases(texts, words)
+    if aligned is None:
+        print(f"⚠ Could not split a batch of {len(texts)} phrases; "
+              f"synthesizing them one by one")
+        return [await fetch_segment(key, text, voice, cache, backend, rate, pitch)
+                for text, key in zip(texts, keys)]
+
+    pieces = mp3.split(bytes(audio), cut_points(aligned))
+    return [cache.put(key, piece, rebase_words(phrase_words, start_ms))
+            for key, phrase_words, (piece, start_ms) in zip(keys, aligned, pieces)]
+
+
+async def synthesize_segments(texts, voice, cache, backend, rate="+0%", pitch="+0Hz",
+                              batch_size=1):
+    """Return the Segment of every text, synthesizing cache misses batch_size at a time.
+
+    Each missing segment is synthesized once: a text repeated in texts is
+    requested once, and a segment another job is already synthesizing
+    (cache.in_flight) is awaited instead of requested again. If that job
+    fails, the segment is synthesized here after all.
+    """
+    keys = [segment_key(text, voice, rate, pitch, backend=backend.name) for text in texts]
+    found = {}
+    owned = {}
+    waiting = {}
+    for text, key in zip(texts, keys):
+        if key in found or key in owned or key in waiting:
+            cache.shared += 1
+            continue
+        segment = cache.load(key)
+        if segment is not None:
+            found[key] = segment
+        elif key in cache.in_flight:
+            cache.shared += 1
+            waiting[key] = cache.in_flight[key]
+        else:
+            owned[key] = text
+            cache.in_flight[key] = asyncio.get_running_loop().create_future()
+
+    try:
+        missing = list(owned.items())
+        batch_size = max(1, batch_size)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            if len(batch) == 1:
+                (key, text), = batch
+                segments = [await fetch_segment(key, text, voice, cache, backend, rate, pitch)]
+            else:
+                segments = await synthesize_batch([text for _, text in batch],
+                                                  [key for key, _ in batch],
+                                                  voice, cache, backend, rate, pitch)
+            for (key, _), segment in zip(batch, segments):
+                found[key] = segment
+                cache.in_flight.pop(key).set_result(segment)
+    finally:
+        # Jobs waiting on a segment this call did not finish synthesize it themselves
+        for key in owned:
+            if key not in found:
+                cache.in_flight.pop(key).set_result(None)
+
+    for key, future in waiting.items():
+        segment = await future
+        if segment is None:
+            segment = await fetch_segment(key, texts[keys.index(key)], voice, cache, backend,
+                                          rate, pitch)
+        found[key] = segment
+    return [found[key] for key in keys]
+
+
+async def assemble_audio(texts, voice, output_path, cache, backend, rate="+0%", pitch="+0Hz",
+                         gap_ms=0, batch_size=1):
+    """Write one MP3 made of the segments for texts, in order.
+
+    Phrases missing from the cache are synthesized batch_size per request.
+    Segments are joined at MPEG frame boundaries by mp3.concat: each
+    segment's frames are written as slices of its file, and any ID3 tags
+    or Xing/Info header frames inside the joined stream are dropped, so the
+    result plays back (and reports its length) correctly without any
+    re-encoding. gap_ms of generated silence separates consecutive
+    phrases. The output goes to a temporary file that replaces output_path
+    only once it is complete.
+
+    Returns (writer, segments, gaps_ms): the finished StreamingWriter, whose
+    sha256 and size describe the written file, the Segment of each text and
+    the silence actually inserted after each segment (gaps are rounded to
+    whole frames).
+    """
+    segments = await synthesize_segments(texts, voice, cache, backend, rate, pitch, batch_size)
+
+    with StreamingWriter(output_path) as writer:
+        _, _, gap = mp3.concat(writer, [segment.path for segment in segments], gap_ms)
+    gaps_ms = [gap] * (len(segments) - 1) + [0] if segments else []
+    return writer, segments, gaps_ms
@@ -0,0 +1,59 @@
+"""Atomic, hashing file writer for generated audio and text"""
+import hashlib
+import itertools
+import os
+
+COPY_BLOCK_SIZE = 64 * 1024
+
+_counter = itertools.count()
+
+
+class StreamingWriter:
+    """Write a file chunk by chunk through a temporary file.
+
+    The sha256 and byte count are updated as chunks arrive, and the file
+    only appears at `path` (via an atomic rename) once the writer is closed
+    without an error. A crash or exception leaves any previous file at
+    `path` untouched and removes the partial temporary file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory, name = os.path.split(path)
+        self.tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{next(_counter)}.tmp")
+        self.hash = hashlib.sha256()
+        self.size = 0
+        self.file = None
+
+    def __enter__(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.tmp_path, "wb")  # pylint: disable=consider-using-with
+        return self
+
+    def write(self, data):
+        self.file.write(data)
+        self.hash.update(data)
+        self.size += len(data)
+
+    def copy_from(self, path):
+        """Append the contents of another file, one block at a time"""
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(COPY_BLOCK_SIZE)
+                if not block:
+                    break
+                self.write(block)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+        return False
+
+    @property
+    def sha256(self):
+        return self.hash.hexdigest()
@@ -0,0 +1,70 @@
+"""Packing several phrases into one TTS request and splitting the result per phrase"""
+import unicodedata
+
+# A phrase without one of these at the end gets a full stop in a batch, so
+# that the voice ends it as a sentence before the next phrase starts.
+SENTENCE_ENDS = ".!?؟…"
+
+
+def batch_text(texts):
+    """The text of one request that speaks every phrase of texts in turn"""
+    lines = []
+    for text in texts:
+        text = text.strip()
+        lines.append(text if text.endswith(tuple(SENTENCE_ENDS)) else f"{text}.")
+    return "\n".join(lines)
+
+
+def word_key(text):
+    """Letters and digits of text, for matching spoken words against phrase text.
+
+    Punctuation, spaces and Arabic diacritics (combining marks) are
+    dropped, since the TTS service may or may not report them.
+    """
+    return "".join(ch for ch in unicodedata.normalize("NFC", text)
+                   if ch.isalnum() and not unicodedata.combining(ch))
+
+
+def align_phrases(texts, words):
+    """Assign the word timings of a batch to the phrases it was made from.
+
+    words is the batch's list of [offset_ms, duration_ms, text]. Returns one
+    list of words per phrase, or None if the words do not spell out the
+    phrases in order (the batch then cannot be split safely).
+    """
+    spoken = [word for word in words if word_key(word[2])]
+    position = 0
+    aligned = []
+    for text in texts:
+        target = word_key(text)
+        matched = ""
+        phrase_words = []
+        while matched != target:
+            if position == len(spoken):
+                return None
+            word = spoken[position]
+            matched += word_key(word[2])
+            if not target.startswith(matched):
+                return None
+            phrase_words.append(word)
+            position += 1
+        if not phrase_words:
+            return None
+        aligned.append(phrase_words)
+    if position != len(spoken):
+        return None
+    return aligned
+
+
+def cut_points(aligned):
+    """Split times in ms half way between the last word of a phrase and the next phrase"""
+    cuts = []
+    for previous, following in zip(aligned, aligned[1:]):
+        last_offset, last_duration, _ = previous[-1]
+        cuts.append((last_offset + last_duration + following[0][0]) // 2)
+    return cuts
+
+
+def rebase_words(words, start_ms):
+    """Word timings relative to a piece of audio that starts at start_ms"""
+    return [[offset - start_ms, duration, text] for offset, duration, text in words]
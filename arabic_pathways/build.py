@@ -0,0 +1,230 @@
+"""Text and audio generation shared by every phrase script and the build CLI"""
+import os
+import time
+
+from arabic_pathways.audio import assemble_audio
+from arabic_pathways.audio_writer import StreamingWriter
+from arabic_pathways.corpus import load_corpus
+from arabic_pathways.dedupe import spoken_texts
+from arabic_pathways.manifest import BuildManifest, audio_digest, text_digest
+from arabic_pathways.resilience import ResilientBackend
+from arabic_pathways.scheduler import run_jobs, print_report
+from arabic_pathways.segment_cache import SegmentCache
+from arabic_pathways.timing import phrase_timings, write_timing_index
+from arabic_pathways.tts import create_backend
+
+TEXT_FORMATS = ["ar", "transliteration", "en"]
+
+DAY_VOICES = {"ar": "ar-EG-SalmaNeural", "en": "en-US-JennyNeural"}
+SUPPLEMENTARY_VOICES = {"ar": "ar-SA-ZariyahNeural", "en": "ar-SA-ZariyahNeural"}
+
+# Requests per second sent to edge-tts
+DEFAULT_RATE_LIMIT = 8
+
+# Silence between phrases in the lesson audio
+DEFAULT_GAP_MS = 800
+
+# Uncached phrases sent to the TTS service per request
+DEFAULT_BATCH_SIZE = 8
+
+
+class Target:
+    """A day or supplementary category and the files generated for it"""
+
+    def __init__(self, name, label, phrases, text_dir, audio_dir, voices, spoken=None):
+        self.name = name
+        self.label = label
+        self.phrases = phrases
+        self.text_dir = text_dir
+        self.audio_dir = audio_dir
+        self.voices = voices
+        # {format: {text: text spoken instead}}, from dedupe.spoken_texts
+        self.spoken = spoken or {}
+
+    def text_path(self, format_type):
+        return f"{self.text_dir}/{self.name}_{format_type}.txt"
+
+    def audio_path(self, format_type):
+        return f"{self.audio_dir}/{self.name}_{format_type}.mp3"
+
+    def timing_paths(self, format_type):
+        """JSON and WebVTT phrase timing indexes written next to the audio file"""
+        base = f"{self.audio_dir}/{self.name}_{format_type}"
+        return f"{base}.timings.json", f"{base}.vtt"
+
+    def audio_outputs(self, format_type):
+        return [self.audio_path(format_type), *self.timing_paths(format_type)]
+
+    def voice(self, format_type, override=None):
+        return override or self.voices[format_type]
+
+    def audio_entries(self, format_type):
+        """(category, phrase text) of every phrase in the audio file, in order"""
+        return [(category, phrase[format_type])
+                for category, phrase_list in self.phrases.items()
+                for phrase in phrase_list]
+
+    def audio_texts(self, format_type):
+        """Text spoken for each phrase; pauses come from generated silence, not punctuation.
+
+        A phrase repeated elsewhere with another spelling is spoken with
+        the spelling its duplicates share, so they reuse one segment.
+        """
+        spoken = self.spoken.get(format_type, {})
+        return [spoken.get(text, text) for _, text in self.audio_entries(format_type)]
+
+
+def default_backend():
+    """edge-tts with the default retry, timeout and rate limit settings"""
+    return ResilientBackend(create_backend("edge"), rate_limit=DEFAULT_RATE_LIMIT)
+
+
+def output_dir(root, path):
+    """path inside root, leaving paths relative to the repository unchanged"""
+    return path if root in (None, ".") else f"{root}/{path}"
+
+
+def day_target(day, phrases, root=None):
+    return Target(f"day{day}", f"Day {day}", phrases, output_dir(root, "text_files"),
+                  output_dir(root, "audio_files"), DAY_VOICES)
+
+
+def supplementary_target(category, phrases, root=None):
+    return Target(category, category, phrases, output_dir(root, "text_files/supplementary"),
+                  output_dir(root, "audio_files/supplementary"), SUPPLEMENTARY_VOICES)
+
+
+def generate_text_file(target, format_type, manifest=None):
+    """Generate a text file with all phrases of a target in one format"""
+    output_path = target.text_path(format_type)
+
+    # Skip the file if its phrases have not changed since the last build
+    digest = text_digest(target.phrases, format_type)
+    if manifest is not None and manifest.is_fresh(output_path, digest):
+        print(f"✓ Up to date: {output_path}")
+        return
+
+    print(f"Generating {target.label} {format_type} text file...")
+
+    with StreamingWriter(output_path) as writer:
+        for category, phrase_list in target.phrases.items():
+            writer.write(f"\n{category}\n".encode("utf-8"))
+            writer.write(("-" * len(category) + "\n").encode("utf-8"))
+            for phrase in phrase_list:
+                if format_type in phrase:
+                    writer.write(f"{phrase[format_type]}\n".encode("utf-8"))
+
+    if manifest is not None:
+        manifest.record(output_path, digest, sha256=writer.sha256, bytes=writer.size)
+    print(f"✓ Saved to {output_path}")
+
+
+async def generate_audio(target, format_type="ar", voice=None, cache=None, manifest=None,
+                         backend=None, gap_ms=DEFAULT_GAP_MS, batch_size=DEFAULT_BATCH_SIZE):
+    """Generate the audio file of a target and its phrase timing indexes.
+
+    The audio is joined from cached per-phrase TTS segments with gap_ms of
+    silence between phrases; the word timings captured while synthesizing
+    them give the start and end of every phrase in the joined file. Missing
+    segments are synthesized batch_size phrases per request.
+    """
+    voice = target.voice(format_type, voice)
+    texts = target.audio_texts(format_type)
+    output_path = target.audio_path(format_type)
+    json_path, vtt_path = target.timing_paths(format_type)
+
+    print(f"\nGenerating {target.label} {format_type} audio file...")
+    start_time = time.time()
+    os.makedirs(target.audio_dir, exist_ok=True)
+
+    # Only phrases missing from the cache are sent to the TTS backend
+    if cache is None:
+        cache = SegmentCache()
+    if backend is None:
+        backend = default_backend()
+    writer, segments, gaps_ms = await assemble_audio(texts, voice, output_path, cache, backend,
+                                                     gap_ms=gap_ms, batch_size=batch_size)
+    timings, duration_ms = phrase_timings(segments, gaps_ms)
+    index_writers = write_timing_index(json_path, vtt_path, output_path,
+                                       target.audio_entries(format_type), timings, duration_ms)
+
+    if manifest is not None:
+        digest = audio_digest(texts, voice, backend=backend.name, gap_ms=gap_ms)
+        manifest.record(output_path, digest, voice=voice, backend=backend.name, gap_ms=gap_ms,
+                        sha256=writer.sha256, bytes=writer.size)
+        for index_writer in index_writers:
+            manifest.record(index_writer.path, digest, count=False, sha256=index_writer.sha256,
+                            bytes=index_writer.size)
+
+    elapsed = time.time() - start_time
+    print(f"✓ Saved to {output_path} ({elapsed:.2f}s)")
+
+
+async def build_targets(targets, languages=("ar", "en"), voice=None, text_only=False,
+                        jobs=1, force=False, backend_factory=None, gap_ms=DEFAULT_GAP_MS,
+                        batch_size=DEFAULT_BATCH_SIZE, corpus=None, backend_name="edge"):
+    """Generate text and audio for every target in one event loop.
+
+    Text files are written first; audio for all targets is then scheduled
+    together so that --jobs spreads across days and categories, and all of
+    them share one segment cache, one build manifest and one TTS backend.
+    backend_factory (default: edge-tts with retries and rate limiting) is
+    only called once some audio file is out of date, so text-only and
+    no-op builds never load the TTS libraries; backend_name is the name of
+    the backend it returns, which audio digests are computed with.
+
+    Duplicate phrases are spoken with one spelling (see dedupe.py), found
+    over the whole corpus (load_corpus() unless given) so that a phrase
+    sounds the same, and has the same audio digest, whichever days are
+    built and by which tool. A segment needed by several files at once is
+    synthesized by the first and awaited by the others.
+
+    Returns the list of audio JobResults.
+    """
+    spoken = spoken_texts(corpus if corpus is not None else load_corpus(), languages)
+    for target in targets:
+        target.spoken = spoken
+    cache = SegmentCache()
+    manifest = BuildManifest(force=force)
+    if backend_factory is None:
+        backend_factory = default_backend
+    backend = None
+    audio_jobs = []
+
+    for target in targets:
+        print(f"\n=== Processing {target.label} ===")
+
+        # Generate text files for Arabic, transliteration, and English
+        for format_type in TEXT_FORMATS:
+            generate_text_file(target, format_type, manifest)
+
+        # Queue audio files if not text-only mode
+        if text_only:
+            continue
+        for lang in languages:
+            target_voice = target.voice(lang, voice)
+            digest = audio_digest(target.audio_texts(lang), target_voice, backend=backend_name,
+                                  gap_ms=gap_ms)
+            if manifest.all_fresh(target.audio_outputs(lang), digest):
+                print(f"✓ Up to date: {target.audio_path(lang)}")
+                continue
+            audio_jobs.append((f"{target.label} {lang} ({target_voice})",
+                               lambda target=target, lang=lang:
+                               generate_audio(target, lang, voice, cache, manifest, backend,
+                                              gap_ms, batch_size)))
+
+    # Generate all queued audio files, at most `jobs` at a time; the jobs
+    # above read `backend` when they run, after it is created here
+    results = []
+    if audio_jobs:
+        backend = backend_factory()
+        try:
+            results, wall = await run_jobs(audio_jobs, jobs)
+            print_report(results, wall, jobs)
+            cache.print_stats()
+            backend.print_stats()
+        finally:
+            await backend.close()
+    manifest.save()
+    manifest.print_stats()
+    return results
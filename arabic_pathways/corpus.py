@@ -0,0 +1,125 @@
+"""The whole curriculum as one list of Phrase records, cached on disk"""
+import hashlib
+import os
+import pickle
+
+from arabic_pathways.audio_writer import StreamingWriter
+from arabic_pathways.normalize import normalize_phrases
+from arabic_pathways.phrase_data import DATA_DIR, Phrase, data_files, iter_phrases
+
+DEFAULT_CORPUS_CACHE = ".corpus_cache/corpus.pickle"
+
+# Bump when Phrase records or the cache layout change
+CORPUS_FORMAT_VERSION = 2
+
+
+def group_phrases(phrases):
+    """{category: [phrase dict]} in first-seen category order, as the build expects"""
+    grouped = {}
+    for phrase in phrases:
+        grouped.setdefault(phrase.category, []).append(phrase.asdict())
+    return grouped
+
+
+class Corpus:
+    """Every day and supplementary phrase, in curriculum order"""
+
+    def __init__(self, phrases, from_cache=False):
+        normalize_phrases(phrases)
+        self.phrases = phrases
+        self.from_cache = from_cache
+        self.by_day = {}
+        self.by_section = {}
+        for phrase in phrases:
+            if phrase.day is not None:
+                self.by_day.setdefault(phrase.day, []).append(phrase)
+            else:
+                self.by_section.setdefault(phrase.section, []).append(phrase)
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def __iter__(self):
+        return iter(self.phrases)
+
+    def days(self):
+        return sorted(self.by_day)
+
+    def sections(self):
+        return list(self.by_section)
+
+    def day_phrases(self, day):
+        """{category: [phrase dict]} of one day"""
+        return group_phrases(self.by_day.get(day, []))
+
+    def supplementary_phrases(self, section):
+        """{category: [phrase dict]} of one supplementary category"""
+        return group_phrases(self.by_section.get(section, []))
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(64 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_stamp(path, previous=None):
+    """{"mtime_ns", "size", "sha256"} of a source file.
+
+    The hash of the previous stamp is reused when the mtime and size are
+    unchanged, so an untouched source is never read.
+    """
+    stat = os.stat(path)
+    if previous and (previous["mtime_ns"], previous["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return previous
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": file_sha256(path)}
+
+
+def load_corpus(cache_path=DEFAULT_CORPUS_CACHE, data_dir=DATA_DIR):
+    """Load the corpus from cache_path, recompiling it if any data file changed.
+
+    The cache records the mtime, size and sha256 of every phrase data file.
+    A file whose mtime changed but whose content did not still counts as
+    unchanged (the cache is rewritten with the new mtime). Adding or
+    removing a file also recompiles. Pass cache_path=None to always read
+    the data files.
+    """
+    paths = data_files(data_dir)
+
+    cached = None
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cached = None
+        if not isinstance(cached, dict) or cached.get("version") != CORPUS_FORMAT_VERSION:
+            cached = None
+
+    previous = cached["sources"] if cached else {}
+    sources = {path: source_stamp(path, previous.get(path)) for path in paths}
+    hashes_match = cached is not None and list(previous) == paths and all(
+        previous[path]["sha256"] == sources[path]["sha256"] for path in paths)
+
+    if hashes_match:
+        phrases = [Phrase(*record) for record in cached["phrases"]]
+        if sources != previous:
+            save_corpus(cache_path, sources, phrases)
+        return Corpus(phrases, from_cache=True)
+
+    phrases = list(iter_phrases(data_dir=data_dir))
+    if cache_path is not None:
+        save_corpus(cache_path, sources, phrases)
+    return Corpus(phrases)
+
+
+def save_corpus(cache_path, sources, phrases):
+    payload = {
+        "version": CORPUS_FORMAT_VERSION,
+        "sources": sources,
+        "phrases": [phrase.astuple() for phrase in phrases],
+    }
+    with StreamingWriter(cache_path) as writer:
+        writer.write(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
@@ -0,0 +1,100 @@
+"""Phrases repeated across days and categories, and the text spoken for each.
+
+For the dedupe report, two phrases are duplicates when their normalized
+Arabic (or English) is the same, e.g. "شكرا" and "شكراً" or "Thank you"
+and "thank you".
+
+Audio is stricter: the segment cache is keyed on the exact text, so exact
+repeats already share one segment, and only spellings that sound the same
+(differing in case, whitespace or tatweel) are spoken with one canonical
+text. Tashkeel and punctuation change the speech and are kept.
+"""
+# Index of each audio language in Phrase.normalized
+NORMALIZED_INDEX = {"ar": 0, "en": 2}
+
+# Fathatan .. sukun, and superscript alef
+VOWEL_MARKS = frozenset([*map(chr, range(0x064B, 0x0653)), "\u0670"])
+
+
+def vowel_marks(text):
+    """Number of tashkeel marks in text"""
+    return sum(ch in VOWEL_MARKS for ch in text)
+
+
+def spoken_key(text):
+    """text up to differences that do not change how it is spoken: case, whitespace, tatweel"""
+    return " ".join(text.replace("ـ", "").casefold().split())
+
+
+class DuplicateGroup:
+    """Phrases sharing one normalized text in one language"""
+
+    def __init__(self, field, key, phrases):
+        self.field = field
+        self.key = key
+        self.phrases = phrases
+
+    def spellings(self):
+        """{raw text: occurrences}, in order of first use"""
+        counts = {}
+        for phrase in self.phrases:
+            text = getattr(phrase, self.field)
+            counts[text] = counts.get(text, 0) + 1
+        return counts
+
+    def canonical(self):
+        """The most common spelling; on a tie the most fully vowelled, then the earliest"""
+        counts = self.spellings()
+        return max(counts, key=lambda text: (counts[text], vowel_marks(text)))
+
+
+def group_phrases(phrases, field, key=None):
+    """DuplicateGroup of every normalized text of field ("ar" or "en"), in curriculum order.
+
+    key(phrase) replaces the normalized text as what the phrases are grouped by.
+    """
+    index = NORMALIZED_INDEX[field]
+    grouped = {}
+    for phrase in phrases:
+        group_key = phrase.normalized[index] if key is None else key(phrase)
+        grouped.setdefault(group_key, []).append(phrase)
+    return [DuplicateGroup(field, group_key, members) for group_key, members in grouped.items()]
+
+
+def duplicate_groups(phrases, field, key=None):
+    """Groups of field that occur more than once"""
+    return [group for group in group_phrases(phrases, field, key) if len(group.phrases) > 1]
+
+
+def spoken_texts(phrases, fields=("ar", "en")):
+    """{field: {raw text: canonical text}} for spellings that sound alike but differ"""
+    spoken = {}
+    for field in fields:
+        groups = duplicate_groups(phrases, field,
+                                  lambda phrase, field=field: spoken_key(getattr(phrase, field)))
+        spoken[field] = {text: group.canonical()
+                         for group in groups
+                         for text in group.spellings()
+                         if len(group.spellings()) > 1 and text != group.canonical()}
+    return spoken
+
+
+def location(phrase):
+    where = f"Day {phrase.day}" if phrase.day is not None else phrase.section
+    return f"{where} · {phrase.category}"
+
+
+def print_report(phrases, fields=("ar", "en")):
+    """Print every duplicate group and where its phrases occur"""
+    for field in fields:
+        groups = duplicate_groups(phrases, field)
+        repeats = sum(len(group.phrases) - 1 for group in groups)
+        print(f"\n=== {field}: {len(groups)} phrases repeated, "
+              f"{repeats} of {len(phrases)} occurrences repeat an earlier one ===")
+        for group in groups:
+            spellings = group.spellings()
+            print(f"\n{group.canonical()}  (×{len(group.phrases)})")
+            if len(spellings) > 1:
+                print(f"  spellings: {' / '.join(spellings)}")
+            for phrase in group.phrases:
+                print(f"  - {location(phrase)}")
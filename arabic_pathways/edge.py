@@ -0,0 +1,34 @@
+"""The Microsoft Edge online TTS service (imports edge-tts and aiohttp)"""
+import aiohttp
+import edge_tts
+from edge_tts.exceptions import NoAudioReceived, UnexpectedResponse, WebSocketError
+
+from arabic_pathways.tts import TTSBackend
+
+
+class EdgeTTSBackend(TTSBackend):
+    """The Microsoft Edge online TTS service.
+
+    edge-tts opens a new websocket (and TLS session) for every request,
+    since the protocol it implements handles one synthesis per socket, so
+    there are no connections to pool: concurrency is bounded by --jobs.
+    """
+
+    name = "edge"
+    retryable_errors = (OSError, aiohttp.ClientError, NoAudioReceived, UnexpectedResponse,
+                        WebSocketError)
+
+    async def stream(self, text, voice, rate="+0%", pitch="+0Hz"):
+        self.requests += 1
+        try:
+            async for chunk in self.synthesize(text, voice, rate, pitch):
+                yield chunk
+        except Exception:
+            self.failures += 1
+            raise
+
+    async def synthesize(self, text, voice, rate, pitch):
+        communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch,
+                                          boundary="WordBoundary")
+        async for chunk in communicate.stream():
+            yield chunk
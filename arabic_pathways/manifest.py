@@ -0,0 +1,82 @@
+"""Build manifest that lets repeat runs skip artifacts whose inputs are unchanged"""
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = "build_manifest.json"
+
+# Bump when the way text or audio files are produced changes, so that every
+# artifact built by the old code is considered stale.
+TEXT_FORMAT_VERSION = 1
+AUDIO_FORMAT_VERSION = 2
+
+
+def content_hash(*parts):
+    """Stable sha256 of JSON-serializable parts"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def text_digest(phrases_dict, format_type):
+    """Inputs hash of a text file: its phrases and which field is written"""
+    return content_hash("text", TEXT_FORMAT_VERSION, format_type, phrases_dict)
+
+
+def audio_digest(texts, voice, rate="+0%", pitch="+0Hz", backend="edge", gap_ms=0):
+    """Inputs hash of an audio file: the spoken texts, synthesis settings and gap"""
+    return content_hash("audio", AUDIO_FORMAT_VERSION, backend, texts, voice, rate, pitch,
+                        gap_ms)
+
+
+class BuildManifest:
+    """Maps each output path to the inputs hash it was last built from"""
+
+    def __init__(self, path=MANIFEST_PATH, force=False):
+        self.path = path
+        self.force = force
+        self.skipped = 0
+        self.built = 0
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("artifacts", {})
+
+    def is_fresh(self, output_path, digest):
+        """True if output_path was built from exactly these inputs and is still intact"""
+        return self.all_fresh([output_path], digest)
+
+    def all_fresh(self, output_paths, digest):
+        """is_fresh for files that are built together, counted as one artifact"""
+        if self.force:
+            return False
+        if not all(self.unchanged(path, digest) for path in output_paths):
+            return False
+        self.skipped += 1
+        return True
+
+    def unchanged(self, output_path, digest):
+        entry = self.entries.get(output_path)
+        if entry is None or entry["inputs"] != digest:
+            return False
+        try:
+            size = os.path.getsize(output_path)
+        except OSError:
+            return False
+        # A size mismatch means the file was truncated or replaced since
+        return "bytes" not in entry or entry["bytes"] == size
+
+    def record(self, output_path, digest, count=True, **details):
+        """Remember that output_path was just built from digest"""
+        self.entries[output_path] = dict(details, inputs=digest)
+        if count:
+            self.built += 1
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"artifacts": self.entries}, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+
+    def print_stats(self):
+        print(f"\nBuild manifest ({self.path}): {self.built} built, {self.skipped} up to date")
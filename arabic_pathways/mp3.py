@@ -0,0 +1,357 @@
+"""MPEG audio frame parsing and joining without decoding"""
+import functools
+
+# audio-24khz-48kbitrate-mono-mp3: MPEG-2 Layer III, 24 kHz, 48 kbps CBR, mono
+SAMPLE_RATE = 24000
+BITRATE = 48000
+SAMPLES_PER_FRAME = 576
+FRAME_SIZE = 72 * BITRATE // SAMPLE_RATE  # 144 bytes, no padding at 24 kHz
+FRAME_MS = 1000 * SAMPLES_PER_FRAME // SAMPLE_RATE  # 24 ms
+
+# Sync word, MPEG-2, Layer III, no CRC | bitrate index 6 (48 kbps), 24 kHz |
+# mono, original
+FRAME_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+
+MPEG1, MPEG2, MPEG25 = 1, 2, 25
+
+# Version bits of the header -> version
+VERSIONS = {0b00: MPEG25, 0b10: MPEG2, 0b11: MPEG1}
+
+# Layer bits -> layer
+LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+
+# Bitrates in kbps by (version is MPEG-1, layer), indexed by the 4 bitrate bits
+BITRATES = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+SAMPLE_RATES = {
+    MPEG1: [44100, 48000, 32000],
+    MPEG2: [22050, 24000, 16000],
+    MPEG25: [11025, 12000, 8000],
+}
+
+ID3V2_HEADER_SIZE = 10
+ID3V1_SIZE = 128
+
+
+class FrameHeader:
+    """The fields of a 4-byte MPEG audio frame header that matter for splicing"""
+
+    __slots__ = ("version", "layer", "bitrate", "sample_rate", "padding", "channels",
+                 "protected")
+
+    def __init__(self, version, layer, bitrate, sample_rate, padding, channels, protected):
+        self.version = version
+        self.layer = layer
+        self.bitrate = bitrate
+        self.sample_rate = sample_rate
+        self.padding = padding
+        self.channels = channels
+        self.protected = protected
+
+    @property
+    def samples(self):
+        if self.layer == 1:
+            return 384
+        if self.layer == 3 and self.version != MPEG1:
+            return 576
+        return 1152
+
+    @property
+    def length(self):
+        """Frame length in bytes, header included"""
+        if self.layer == 1:
+            return (12 * self.bitrate // self.sample_rate + self.padding) * 4
+        return self.samples // 8 * self.bitrate // self.sample_rate + self.padding
+
+    @property
+    def duration_ms(self):
+        return self.samples * 1000 / self.sample_rate
+
+    @property
+    def side_info_size(self):
+        """Bytes of Layer III side information after the header (and CRC)"""
+        if self.version == MPEG1:
+            return 17 if self.channels == 1 else 32
+        return 9 if self.channels == 1 else 17
+
+
+def parse_header(buf, offset):
+    """FrameHeader at buf[offset:offset + 4], or None if there is no valid frame there"""
+    if offset + 4 > len(buf):
+        return None
+    b0, b1, b2, b3 = buf[offset], buf[offset + 1], buf[offset + 2], buf[offset + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = VERSIONS.get((b1 >> 3) & 0b11)
+    layer = LAYERS.get((b1 >> 1) & 0b11)
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0b11
+    # Free-format (0) and bad (15) bitrates cannot be spliced by length
+    if version is None or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    bitrate = BITRATES[(version == MPEG1, layer)][bitrate_index] * 1000
+    return FrameHeader(
+        version=version,
+        layer=layer,
+        bitrate=bitrate,
+        sample_rate=SAMPLE_RATES[version][sample_rate_index],
+        padding=(b2 >> 1) & 1,
+        channels=1 if (b3 >> 6) == 0b11 else 2,
+        protected=not b1 & 1,
+    )
+
+
+def id3v2_size(buf):
+    """Length of an ID3v2 tag at the start of buf (0 if there is none)"""
+    if len(buf) < ID3V2_HEADER_SIZE or bytes(buf[:3]) != b"ID3":
+        return 0
+    size = 0
+    for byte in buf[6:10]:  # syncsafe integer, 7 bits per byte
+        size = (size << 7) | (byte & 0x7F)
+    footer = ID3V2_HEADER_SIZE if buf[5] & 0x10 else 0
+    return ID3V2_HEADER_SIZE + size + footer
+
+
+def main_data_begin(buf, offset, header):
+    """Bytes back into earlier frames (the bit reservoir) where a Layer III frame's audio starts"""
+    if header.layer != 3:
+        return 0
+    start = offset + 4 + (2 if header.protected else 0)
+    if header.version == MPEG1:
+        return (buf[start] << 1) | (buf[start + 1] >> 7)
+    return buf[start]
+
+
+def main_data_size(header):
+    """Bytes of a Layer III frame available to the bit reservoir"""
+    return header.length - 4 - (2 if header.protected else 0) - header.side_info_size
+
+
+def is_info_frame(buf, offset, header):
+    """True for a Xing/Info/VBRI frame, which carries stream metadata and no audio"""
+    start = offset + 4 + (2 if header.protected else 0)
+    if header.layer == 3:
+        tag = bytes(buf[start + header.side_info_size:start + header.side_info_size + 4])
+        if tag in (b"Xing", b"Info"):
+            return True
+    return bytes(buf[offset + 36:offset + 40]) == b"VBRI"
+
+
+class MP3Info:
+    """Where the audio frames of a buffer are and how long they play"""
+
+    def __init__(self):
+        self.id3v2_end = 0
+        self.runs = []  # (start, end) of contiguous audio frames
+        self.frames = 0
+        self.samples = 0
+        self.sample_rate = None
+        self.channels = None
+        self.first_header = None  # raw 4 header bytes of the first audio frame
+
+    @property
+    def duration_ms(self):
+        if not self.sample_rate:
+            return 0
+        return self.samples * 1000 // self.sample_rate
+
+    def add_frame(self, buf, offset, header):
+        if self.first_header is None:
+            self.first_header = bytes(buf[offset:offset + 4])
+        if self.runs and self.runs[-1][1] == offset:
+            self.runs[-1] = (self.runs[-1][0], offset + header.length)
+        else:
+            self.runs.append((offset, offset + header.length))
+        self.frames += 1
+        self.samples += header.samples
+        self.sample_rate = self.sample_rate or header.sample_rate
+        self.channels = self.channels or header.channels
+
+
+def audio_bounds(buf):
+    """(start, end) of buf without its ID3v2 and ID3v1 tags"""
+    end = len(buf)
+    if end >= ID3V1_SIZE and buf[end - ID3V1_SIZE:end - ID3V1_SIZE + 3] == b"TAG":
+        end -= ID3V1_SIZE
+    return min(id3v2_size(buf), end), end
+
+
+def iter_frames(buf):
+    """Yield (offset, FrameHeader) of each audio frame in buf (bytes).
+
+    Tags, a leading Xing/Info frame and junk between frames are skipped.
+    """
+    offset, end = audio_bounds(buf)
+    first = True
+    while offset < end:
+        header = parse_header(buf, offset)
+        if header is None or offset + header.length > end:
+            # Resynchronize on the next frame sync byte
+            offset = buf.find(b"\xff", offset + 1, end)
+            if offset < 0:
+                break
+            continue
+        if not (first and is_info_frame(buf, offset, header)):
+            yield offset, header
+        first = False
+        offset += header.length
+
+
+def scan(buf):
+    """Locate the audio frames in buf (bytes)"""
+    info = MP3Info()
+    info.id3v2_end = audio_bounds(buf)[0]
+    for offset, header in iter_frames(buf):
+        info.add_frame(buf, offset, header)
+    return info
+
+
+def split(buf, cuts_ms):
+    """Split the audio frames of buf at the frame boundaries nearest after each cut.
+
+    cuts_ms must be in increasing order. Returns len(cuts_ms) + 1 pieces as
+    (memoryview, start_ms) where start_ms is the time at which the piece's
+    first frame starts in the original stream. Pieces past the end of the
+    audio are empty.
+
+    Layer III frames may start their audio in the bit reservoir of the
+    frames before them. A frame whose main_data_begin reaches back past the
+    start of its piece would decode garbage once the piece is played after
+    something else, so it is made silent; that costs a frame or two of the
+    pause before each phrase.
+    """
+    view = memoryview(buf)
+    starts = []  # (byte offset, ms) where each piece begins
+    cuts = list(cuts_ms)
+    samples = 0
+    end = None
+    for offset, header in iter_frames(buf):
+        position_ms = samples * 1000 / header.sample_rate
+        if not starts:
+            starts.append((offset, 0))
+        while cuts and position_ms >= cuts[0]:
+            starts.append((offset, round(position_ms)))
+            cuts.pop(0)
+        samples += header.samples
+        end = offset + header.length
+        end_ms = round(samples * 1000 / header.sample_rate)
+    if end is None:
+        return [(view[0:0], 0)] * (len(cuts) + 1)
+    starts.extend((end, end_ms) for _ in cuts)
+
+    pieces = []
+    for i, (offset, start_ms) in enumerate(starts):
+        piece_end = starts[i + 1][0] if i + 1 < len(starts) else end
+        pieces.append((cut_reservoir(view, offset, piece_end), start_ms))
+    return pieces
+
+
+def cut_reservoir(view, start, end):
+    """view[start:end] (whole frames) with frames that need bytes from before start made silent.
+
+    Only the side information of such a frame is zeroed, as in
+    silent_frame: it then decodes no audio of its own, while its main data
+    bytes stay in the reservoir for the frames after it.
+    """
+    silenced = []
+    available = 0
+    offset = start
+    while offset < end:
+        header = parse_header(view, offset)
+        if main_data_begin(view, offset, header) > available:
+            silenced.append((offset - start + 4 + (2 if header.protected else 0),
+                             header.side_info_size))
+        available += main_data_size(header)
+        offset += header.length
+    if not silenced:
+        return view[start:end]
+
+    piece = bytearray(view[start:end])
+    for side_info, size in silenced:
+        piece[side_info:side_info + size] = bytes(size)
+    return memoryview(bytes(piece))
+
+
+def concat(writer, paths, gap_ms=0, keep_first_id3=True):
+    """Write the audio frames of every file in paths to writer, in order.
+
+    Frames are copied as memoryview slices of each file's contents; nothing
+    is decoded or re-encoded. ID3 tags and Xing/Info frames are dropped
+    (their frame counts would be wrong for the joined stream), except that
+    the ID3v2 tag of the first file is kept if keep_first_id3 is set.
+    Between consecutive files, gap_ms of silence is inserted as frames in
+    the format of the first file. Raises ValueError if the files do not
+    share a sample rate and channel count, since the result would not play
+    back correctly.
+
+    Returns (frames, duration_ms, gap_ms) of the joined audio, where gap_ms
+    is the length of each inserted gap after rounding to whole frames.
+    """
+    frames = samples = 0
+    sample_rate = channels = gap = None
+    for i, path in enumerate(paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        info = scan(data)
+        view = memoryview(data)
+        if info.frames == 0:
+            continue
+        if sample_rate is None:
+            sample_rate, channels = info.sample_rate, info.channels
+            gap = silence(gap_ms, info.first_header)
+            gap_info = scan(gap)
+        elif (info.sample_rate, info.channels) != (sample_rate, channels):
+            raise ValueError(f"{path}: {info.sample_rate} Hz/{info.channels} ch does not match "
+                             f"{sample_rate} Hz/{channels} ch of the first segment")
+        if i == 0 and keep_first_id3 and info.id3v2_end:
+            writer.write(view[:info.id3v2_end])
+        if frames and gap:
+            writer.write(gap)
+            frames += gap_info.frames
+            samples += gap_info.samples
+        for start, end in info.runs:
+            writer.write(view[start:end])
+        frames += info.frames
+        samples += info.samples
+    if sample_rate is None:
+        return 0, 0, 0
+    return frames, samples * 1000 // sample_rate, gap_info.duration_ms
+
+
+def silent_frame(header=FRAME_HEADER):
+    """One frame of digital silence in the format given by a 4-byte frame header.
+
+    The frame is written without CRC or padding. With zeroed side
+    information every granule has no Huffman data and a global gain of
+    zero, which decoders render as silence.
+    """
+    header = bytes([header[0], header[1] | 0x01, header[2] & ~0x02 & 0xFF, header[3]])
+    return header + bytes(parse_header(header, 0).length - len(header))
+
+
+@functools.lru_cache(maxsize=None)
+def silence(duration_ms, header=FRAME_HEADER):
+    """Silent frames lasting as close to duration_ms as whole frames allow.
+
+    Cached per duration and format, so a build inserting the same gap
+    thousands of times builds its bytes once.
+    """
+    frame = silent_frame(header)
+    return frame * frames_for_ms(duration_ms, parse_header(header, 0).duration_ms)
+
+
+def frames_for_ms(duration_ms, frame_ms=FRAME_MS):
+    """Number of whole frames closest to duration_ms"""
+    return max(0, round(duration_ms / frame_ms))
+
+
+def duration_ms(num_bytes):
+    """Playing time of num_bytes of constant bitrate audio"""
+    return num_bytes * 8000 // BITRATE
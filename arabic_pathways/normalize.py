@@ -0,0 +1,103 @@
+"""Normalized forms of Arabic, transliteration and English text for matching.
+
+Arabic spelling varies in ways a learner (or a second copy of a phrase)
+should not be penalized for: hamza on alef, taa marbuta written as haa,
+alef maqsura as yaa, tatweel, and optional tashkeel. Every mapping is a
+precompiled str.translate table, so normalizing is a single C-level pass
+over the text; normalize_all runs that pass once over a whole list.
+"""
+import re
+import unicodedata
+
+# Joins texts for normalize_all; no table maps or removes it
+SEPARATOR = "\n"
+
+ARABIC_TABLE = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",  # hamza / madda / wasla on alef
+    "ة": "ه",  # taa marbuta
+    "ى": "ي",  # alef maqsura
+    "ـ": None,  # tatweel
+    # Tashkeel (fathatan .. sukun) and the other combining marks of the block
+    **{chr(code): None for code in range(0x064B, 0x0660)},
+    "ٰ": None,
+    # Quranic annotation marks
+    **{chr(code): None for code in range(0x0610, 0x061B)},
+    **{chr(code): None for code in range(0x06D6, 0x06EE)},
+})
+
+# Apostrophes and ayn/hamza marks in transliterations are dropped; hyphens
+# and other joiners separate words.
+LATIN_TABLE = str.maketrans({
+    "'": None, "’": None, "‘": None, "`": None, "ʿ": None, "ʾ": None, "´": None,
+    "-": " ", "‐": " ", "–": " ", "_": " ",
+})
+
+PUNCTUATION = re.compile(r"[^\w\s]")
+SPACES = re.compile(r"[ \t]+")
+
+
+def strip_accents(text):
+    """Text without combining accents on Latin letters (e.g. "ā" -> "a").
+
+    Arabic marks are kept and recomposed, so that ؤ and ئ (which NFD splits
+    into و and ي plus a hamza) survive as in normalize_arabic.
+    """
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFD", text)
+    kept = "".join(ch for ch in decomposed
+                   if not unicodedata.combining(ch) or "\u0600" <= ch <= "\u06ff")
+    return unicodedata.normalize("NFC", kept)
+
+
+def arabic_pass(text):
+    return PUNCTUATION.sub(" ", text.translate(ARABIC_TABLE))
+
+
+def latin_pass(text):
+    return PUNCTUATION.sub(" ", strip_accents(text.translate(LATIN_TABLE)).casefold())
+
+
+def collapse(text):
+    return SPACES.sub(" ", text).strip()
+
+
+def normalize_arabic(text):
+    """Arabic text with spelling variants unified, tashkeel and punctuation removed"""
+    return collapse(arabic_pass(text))
+
+
+def normalize_latin(text):
+    """Transliteration or English text, case folded, without accents or punctuation"""
+    return collapse(latin_pass(text))
+
+
+def normalize_text(text):
+    """Either script: for queries that may be in Arabic, transliteration or English"""
+    return collapse(latin_pass(text.translate(ARABIC_TABLE)))
+
+
+def normalize_all(texts, text_pass=arabic_pass):
+    """Normalize a list of single-line texts with one pass over their concatenation.
+
+    text_pass is arabic_pass or latin_pass.
+    """
+    if not texts:
+        return []
+    lines = text_pass(SEPARATOR.join(texts)).split(SEPARATOR)
+    if len(lines) != len(texts):
+        # A text contained the separator; fall back to one pass per text
+        lines = [text_pass(text) for text in texts]
+    return [collapse(line) for line in lines]
+
+
+def normalize_phrases(phrases):
+    """Fill the cached normalized forms of every Phrase in three vectorized passes"""
+    phrases = [phrase for phrase in phrases if phrase.cached_normalized is None]
+    if not phrases:
+        return
+    ar = normalize_all([phrase.ar for phrase in phrases], arabic_pass)
+    transliteration = normalize_all([phrase.transliteration for phrase in phrases], latin_pass)
+    en = normalize_all([phrase.en for phrase in phrases], latin_pass)
+    for phrase, forms in zip(phrases, zip(ar, transliteration, en)):
+        phrase.cached_normalized = forms
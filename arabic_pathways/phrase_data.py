@@ -0,0 +1,191 @@
+"""Phrase data files and a loader that reads them one day at a time.
+
+Every day lives in data/phrases/days/dayNN.json and every supplementary
+category in data/phrases/supplementary/<category>.json. Each file maps
+category names to lists of {"ar", "transliteration", "en"} phrases, in
+lesson order.
+
+The phrase scripts import this module for their data, so it imports
+nothing beyond os at the top: json and the normalization tables are loaded
+when a file is read or a phrase is first normalized.
+"""
+# pylint: disable=import-outside-toplevel
+import os
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "data", "phrases")
+
+
+FIELDS = ("ar", "transliteration", "en")
+
+RECORD_FIELDS = ("day", "section", "category", *FIELDS)
+
+# Order of the supplementary categories; files not listed here follow in
+# alphabetical order.
+SUPPLEMENTARY_ORDER = ["education", "hobbies", "emotions", "daily_life", "comparisons"]
+
+
+class Phrase:
+    """One phrase of the curriculum.
+
+    day is set for the day lessons and section (the supplementary category,
+    e.g. "education") for supplementary phrases; the other is None.
+    """
+
+    __slots__ = (*RECORD_FIELDS, "cached_normalized")
+
+    def __init__(self, day, section, category, ar, transliteration, en):
+        self.day = day
+        self.section = section
+        self.category = category
+        self.ar = ar
+        self.transliteration = transliteration
+        self.en = en
+        self.cached_normalized = None
+
+    @property
+    def normalized(self):
+        """(ar, transliteration, en) normalized for matching, computed once"""
+        if self.cached_normalized is None:
+            from arabic_pathways.normalize import normalize_arabic, normalize_latin
+            self.cached_normalized = (normalize_arabic(self.ar),
+                                      normalize_latin(self.transliteration),
+                                      normalize_latin(self.en))
+        return self.cached_normalized
+
+    def __repr__(self):
+        where = f"day {self.day}" if self.day is not None else self.section
+        return f"Phrase({where}, {self.category!r}, {self.en!r})"
+
+    def astuple(self):
+        return tuple(getattr(self, name) for name in RECORD_FIELDS)
+
+    def asdict(self):
+        """The phrase in the {"ar", "transliteration", "en"} form of the data files"""
+        return {field: getattr(self, field) for field in FIELDS}
+
+
+def day_path(day, data_dir=DATA_DIR):
+    return os.path.join(data_dir, "days", f"day{day:02d}.json")
+
+
+def section_path(section, data_dir=DATA_DIR):
+    return os.path.join(data_dir, "supplementary", f"{section}.json")
+
+
+def available_days(data_dir=DATA_DIR):
+    """Day numbers with a data file, in order, found without reading any of them"""
+    days = []
+    for name in os.listdir(os.path.join(data_dir, "days")):
+        # dayNN.json
+        number = name[len("day"):-len(".json")]
+        if name.startswith("day") and name.endswith(".json") and number.isdigit():
+            days.append(int(number))
+    return sorted(days)
+
+
+def available_sections(data_dir=DATA_DIR):
+    """Supplementary categories with a data file"""
+    names = [name[:-len(".json")] for name in os.listdir(os.path.join(data_dir, "supplementary"))
+             if name.endswith(".json")]
+    order = {section: i for i, section in enumerate(SUPPLEMENTARY_ORDER)}
+    return sorted(names, key=lambda name: (order.get(name, len(order)), name))
+
+
+def read_json(path):
+    import json
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_day(day, data_dir=DATA_DIR):
+    """{category: [phrase dict]} of one day; no other file is read"""
+    return read_json(day_path(day, data_dir))
+
+
+def load_section(section, data_dir=DATA_DIR):
+    """{category: [phrase dict]} of one supplementary category"""
+    return read_json(section_path(section, data_dir))
+
+
+class LazyPhrases:
+    """Read-only {key: phrases} mapping whose values are loaded on first access.
+
+    The phrase scripts expose their days (or categories) this way, so that
+    importing one reads no data file until a phrase dict is needed.
+    """
+
+    def __init__(self, load, keys):
+        self.load = load
+        self.order = list(keys)
+        self.loaded = {}
+
+    def __getitem__(self, key):
+        if key not in self.loaded:
+            if key not in self.order:
+                raise KeyError(key)
+            self.loaded[key] = self.load(key)
+        return self.loaded[key]
+
+    def __contains__(self, key):
+        return key in self.order
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return list(self.order)
+
+    def values(self):
+        return [self[key] for key in self.order]
+
+    def items(self):
+        return [(key, self[key]) for key in self.order]
+
+
+def lazy_attributes(phrases, names):
+    """A module __getattr__ serving the attributes of names ({name: key}) from phrases"""
+    def __getattr__(name):
+        if name in names:
+            return phrases[names[name]]
+        raise AttributeError(name)
+    return __getattr__
+
+
+def iter_day(day, data_dir=DATA_DIR):
+    """Yield the Phrase records of one day"""
+    for category, phrases in load_day(day, data_dir).items():
+        for p in phrases:
+            yield Phrase(day, None, category, p["ar"], p["transliteration"], p["en"])
+
+
+def iter_section(section, data_dir=DATA_DIR):
+    """Yield the Phrase records of one supplementary category"""
+    for category, phrases in load_section(section, data_dir).items():
+        for p in phrases:
+            yield Phrase(None, section, category, p["ar"], p["transliteration"], p["en"])
+
+
+def iter_phrases(days=None, sections=None, data_dir=DATA_DIR):
+    """Yield Phrase records lazily, one data file at a time.
+
+    days and sections default to everything available; pass [] to skip
+    either. A file is only opened when the iteration reaches it, so
+    stopping early (or asking for a few days) reads nothing else.
+    """
+    for day in available_days(data_dir) if days is None else days:
+        yield from iter_day(day, data_dir)
+    for section in available_sections(data_dir) if sections is None else sections:
+        yield from iter_section(section, data_dir)
+
+
+def data_files(data_dir=DATA_DIR):
+    """Every phrase data file, in curriculum order"""
+    return ([day_path(day, data_dir) for day in available_days(data_dir)]
+            + [section_path(section, data_dir) for section in available_sections(data_dir)])
@@ -0,0 +1,13 @@
+"""The phrase dictionaries of every day and supplementary category"""
+from arabic_pathways.phrase_data import (available_days, available_sections, load_day,
+                                         load_section)
+
+
+def load_day_phrases():
+    """Return {day: phrases} for every day data file"""
+    return {day: load_day(day) for day in available_days()}
+
+
+def load_supplementary_phrases():
+    """Return {category: phrases} for every supplementary data file"""
+    return {section: load_section(section) for section in available_sections()}
@@ -0,0 +1,87 @@
+"""Bounded pool of warm TTS connections shared by the jobs of one event loop"""
+import asyncio
+import contextlib
+import time
+
+
+class ConnectionPool:
+    """Hands out at most `size` connections at a time and keeps released ones warm.
+
+    open_connection is an async callable that performs the handshake and
+    returns a new connection; close_connection (async, optional) tears one
+    down. A released connection goes back to the idle list and is handed to
+    the next request instead of opening a new one, unless it has been idle
+    for longer than idle_timeout seconds. A connection whose request raised
+    is closed rather than reused, since it may be in a broken state.
+
+    The pool belongs to the event loop it is first used in.
+    """
+
+    def __init__(self, open_connection, close_connection=None, size=4, idle_timeout=30.0):
+        self.open_connection = open_connection
+        self.close_connection = close_connection
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.semaphore = None
+        self.idle = []  # (connection, released at)
+        self.open = 0
+        self.peak_open = 0
+        self.reused = 0
+        self.opened = 0
+
+    async def discard(self, connection):
+        self.open -= 1
+        if self.close_connection is not None:
+            await self.close_connection(connection)
+
+    async def acquire(self):
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.size)
+        await self.semaphore.acquire()
+        try:
+            now = time.monotonic()
+            while self.idle:
+                connection, released = self.idle.pop()
+                if now - released <= self.idle_timeout:
+                    self.reused += 1
+                    return connection
+                await self.discard(connection)
+            connection = await self.open_connection()
+            self.opened += 1
+            self.open += 1
+            self.peak_open = max(self.peak_open, self.open)
+            return connection
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    async def release(self, connection, reusable=True):
+        try:
+            if reusable:
+                self.idle.append((connection, time.monotonic()))
+            else:
+                await self.discard(connection)
+        finally:
+            self.semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def connection(self):
+        """async with pool.connection() as connection: ..."""
+        connection = await self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            await self.release(connection, reusable=False)
+            raise
+        await self.release(connection)
+
+    async def close(self):
+        """Close every idle connection"""
+        while self.idle:
+            connection, _ = self.idle.pop()
+            await self.discard(connection)
+
+    def print_stats(self, name):
+        print(f"Connection pool ({name}, size {self.size}): {self.opened} connections opened, "
+              f"{self.reused} reused, {self.open} open ({len(self.idle)} idle), "
+              f"peak {self.peak_open} open")
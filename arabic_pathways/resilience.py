@@ -0,0 +1,105 @@
+"""Retries with backoff, request timeouts and rate limiting for TTS calls"""
+import asyncio
+import random
+import time
+
+from arabic_pathways.tts import TTSBackend
+
+
+class TokenBucket:
+    """Allow `rate` operations per second on average, with bursts up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self.lock = asyncio.Lock()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens=1):
+        """Wait until `tokens` are available and take them"""
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self.lock:
+            self.refill()
+            while self.tokens < tokens:
+                delay = (tokens - self.tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self.refill()
+            self.tokens -= tokens
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    Attempt n (from 0) waits a random time between 0 and
+    min(max_delay, base_delay * 2**n) before being retried.
+    """
+
+    def __init__(self, attempts=5, base_delay=0.5, max_delay=10.0, seed=None):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.random = random.Random(seed)
+
+    def delay(self, attempt):
+        return self.random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class ResilientBackend(TTSBackend):
+    """Wraps a backend with a rate limit, a per-request timeout and retries.
+
+    Each attempt is read to the end before anything is passed on, so a
+    connection that drops half way through a phrase is retried from the
+    start instead of leaving a truncated segment behind. Segments are a
+    single phrase (or a small batch), so the buffer stays small.
+    """
+
+    def __init__(self, backend, retry=None, timeout=60.0, rate_limit=None):
+        super().__init__()
+        self.backend = backend
+        self.name = backend.name
+        self.retryable_errors = backend.retryable_errors
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.retries = 0
+        self.timeouts = 0
+
+    async def fetch(self, text, voice, rate, pitch):
+        return [chunk async for chunk in self.backend.stream(text, voice, rate, pitch)]
+
+    async def stream(self, text, voice, rate="+0%", pitch="+0Hz"):
+        self.requests += 1
+        for attempt in range(self.retry.attempts):
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            try:
+                chunks = await asyncio.wait_for(self.fetch(text, voice, rate, pitch),
+                                                self.timeout)
+                break
+            except (asyncio.TimeoutError, *self.retryable_errors) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self.timeouts += 1
+                if attempt == self.retry.attempts - 1:
+                    self.failures += 1
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self.retry.delay(attempt))
+        for chunk in chunks:
+            yield chunk
+
+    async def close(self):
+        await self.backend.close()
+
+    def print_stats(self):
+        self.backend.print_stats()
+        waited = self.limiter.waited if self.limiter is not None else 0.0
+        print(f"Resilience: {self.retries} retries ({self.timeouts} timeouts), "
+              f"{self.failures} requests gave up, {waited:.1f}s waiting on the rate limit")
@@ -0,0 +1,88 @@
+"""On-disk cache of JSON API responses with per-endpoint TTLs and ETags"""
+import hashlib
+import json
+import os
+import time
+
+from arabic_pathways.audio_writer import StreamingWriter
+
+DEFAULT_CACHE_DIR = ".youtube_cache/responses"
+
+# Parameters holding a comma separated set, whose order does not matter
+SET_PARAMS = ("id", "part")
+
+
+def normalize_params(params):
+    """params as sorted [name, value] pairs of strings, with SET_PARAMS sorted too"""
+    normalized = []
+    for name, value in sorted(params.items()):
+        value = str(value)
+        if name in SET_PARAMS:
+            value = ",".join(sorted(set(value.split(","))))
+        normalized.append([name, value])
+    return normalized
+
+
+def request_key(endpoint, params):
+    """Hash of an endpoint and its normalized parameters"""
+    payload = json.dumps([endpoint, normalize_params(params)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedResponse:
+    """A stored response, its ETag and when it was last fetched or revalidated"""
+
+    def __init__(self, response, etag, fetched):
+        self.response = response
+        self.etag = etag
+        self.fetched = fetched
+
+    def age(self):
+        return time.time() - self.fetched
+
+
+class ResponseCache:
+    """Responses stored as <root>/<endpoint>/<key>.json.
+
+    ttls maps an endpoint to the seconds its responses are used without
+    asking the server; endpoints missing from it are always revalidated.
+    A stale response is revalidated with its ETag, and a 304 answer makes
+    it fresh again.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, ttls=None):
+        self.root = root
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def path(self, endpoint, key):
+        return os.path.join(self.root, endpoint, f"{key}.json")
+
+    def load(self, endpoint, params):
+        """The CachedResponse for a request, fresh or stale, or None"""
+        try:
+            with open(self.path(endpoint, request_key(endpoint, params)), "r",
+                      encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return CachedResponse(entry["response"], entry["etag"], entry["fetched"])
+
+    def fresh(self, endpoint, entry):
+        return entry is not None and entry.age() < self.ttls.get(endpoint, 0)
+
+    def put(self, endpoint, params, response, etag=None, fetched=None):
+        """Store a response; it is fresh for the endpoint's TTL from fetched (default now)"""
+        entry = CachedResponse(response, etag, time.time() if fetched is None else fetched)
+        data = json.dumps({"endpoint": endpoint, "params": normalize_params(params),
+                           "etag": entry.etag, "fetched": entry.fetched,
+                           "response": entry.response}, ensure_ascii=False)
+        with StreamingWriter(self.path(endpoint, request_key(endpoint, params))) as writer:
+            writer.write(data.encode("utf-8"))
+        return entry
+
+    def print_stats(self):
+        print(f"Response cache ({self.root}): {self.hits} fresh hits, "
+              f"{self.revalidated} revalidated (304), {self.misses} fetched")
@@ -0,0 +1,81 @@
+"""Bounded-concurrency scheduler for audio generation jobs"""
+import asyncio
+import time
+
+
+class JobResult:
+    """Outcome of one scheduled job"""
+
+    def __init__(self, label, elapsed, error=None):
+        self.label = label
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+async def run_jobs(jobs, concurrency=1):
+    """Run (label, coroutine factory) jobs with at most `concurrency` in flight.
+
+    Every job is started as its own task; the semaphore caps how many are
+    talking to the TTS service at once. A failing job is recorded in its
+    JobResult instead of stopping the others.
+
+    Returns (results, wall_seconds), with results in submission order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(label, factory):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await factory()
+            except Exception as e:  # pylint: disable=broad-except
+                return JobResult(label, time.perf_counter() - start, e)
+            return JobResult(label, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_one(label, factory) for label, factory in jobs))
+    return list(results), time.perf_counter() - start
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def print_report(results, wall, concurrency):
+    """Print per-job latency and the wall clock time of the run.
+
+    A serial run is not measured here (benchmarks/job_concurrency.py
+    compares against --jobs 1). Concurrent jobs slow each other down, so the
+    sum of their latencies overstates a serial run and gives only an upper
+    bound on the speedup.
+    """
+    if not results:
+        return
+
+    print(f"\n=== Audio jobs ({len(results)} jobs, --jobs {concurrency}) ===")
+    for result in results:
+        status = "✓" if result.ok else f"✗ {result.error}"
+        print(f"  {result.label:<40} {result.elapsed:7.2f}s {status}")
+
+    latencies = [result.elapsed for result in results]
+    print(f"Latency p50 {percentile(latencies, 0.5):.2f}s, "
+          f"p95 {percentile(latencies, 0.95):.2f}s, max {max(latencies):.2f}s")
+    if concurrency > 1 and wall > 0:
+        total = sum(latencies)
+        print(f"Wall clock {wall:.2f}s; job latencies sum to {total:.2f}s "
+              f"(speedup over --jobs 1 at most {total / wall:.2f}x)")
+    else:
+        print(f"Wall clock {wall:.2f}s")
+
+    failed = [result for result in results if not result.ok]
+    if failed:
+        print(f"{len(failed)} audio job(s) failed")
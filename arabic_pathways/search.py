@@ -0,0 +1,327 @@
+"""Ranked phrase search with an inverted index, persisted next to the corpus cache.
+
+Every word of the normalized Arabic, transliteration and English of a
+phrase (see normalize.py) is a token. The index maps each token to the
+phrases containing it, so a query only touches the phrases that share a
+word with it instead of scanning the whole corpus.
+
+Fuzzy transliteration lookup uses a second index from the character
+trigrams of every distinct transliteration to the spellings containing
+them, ranked by trigram similarity.
+"""
+import bisect
+import heapq
+import math
+import os
+import pickle
+from array import array
+
+from arabic_pathways.audio_writer import StreamingWriter
+from arabic_pathways.manifest import content_hash
+from arabic_pathways.normalize import normalize_latin, normalize_text
+
+DEFAULT_INDEX_PATH = ".corpus_cache/search_index.pickle"
+
+# Bump when the tokens, postings layout or pickle payload change
+INDEX_FORMAT_VERSION = 2
+
+# Score of a token found in the Arabic, transliteration or English field
+FIELD_WEIGHTS = (1.5, 1.2, 1.0)
+FIELD_NAMES = ("ar", "transliteration", "en")
+
+# Lowest trigram similarity (Dice coefficient) returned by fuzzy search
+DEFAULT_MIN_SIMILARITY = 0.4
+
+# Slack for the trigram count bounds, so that rounding (0.4 * 12 / 1.6 is
+# 3.0000000000000004) does not exclude a spelling exactly at min_similarity
+BOUND_EPSILON = 1e-9
+
+# Trigrams of at least this many spellings are stored as bitsets (Python
+# ints with bit n set for spelling n) instead of arrays of spelling numbers
+BITSET_MIN_SPELLINGS = 64
+
+
+def index_digest(corpus):
+    return content_hash("search", INDEX_FORMAT_VERSION, [phrase.astuple() for phrase in corpus])
+
+
+def trigrams(text):
+    """Distinct character trigrams of the words of text, each word padded like "  word " """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def bitset(numbers):
+    """int with the bits of numbers set"""
+    if not numbers:
+        return 0
+    bits = bytearray(max(numbers) // 8 + 1)
+    for number in numbers:
+        bits[number >> 3] |= 1 << (number & 7)
+    return int.from_bytes(bits, "little")
+
+
+def in_scope(phrase, days=None, sections=None):
+    """Whether phrase belongs to days or sections, with the same rules as PhraseStore.scope"""
+    if days is None and sections is None:
+        return True
+    if phrase.day is not None:
+        return bool(days) and phrase.day in days
+    return bool(sections) and phrase.section in sections
+
+
+class Match:
+    """One search result: the phrase, its score and how many query words it contains"""
+
+    __slots__ = ("phrase", "score", "matched", "fields")
+
+    def __init__(self, phrase, score, matched, fields):
+        self.phrase = phrase
+        self.score = score
+        self.matched = matched
+        self.fields = fields
+
+    def __repr__(self):
+        return f"Match({self.phrase!r}, score={self.score:.2f}, matched={self.matched})"
+
+
+class SearchIndex:
+    """Inverted index over the normalized words of every phrase of a corpus.
+
+    postings maps a token to an array of phrase_number * 3 + field, one
+    entry per field the token occurs in; lengths holds the token count of
+    every phrase, used to prefer the shorter of two equal matches.
+
+    spellings is the fuzzy index over the distinct normalized
+    transliterations, numbered by trigram count: spelling_phrases holds the
+    phrases of each spelling, spelling_sizes its trigram count,
+    size_starts[n] the number of the first spelling with at least n
+    trigrams, and grams maps a trigram to the spellings containing it: a
+    sorted array of their numbers, or a bitset for common trigrams.
+    """
+
+    def __init__(self, corpus, postings, lengths, spellings, digest=None, from_cache=False):
+        self.phrases = corpus.phrases
+        self.postings = postings
+        self.lengths = lengths
+        self.spellings = spellings
+        self.digest = digest
+        self.from_cache = from_cache
+        self.vocabulary = sorted(postings)
+        self.spelling_phrases, self.spelling_sizes, self.size_starts, self.grams = spellings
+
+    @classmethod
+    def build(cls, corpus, digest=None):
+        lists, spelling_lists = {}, {}
+        lengths = array("I")
+        for number, phrase in enumerate(corpus):
+            spelling_lists.setdefault(phrase.normalized[1], []).append(number)
+            count = 0
+            for field, text in enumerate(phrase.normalized):
+                words = text.split()
+                count += len(words)
+                for token in set(words):
+                    lists.setdefault(token, []).append(number * 3 + field)
+            lengths.append(count)
+        postings = {token: array("I", entries) for token, entries in lists.items()}
+        return cls(corpus, postings, lengths, cls.build_spellings(spelling_lists), digest)
+
+    @staticmethod
+    def build_spellings(spelling_lists):
+        """The fuzzy index of {spelling: [phrase number]}"""
+        spelling_grams = {spelling: trigrams(spelling) for spelling in spelling_lists}
+        ordered = sorted(spelling_lists, key=lambda spelling: len(spelling_grams[spelling]))
+        spelling_phrases, spelling_sizes, size_starts, grams = [], array("I"), array("I"), {}
+        for number, spelling in enumerate(ordered):
+            size = len(spelling_grams[spelling])
+            while len(size_starts) <= size:
+                size_starts.append(number)
+            spelling_phrases.append(array("I", spelling_lists[spelling]))
+            spelling_sizes.append(size)
+            for gram in spelling_grams[spelling]:
+                grams.setdefault(gram, []).append(number)
+        size_starts.append(len(ordered))
+        return (spelling_phrases, spelling_sizes, size_starts,
+                {gram: bitset(entries) if len(entries) >= BITSET_MIN_SPELLINGS
+                 else array("I", entries) for gram, entries in grams.items()})
+
+    @classmethod
+    def load(cls, corpus, path=DEFAULT_INDEX_PATH):
+        """The index of corpus from path, rebuilt and saved there if missing or stale.
+
+        Pass path=None to always build it in memory.
+        """
+        digest = index_digest(corpus)
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    cached = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                cached = None
+            if (isinstance(cached, dict) and cached.get("version") == INDEX_FORMAT_VERSION
+                    and cached.get("digest") == digest):
+                return cls(corpus, cached["postings"], cached["lengths"], cached["spellings"],
+                           digest, from_cache=True)
+        index = cls.build(corpus, digest)
+        if path is not None:
+            index.save(path)
+        return index
+
+    def save(self, path=DEFAULT_INDEX_PATH):
+        payload = {
+            "version": INDEX_FORMAT_VERSION,
+            "digest": self.digest,
+            "postings": self.postings,
+            "lengths": self.lengths,
+            "spellings": self.spellings,
+        }
+        with StreamingWriter(path) as writer:
+            writer.write(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def idf(self, token):
+        """Inverse document frequency: rare words count for more than common ones"""
+        return math.log(1 + len(self.phrases) / len(self.postings[token]))
+
+    def expand(self, token, prefix=False):
+        """Indexed tokens matching token (every token starting with it, with prefix)"""
+        if not prefix:
+            return [token] if token in self.postings else []
+        start = bisect.bisect_left(self.vocabulary, token)
+        end = bisect.bisect_left(self.vocabulary, token + "\U0010ffff", start)
+        return self.vocabulary[start:end]
+
+    def search(self, text, limit=10, days=None, sections=None, prefix=False):
+        """The best limit matches of text, best first.
+
+        Phrases containing more of the query words rank first, then by the
+        sum over query words of idf times the weight of the best field the
+        word occurs in, then shorter phrases, then curriculum order. With
+        prefix, query words also match the words they start.
+        """
+        query = list(dict.fromkeys(normalize_text(text).split()))
+        scores, matched, fields = {}, {}, {}
+        for word in query:
+            best = {}
+            for token in self.expand(word, prefix):
+                idf = self.idf(token)
+                for entry in self.postings[token]:
+                    number, field = divmod(entry, 3)
+                    weight = FIELD_WEIGHTS[field] * idf
+                    if weight > best.get(number, (0.0,))[0]:
+                        best[number] = (weight, field)
+            for number, (weight, field) in best.items():
+                scores[number] = scores.get(number, 0.0) + weight
+                matched[number] = matched.get(number, 0) + 1
+                fields[number] = fields.get(number, 0) | 1 << field
+
+        candidates = ((-matched[number], -score, self.lengths[number], number)
+                      for number, score in scores.items()
+                      if in_scope(self.phrases[number], days, sections))
+        ranked = heapq.nsmallest(limit, candidates) if limit else sorted(candidates)
+        return [Match(self.phrases[number], -score, -count,
+                      [name for bit, name in enumerate(FIELD_NAMES) if fields[number] >> bit & 1])
+                for count, score, _, number in ranked]
+
+    def fuzzy(self, text, limit=10, days=None, sections=None,
+              min_similarity=DEFAULT_MIN_SIMILARITY):
+        """Phrases whose transliteration is spelled like text, most similar first.
+
+        Similarity is the Dice coefficient of the trigram sets, 2 * shared /
+        (query trigrams + spelling trigrams), and at least min_similarity.
+        """
+        query = trigrams(normalize_latin(text))
+        size = len(query)
+        # A spelling reaching min_similarity shares at least need trigrams
+        # with the query and has between need and last trigrams
+        need = max(1, math.ceil(min_similarity * size / (2 - min_similarity) - BOUND_EPSILON))
+        last = math.floor(size * (2 - min_similarity) / min_similarity + BOUND_EPSILON)
+        first = self.spellings_from(need)
+        end = self.spellings_from(last + 1)
+        if end <= first:
+            return []
+
+        matches = []
+        ranked = self.ranked_spellings(self.count_trigrams(query, first, end), size, need, first)
+        for similarity, spelling, count in ranked:
+            if similarity < min_similarity:
+                break
+            for number in self.spelling_phrases[spelling]:
+                phrase = self.phrases[number]
+                if in_scope(phrase, days, sections):
+                    matches.append(Match(phrase, similarity, count, ["transliteration"]))
+                    if len(matches) == limit:
+                        return matches
+        return matches
+
+    def spellings_from(self, size):
+        """Number of the first spelling with at least size trigrams"""
+        return self.size_starts[min(max(size, 0), len(self.size_starts) - 1)]
+
+    def count_trigrams(self, query, first, end):
+        """How many query trigrams each spelling first..end-1 has, as bit planes.
+
+        Bit i of planes[j] is bit j of the count of spelling first + i. Each
+        trigram's spellings are added to every count at once with a ripple
+        carry over the planes, so the work per trigram is a few operations
+        on (end - first)-bit ints instead of a loop over its spellings.
+        """
+        width = (1 << (end - first)) - 1
+        planes = []
+        for gram in query:
+            entries = self.grams.get(gram)
+            if entries is None:
+                continue
+            if isinstance(entries, int):
+                carry = entries >> first & width
+            else:
+                carry = 0
+                low = bisect.bisect_left(entries, first)
+                for spelling in entries[low:bisect.bisect_left(entries, end, low)]:
+                    carry |= 1 << (spelling - first)
+            for j, plane in enumerate(planes):
+                planes[j] = plane ^ carry
+                carry &= plane
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        return planes
+
+    def ranked_spellings(self, planes, size, need, first):
+        """Yield (similarity, spelling, count) of spellings sharing need or more trigrams,
+        most similar first.
+
+        Spellings sharing count trigrams form a level, read off the planes
+        as a bitmask. Within a level the similarity falls as the spelling
+        number (and so its trigram count) grows, so levels are merged
+        through a heap holding the next spelling of each, and a level is
+        only opened once its best possible similarity could be next.
+        """
+        levels = iter(range(min(size, (1 << len(planes)) - 1), need - 1, -1))
+        level = next(levels, None)
+        heap = []
+
+        def push(count, mask):
+            low = mask & -mask
+            spelling = first + low.bit_length() - 1
+            similarity = 2 * count / (size + self.spelling_sizes[spelling])
+            heapq.heappush(heap, (-similarity, spelling, count, mask ^ low))
+
+        best_size = self.spelling_sizes[first]
+        while True:
+            while level is not None and (not heap or 2 * level / (size + best_size) >= -heap[0][0]):
+                mask = -1
+                for j, plane in enumerate(planes):
+                    mask &= plane if level >> j & 1 else ~plane
+                if mask > 0:
+                    push(level, mask)
+                level = next(levels, None)
+            if not heap:
+                return
+            similarity, spelling, count, mask = heapq.heappop(heap)
+            yield -similarity, spelling, count
+            if mask:
+                push(count, mask)
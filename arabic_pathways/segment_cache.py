@@ -0,0 +1,161 @@
+"""Content-addressed on-disk cache of synthesized phrase audio"""
+import hashlib
+import json
+import os
+
+from arabic_pathways import mp3
+from arabic_pathways.audio_writer import StreamingWriter
+
+# edge-tts always returns this format; it is part of the key so that a
+# future format change cannot serve stale segments.
+OUTPUT_FORMAT = "audio-24khz-48kbitrate-mono-mp3"
+
+DEFAULT_CACHE_DIR = ".tts_cache"
+
+TICKS_PER_MS = 10_000
+
+
+def segment_key(text, voice, rate="+0%", pitch="+0Hz", output_format=OUTPUT_FORMAT,
+                backend="edge"):
+    """Hash of everything that affects the synthesized audio of one phrase"""
+    payload = json.dumps([backend, text, voice, rate, pitch, output_format], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def format_size(num_bytes):
+    """Human readable byte count"""
+    for unit in ["B", "KB", "MB"]:
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+class Segment:
+    """A cached phrase: its MP3 file and the word timings reported by the TTS service.
+
+    words is a list of [offset_ms, duration_ms, text] relative to the start
+    of the segment. duration_ms is the playing time of its audio frames;
+    entries cached before it was recorded fall back to a constant bitrate
+    estimate from the file size.
+    """
+
+    def __init__(self, path, size, words, duration_ms=None):
+        self.path = path
+        self.size = size
+        self.words = words
+        self.frames_ms = duration_ms
+
+    @property
+    def duration_ms(self):
+        if self.frames_ms is not None:
+            return self.frames_ms
+        return mp3.duration_ms(self.size)
+
+    def speech_span(self):
+        """(start_ms, end_ms) of the spoken words, or of the whole segment without timings"""
+        if not self.words:
+            return 0, self.duration_ms
+        offset, duration, _ = self.words[-1]
+        return self.words[0][0], min(self.duration_ms, offset + duration)
+
+
+class SegmentWriter(StreamingWriter):
+    """Writes a segment's audio and, once that is complete, its word timings"""
+
+    def __init__(self, cache, key):
+        super().__init__(cache.path(key))
+        self.cache = cache
+        self.key = key
+        self.words = []
+        self.duration_ms = None
+
+    def add_boundary(self, chunk):
+        """Record a WordBoundary chunk (offsets in 100 ns ticks)"""
+        self.words.append([chunk["offset"] // TICKS_PER_MS, chunk["duration"] // TICKS_PER_MS,
+                           chunk["text"]])
+
+    def __exit__(self, exc_type, exc, tb):
+        result = super().__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            with open(self.path, "rb") as f:
+                self.duration_ms = mp3.scan(f.read()).duration_ms
+            # The timings are written last: a segment only counts as cached
+            # once both files exist.
+            meta_tmp_path = f"{self.tmp_path}.json"
+            with open(meta_tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"bytes": self.size, "duration_ms": self.duration_ms,
+                           "words": self.words}, f, ensure_ascii=False)
+            os.replace(meta_tmp_path, self.cache.meta_path(self.key))
+            self.cache.bytes_written += self.size
+        return result
+
+    @property
+    def segment(self):
+        return Segment(self.path, self.size, self.words, self.duration_ms)
+
+
+class SegmentCache:
+    """Segments stored as <root>/<key[:2]>/<key>.mp3 with timings in <key>.json"""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.bytes_written = 0
+        # {key: Future} of segments being synthesized, shared by concurrent jobs
+        self.in_flight = {}
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.mp3")
+
+    def meta_path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def load(self, key):
+        """Return the cached Segment for key, or None on a miss"""
+        path = self.path(key)
+        try:
+            with open(self.meta_path(key), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = None
+        if meta is None or not os.path.exists(path):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Segment(path, meta["bytes"], meta["words"], meta.get("duration_ms"))
+
+    def get(self, key):
+        """Return cached audio bytes for key, or None on a miss"""
+        segment = self.load(key)
+        if segment is None:
+            return None
+        with open(segment.path, "rb") as f:
+            return f.read()
+
+    def writer(self, key):
+        """SegmentWriter for a new segment; it becomes visible only when complete"""
+        return SegmentWriter(self, key)
+
+    def put(self, key, data, words=()):
+        """Store audio bytes and word timings ([offset_ms, duration_ms, text]) for key"""
+        with self.writer(key) as writer:
+            writer.write(data)
+            writer.words = [list(word) for word in words]
+        return writer.segment
+
+    def disk_usage(self):
+        """Total size in bytes of all cached segments and their timings"""
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".tmp"):
+                    total += os.path.getsize(os.path.join(dirpath, name))
+        return total
+
+    def print_stats(self):
+        print(f"\nTTS segment cache ({self.root}): {self.hits} hits, {self.misses} misses, "
+              f"{self.shared} shared in flight, {format_size(self.bytes_written)} synthesized, "
+              f"{format_size(self.disk_usage())} on disk")
@@ -0,0 +1,180 @@
+"""SQLite export of the corpus with an FTS5 full-text index"""
+import os
+import sqlite3
+
+from arabic_pathways.corpus import load_corpus
+from arabic_pathways.manifest import content_hash
+from arabic_pathways.normalize import normalize_text
+from arabic_pathways.phrase_data import Phrase
+
+DEFAULT_DB_PATH = "phrases.db"
+
+# Bump when the schema or the indexed search forms change
+STORE_FORMAT_VERSION = 2
+
+SEARCH_FIELDS = ("ar", "transliteration", "en", "category")
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE phrases (
+    id INTEGER PRIMARY KEY,
+    day INTEGER,
+    section TEXT,
+    category TEXT NOT NULL,
+    ar TEXT NOT NULL,
+    transliteration TEXT NOT NULL,
+    en TEXT NOT NULL
+);
+CREATE INDEX phrases_day ON phrases (day, category);
+CREATE INDEX phrases_section ON phrases (section, category);
+-- Normalized forms of each phrase (see normalize.py), rowid = phrases.id.
+-- Queries go through the same normalization (search_form).
+CREATE VIRTUAL TABLE phrase_search USING fts5(
+    ar, transliteration, en, category,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def search_form(text):
+    """text as indexed: normalized Arabic spelling, no tashkeel, accents or case"""
+    return normalize_text(text)
+
+
+def corpus_digest(corpus):
+    return content_hash("store", STORE_FORMAT_VERSION, [phrase.astuple() for phrase in corpus])
+
+
+def export_corpus(corpus, path=DEFAULT_DB_PATH):
+    """Write every phrase of corpus to a new SQLite database at path.
+
+    The database is built in a temporary file that replaces path once it
+    is complete, so readers never see a half-written store.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                "INSERT INTO phrases (id, day, section, category, ar, transliteration, en) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((i, *phrase.astuple()) for i, phrase in enumerate(corpus, 1)))
+            conn.executemany(
+                "INSERT INTO phrase_search (rowid, ar, transliteration, en, category) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((i, *phrase.normalized, search_form(phrase.category))
+                 for i, phrase in enumerate(corpus, 1)))
+            conn.execute("INSERT INTO phrase_search (phrase_search) VALUES ('optimize')")
+            conn.execute("INSERT INTO meta VALUES ('digest', ?)", (corpus_digest(corpus),))
+        conn.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+
+
+def match_expression(text, field=None, prefix=False):
+    """FTS5 query matching every word of text (optionally as prefixes, in one field)"""
+    terms = []
+    for word in search_form(text).split():
+        term = '"' + word.replace('"', '""') + '"'
+        terms.append(term + "*" if prefix else term)
+    if not terms:
+        raise ValueError("no words to search for")
+    expression = " ".join(terms)
+    if field is not None:
+        if field not in SEARCH_FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        expression = f"{field} : ({expression})"
+    return expression
+
+
+class PhraseStore:
+    """Read access to an exported phrase database"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+
+    @classmethod
+    def open(cls, path=DEFAULT_DB_PATH, corpus=None):
+        """Open the store at path, exporting corpus first if the store is missing or stale"""
+        if corpus is None:
+            corpus = load_corpus()
+        digest = corpus_digest(corpus)
+        if os.path.exists(path):
+            store = cls(path)
+            if store.digest() == digest:
+                return store
+            store.close()
+        export_corpus(corpus, path)
+        return cls(path)
+
+    def digest(self):
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @staticmethod
+    def scope(days=None, sections=None):
+        """WHERE clause restricting phrases to some days and/or supplementary sections.
+
+        With neither given every phrase is in scope; once one is given, the
+        other kind of phrase is only included if it is given too.
+        """
+        if days is None and sections is None:
+            return "1", []
+        clauses, params = [], []
+        for column, values in (("day", days), ("section", sections)):
+            if values:
+                clauses.append(f"p.{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if not clauses:
+            return "0", []
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def phrases(self, days=None, sections=None, category=None):
+        """Phrases of some days or sections (and optionally one category), in order"""
+        where, params = self.scope(days, sections)
+        if category is not None:
+            where += " AND p.category = ?"
+            params.append(category)
+        rows = self.conn.execute(
+            "SELECT day, section, category, ar, transliteration, en FROM phrases p "
+            f"WHERE {where} ORDER BY p.id", params)
+        return [Phrase(*row) for row in rows]
+
+    def search(self, text, days=None, sections=None, field=None, prefix=False, limit=None):
+        """Phrases whose words include every word of text, in curriculum order.
+
+        The Arabic, transliteration, English and category name are searched
+        unless field names one of them.
+        """
+        where, params = self.scope(days, sections)
+        sql = ("SELECT p.day, p.section, p.category, p.ar, p.transliteration, p.en "
+               "FROM phrase_search s JOIN phrases p ON p.id = s.rowid "
+               f"WHERE phrase_search MATCH ? AND {where} ORDER BY p.id")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = self.conn.execute(sql, [match_expression(text, field, prefix), *params])
+        return [Phrase(*row) for row in rows]
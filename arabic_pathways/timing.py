@@ -0,0 +1,53 @@
+"""Per-file phrase timing indexes (JSON and WebVTT) for seeking within lesson audio"""
+import json
+import os
+
+from arabic_pathways.audio_writer import StreamingWriter
+
+
+def phrase_timings(segments, gaps_ms=None):
+    """(start_ms, end_ms) of the speech in each segment once they are joined in order.
+
+    gaps_ms[i] is silence inserted after segment i, if any.
+    """
+    timings = []
+    position = 0
+    for i, segment in enumerate(segments):
+        start, end = segment.speech_span()
+        timings.append((position + start, position + end))
+        position += segment.duration_ms
+        if gaps_ms:
+            position += gaps_ms[i]
+    return timings, position
+
+
+def format_vtt_time(ms):
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+
+def write_timing_index(json_path, vtt_path, audio_path, entries, timings, duration_ms):
+    """Write the phrase index of one audio file.
+
+    entries is a list of (category, text) in the same order as timings.
+    Returns the two finished writers (JSON, WebVTT).
+    """
+    index = {
+        "audio": os.path.basename(audio_path),
+        "duration_ms": duration_ms,
+        "phrases": [
+            {"category": category, "text": text, "start_ms": start, "end_ms": end}
+            for (category, text), (start, end) in zip(entries, timings)
+        ],
+    }
+    with StreamingWriter(json_path) as json_writer:
+        json_writer.write(json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode())
+
+    with StreamingWriter(vtt_path) as vtt_writer:
+        vtt_writer.write(b"WEBVTT\n")
+        for number, ((_, text), (start, end)) in enumerate(zip(entries, timings), 1):
+            cue = f"\n{number}\n{format_vtt_time(start)} --> {format_vtt_time(end)}\n{text}\n"
+            vtt_writer.write(cue.encode("utf-8"))
+    return json_writer, vtt_writer
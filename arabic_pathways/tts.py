@@ -0,0 +1,157 @@
+"""Text-to-speech backends.
+
+A backend streams edge-tts style chunks for one piece of text:
+{"type": "audio", "data": bytes} for MP3 data and
+{"type": "WordBoundary", "offset": ..., "duration": ..., "text": ...} for
+word timings, with offsets and durations in 100 ns ticks.
+"""
+import asyncio
+import importlib
+import random
+
+from arabic_pathways import mp3
+from arabic_pathways.pool import ConnectionPool
+
+TICKS_PER_MS = 10_000
+
+
+class TTSBackend:
+    """Base class for TTS backends"""
+
+    name = "base"
+    # Errors worth retrying: the same request may well succeed a moment later
+    retryable_errors = (OSError,)
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.pool = None
+
+    async def stream(self, text, voice, rate="+0%", pitch="+0Hz"):
+        """Yield audio and boundary chunks for text"""
+        raise NotImplementedError
+        yield  # pylint: disable=unreachable
+
+    async def close(self):
+        """Release pooled connections; call once at the end of a build"""
+        if self.pool is not None:
+            await self.pool.close()
+
+    def print_stats(self):
+        print(f"TTS backend ({self.name}): {self.requests} requests, {self.failures} failures")
+        if self.pool is not None:
+            self.pool.print_stats(self.name)
+
+
+class LocalTTSError(ConnectionError):
+    """Simulated service failure raised by LocalTTSBackend"""
+
+
+class LocalTTSBackend(TTSBackend):
+    """Offline stand-in for edge-tts.
+
+    Returns valid MP3 frames of silence in the edge-tts output format, with a
+    duration proportional to the text length and one WordBoundary per word.
+    Each request waits for a latency drawn from a log-normal distribution
+    (median `latency` seconds, shape `jitter`; jitter 0 gives a constant
+    latency) plus `char_latency` seconds per character of text, and fails
+    with probability `failure_rate`, either before any audio or part way
+    through the stream. Opening a connection costs `handshake` seconds;
+    with pool_size > 0 connections come from a ConnectionPool and only new
+    ones pay it. Pass `seed` for reproducible runs.
+    """
+
+    name = "local"
+    CHUNK_FRAMES = 16
+    MS_PER_CHAR = 70
+    LEAD_MS = 100
+
+    def __init__(self, latency=0.3, jitter=0.5, failure_rate=0.0, seed=None, char_latency=0.0,
+                 handshake=0.0, pool_size=0):
+        super().__init__()
+        self.latency = latency
+        self.char_latency = char_latency
+        self.handshake = handshake
+        if pool_size > 0:
+            self.pool = ConnectionPool(self.open_connection, size=pool_size)
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+
+    def sample_latency(self):
+        if self.latency <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return self.latency
+        return self.random.lognormvariate(0, self.jitter) * self.latency
+
+    def word_boundaries(self, text):
+        """Evenly spaced WordBoundary chunks for the words of text"""
+        offset_ms = self.LEAD_MS
+        for word in text.split():
+            word_ms = len(word) * self.MS_PER_CHAR
+            yield {"type": "WordBoundary", "offset": offset_ms * TICKS_PER_MS,
+                   "duration": word_ms * TICKS_PER_MS, "text": word}
+            offset_ms += word_ms + self.MS_PER_CHAR
+
+    async def open_connection(self):
+        await asyncio.sleep(self.handshake)
+        return object()
+
+    async def stream(self, text, voice, rate="+0%", pitch="+0Hz"):
+        if self.pool is None:
+            await self.open_connection()
+            async for chunk in self.synthesize(text):
+                yield chunk
+        else:
+            async with self.pool.connection():
+                async for chunk in self.synthesize(text):
+                    yield chunk
+
+    async def synthesize(self, text):
+        self.requests += 1
+        latency = self.sample_latency() + self.char_latency * len(text)
+        fail_at = None
+        if self.random.random() < self.failure_rate:
+            fail_at = self.random.random()
+
+        # Time to first byte
+        await asyncio.sleep(latency / 2)
+        if fail_at is not None and fail_at < 0.5:
+            self.failures += 1
+            raise LocalTTSError("simulated connection failure")
+
+        for boundary in self.word_boundaries(text):
+            yield boundary
+
+        total_ms = 2 * self.LEAD_MS + self.MS_PER_CHAR * len(text)
+        total_frames = max(1, mp3.frames_for_ms(total_ms))
+        frame = mp3.silent_frame()
+        sent = 0
+        while sent < total_frames:
+            count = min(self.CHUNK_FRAMES, total_frames - sent)
+            if fail_at is not None and sent / total_frames >= (fail_at - 0.5) * 2:
+                self.failures += 1
+                raise LocalTTSError("simulated connection reset mid-stream")
+            # The rest of the latency is spread over the audio chunks
+            await asyncio.sleep(latency / 2 * count / total_frames)
+            yield {"type": "audio", "data": frame * count}
+            sent += count
+
+
+# Backend name -> (module, class). Modules are imported on first use, so
+# edge-tts and aiohttp are only loaded when the edge backend is created.
+BACKENDS = {
+    "edge": ("arabic_pathways.edge", "EdgeTTSBackend"),
+    "local": ("arabic_pathways.tts", "LocalTTSBackend"),
+}
+
+
+def create_backend(name, **options):
+    """Instantiate a backend by name"""
+    try:
+        module_name, class_name = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend: {name}") from None
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class(**options)
@@ -0,0 +1,79 @@
+"""Requests versus latency for different TTS batch sizes.
+
+Synthesizes the Arabic audio of a range of days with the offline local
+backend, once per batch size and each time into an empty segment cache,
+and prints how many requests were sent, the per-file latency and the
+total wall clock time.
+
+Usage:
+    python benchmarks/batch_tts.py
+    python benchmarks/batch_tts.py --days 1-14 --sizes 1,4,8,16 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from arabic_pathways.__main__ import parse_day_ranges
+from arabic_pathways.audio import assemble_audio
+from arabic_pathways.build import DAY_VOICES, day_target
+from arabic_pathways.phrases import load_day_phrases
+from arabic_pathways.scheduler import percentile, run_jobs
+from arabic_pathways.segment_cache import SegmentCache
+from arabic_pathways.tts import LocalTTSBackend
+
+
+async def run(texts_by_day, batch_size, args):
+    """Build every day once with batch_size; returns (requests, latencies, wall)"""
+    backend = LocalTTSBackend(latency=args.latency, jitter=args.jitter,
+                              char_latency=args.char_latency, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SegmentCache(os.path.join(tmp, "cache"))
+        jobs = [(f"day{day}",
+                 lambda day=day, texts=texts:
+                 assemble_audio(texts, DAY_VOICES["ar"], os.path.join(tmp, f"day{day}.mp3"),
+                                cache, backend, batch_size=batch_size))
+                for day, texts in texts_by_day.items()]
+        results, wall = await run_jobs(jobs, args.jobs)
+    failed = [result for result in results if not result.ok]
+    if failed:
+        raise SystemExit(f"{len(failed)} job(s) failed: {failed[0].error}")
+    return backend.requests, [result.elapsed for result in results], wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS request batching")
+    parser.add_argument("--days", type=parse_day_ranges, default=parse_day_ranges("1-7"),
+                        help="Days to synthesize (default: 1-7)")
+    parser.add_argument("--sizes", type=str, default="1,2,4,8,16,32",
+                        help="Comma separated batch sizes (default: 1,2,4,8,16,32)")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Days synthesized concurrently (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.3,
+                        help="Median fixed cost of a request in seconds (default: 0.3)")
+    parser.add_argument("--jitter", type=float, default=0.3,
+                        help="Log-normal shape of the request latency (default: 0.3)")
+    parser.add_argument("--char-latency", type=float, default=0.002,
+                        help="Synthesis time per character in seconds (default: 0.002)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    phrases = load_day_phrases()
+    texts_by_day = {day: day_target(day, phrases[day]).audio_texts("ar") for day in args.days}
+    total = sum(len(texts) for texts in texts_by_day.values())
+    print(f"{total} phrases in {len(texts_by_day)} files, --jobs {args.jobs}, "
+          f"{args.latency}s per request + {args.char_latency * 1000:.1f} ms per character\n")
+    print(f"{'batch':>5} {'requests':>9} {'p50 file':>9} {'p95 file':>9} {'wall':>8}")
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        requests, latencies, wall = asyncio.run(run(texts_by_day, size, args))
+        print(f"{size:>5} {requests:>9} {percentile(latencies, 0.5):>8.2f}s "
+              f"{percentile(latencies, 0.95):>8.2f}s {wall:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
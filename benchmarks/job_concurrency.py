@@ -0,0 +1,83 @@
+"""Measured speedup of --jobs N over a real --jobs 1 run.
+
+Synthesizes the Arabic audio of a range of days with the offline local
+backend, once per --jobs value and each time into an empty segment cache,
+and prints the wall clock time, the speedup over the --jobs 1 run and the
+"summed" speedup the build report estimates from job latencies. Against
+the real service, where concurrent jobs slow each other down, that
+estimate is an upper bound; the local backend has no such contention.
+
+Usage:
+    python benchmarks/job_concurrency.py
+    python benchmarks/job_concurrency.py --days 1-14 --jobs 1,2,4,8 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from arabic_pathways.__main__ import parse_day_ranges
+from arabic_pathways.audio import assemble_audio
+from arabic_pathways.build import DAY_VOICES, day_target
+from arabic_pathways.phrases import load_day_phrases
+from arabic_pathways.scheduler import run_jobs
+from arabic_pathways.segment_cache import SegmentCache
+from arabic_pathways.tts import LocalTTSBackend
+
+
+async def run(texts_by_day, jobs, args):
+    """Build every day once with `jobs` files in flight; returns (latency sum, wall)"""
+    backend = LocalTTSBackend(latency=args.latency, jitter=args.jitter,
+                              char_latency=args.char_latency, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SegmentCache(os.path.join(tmp, "cache"))
+        audio_jobs = [(f"day{day}",
+                       lambda day=day, texts=texts:
+                       assemble_audio(texts, DAY_VOICES["ar"], os.path.join(tmp, f"day{day}.mp3"),
+                                      cache, backend, batch_size=args.batch_size))
+                      for day, texts in texts_by_day.items()]
+        results, wall = await run_jobs(audio_jobs, jobs)
+    failed = [result for result in results if not result.ok]
+    if failed:
+        raise SystemExit(f"{len(failed)} job(s) failed: {failed[0].error}")
+    return sum(result.elapsed for result in results), wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent audio jobs")
+    parser.add_argument("--days", type=parse_day_ranges, default=parse_day_ranges("1-7"),
+                        help="Days to synthesize (default: 1-7)")
+    parser.add_argument("--jobs", "-j", type=str, default="1,2,4,8",
+                        help="Comma separated --jobs values; 1 is always run first "
+                             "(default: 1,2,4,8)")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="Phrases per TTS request (default: 8)")
+    parser.add_argument("--latency", type=float, default=0.3,
+                        help="Median fixed cost of a request in seconds (default: 0.3)")
+    parser.add_argument("--jitter", type=float, default=0.3,
+                        help="Log-normal shape of the request latency (default: 0.3)")
+    parser.add_argument("--char-latency", type=float, default=0.002,
+                        help="Synthesis time per character in seconds (default: 0.002)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    phrases = load_day_phrases()
+    texts_by_day = {day: day_target(day, phrases[day]).audio_texts("ar") for day in args.days}
+    levels = [1] + [jobs for jobs in (int(jobs) for jobs in args.jobs.split(",")) if jobs != 1]
+    print(f"{len(texts_by_day)} files, --batch-size {args.batch_size}, "
+          f"{args.latency}s per request + {args.char_latency * 1000:.1f} ms per character\n")
+    print(f"{'jobs':>4} {'wall':>8} {'speedup':>8} {'summed':>8}")
+
+    serial = None
+    for jobs in levels:
+        total, wall = asyncio.run(run(texts_by_day, jobs, args))
+        serial = serial or wall
+        print(f"{jobs:>4} {wall:>7.2f}s {serial / wall:>7.2f}x {total / wall:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
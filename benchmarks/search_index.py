@@ -0,0 +1,145 @@
+"""Indexing time and query latency of the inverted phrase index.
+
+Builds the index of the corpus (optionally repeated --scale times, with
+every copy on its own days), saves and reloads it, then runs queries made
+of one to three random corpus words and prints latency percentiles. With
+--fuzzy the queries are corpus transliterations with a typo or two, run
+through fuzzy search; --vary turns every copy of the corpus after the first
+into new transliterations made of random corpus words, so that the fuzzy
+index holds about --scale times as many distinct transliterations.
+
+Usage:
+    python benchmarks/search_index.py
+    python benchmarks/search_index.py --scale 100 --queries 2000 --prefix
+    python benchmarks/search_index.py --scale 100 --vary --fuzzy
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from arabic_pathways.corpus import Corpus, load_corpus
+from arabic_pathways.phrase_data import Phrase
+from arabic_pathways.scheduler import percentile
+from arabic_pathways.search import SearchIndex
+
+
+LETTERS = "abdefghiklmnqrstuwyz"
+
+
+def misspell(text, rng, typos=1):
+    """text with typos random single-letter substitutions, insertions or deletions"""
+    for _ in range(typos):
+        i = rng.randrange(len(text))
+        edit = rng.randrange(3)
+        if edit == 0:
+            text = text[:i] + rng.choice(LETTERS) + text[i + 1:]
+        elif edit == 1:
+            text = text[:i] + rng.choice(LETTERS) + text[i:]
+        elif len(text) > 1:
+            text = text[:i] + text[i + 1:]
+    return text
+
+
+def scaled_corpus(corpus, scale, vary=False, seed=1):
+    """corpus repeated scale times; copy n has its days shifted by n * last day.
+
+    With vary, every transliteration of the copies after the first is
+    replaced by as many words drawn at random from all transliterations.
+    """
+    if scale == 1:
+        return corpus
+    rng = random.Random(seed)
+    words = [word for phrase in corpus for word in phrase.transliteration.split()]
+    last_day = max(corpus.days())
+    phrases = []
+    for copy in range(scale):
+        for phrase in corpus:
+            day = None if phrase.day is None else phrase.day + copy * last_day
+            transliteration = phrase.transliteration
+            if vary and copy:
+                transliteration = " ".join(rng.choice(words)
+                                           for _ in transliteration.split())
+            phrases.append(Phrase(day, phrase.section, phrase.category, phrase.ar,
+                                  transliteration, phrase.en))
+    return Corpus(phrases)
+
+
+def random_queries(corpus, count, seed):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        field = rng.choice(rng.choice(corpus.phrases).normalized).split()
+        size = min(len(field), rng.randint(1, 3))
+        start = rng.randrange(len(field) - size + 1)
+        queries.append(" ".join(field[start:start + size]))
+    return queries
+
+
+def fuzzy_queries(corpus, count, seed):
+    """Transliterations of random phrases with one or two typos"""
+    rng = random.Random(seed)
+    return [misspell(rng.choice(corpus.phrases).transliteration, rng, rng.randint(1, 2))
+            for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the inverted phrase index")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Copies of the corpus to index (default: 1)")
+    parser.add_argument("--queries", type=int, default=1000,
+                        help="Number of random queries (default: 1000)")
+    parser.add_argument("--limit", type=int, default=10,
+                        help="Results per query (default: 10)")
+    parser.add_argument("--prefix", action="store_true", help="Run prefix queries")
+    parser.add_argument("--fuzzy", action="store_true",
+                        help="Run fuzzy transliteration queries")
+    parser.add_argument("--vary", action="store_true",
+                        help="Respell the transliterations of every copy of the corpus")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    corpus = scaled_corpus(load_corpus(cache_path=None), args.scale, args.vary, args.seed)
+    if args.fuzzy:
+        queries = fuzzy_queries(corpus, args.queries, args.seed)
+    else:
+        queries = random_queries(corpus, args.queries, args.seed)
+    print(f"{len(corpus)} phrases, {len(queries)} queries\n")
+
+    start = time.perf_counter()
+    index = SearchIndex.build(corpus)
+    build_time = time.perf_counter() - start
+    print(f"build       {build_time * 1000:9.1f} ms  ({len(index.postings)} tokens, "
+          f"{len(index.spelling_phrases)} transliterations)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.pickle")
+        start = time.perf_counter()
+        SearchIndex.load(corpus, path)
+        print(f"build+save  {(time.perf_counter() - start) * 1000:9.1f} ms  "
+              f"({os.path.getsize(path) / 1024:.0f} KiB)")
+        start = time.perf_counter()
+        index = SearchIndex.load(corpus, path)
+        print(f"load        {(time.perf_counter() - start) * 1000:9.1f} ms  "
+              f"(from cache: {index.from_cache})")
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        if args.fuzzy:
+            index.fuzzy(query, args.limit)
+        else:
+            index.search(query, args.limit, prefix=args.prefix)
+        latencies.append(time.perf_counter() - start)
+    print(f"\nquery p50   {percentile(latencies, 0.5) * 1000:9.3f} ms")
+    print(f"query p95   {percentile(latencies, 0.95) * 1000:9.3f} ms")
+    print(f"query max   {max(latencies) * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Solve time and reuse of the global video assignment.
+
+Generates --topics topics with --candidates random candidate videos each,
+drawn from a pool of --pool videos of which --popular are popular: they
+score higher and show up for many topics, like the handful of videos that
+the per-topic greedy pick used to hand to a dozen days. Prints the solve
+time and the distinct videos and total score of the assignment next to
+those of the best video of every topic on its own.
+
+Usage:
+    python benchmarks/video_assignment.py
+    python benchmarks/video_assignment.py --topics 45 --candidates 500 --runs 20
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from arabic_pathways.assignment import DEFAULT_REUSE_PENALTY, assign, greedy, total_score
+from arabic_pathways.scheduler import percentile
+
+
+def random_candidates(topics, per_topic, pool, popular, rng):
+    """{topic: {video: score}} with scores shaped like video_score"""
+    candidates = {}
+    for topic in range(topics):
+        scores = {}
+        for _ in range(per_topic):
+            if rng.random() < 0.2:
+                video = f"popular{rng.randrange(popular)}"
+                scores[video] = 110 + rng.uniform(4, 7)
+            else:
+                video = f"video{rng.randrange(pool)}"
+                scores[video] = rng.choice([0, 100]) + rng.choice([0, 10]) + rng.uniform(2, 6)
+        candidates[f"topic{topic}"] = scores
+    return candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the global video assignment")
+    parser.add_argument("--topics", type=int, default=45)
+    parser.add_argument("--candidates", type=int, default=300,
+                        help="Candidate videos per topic (default: 300)")
+    parser.add_argument("--pool", type=int, default=5000, help="Distinct ordinary videos")
+    parser.add_argument("--popular", type=int, default=3, help="Distinct popular videos")
+    parser.add_argument("--reuse-penalty", type=float, default=DEFAULT_REUSE_PENALTY)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    timings = []
+    for _ in range(args.runs):
+        candidates = random_candidates(args.topics, args.candidates, args.pool, args.popular, rng)
+        start = time.perf_counter()
+        assignment = assign(candidates, args.reuse_penalty)
+        timings.append(time.perf_counter() - start)
+
+    picks = greedy(candidates)
+    print(f"{args.topics} topics × {args.candidates} candidates, {args.runs} runs\n")
+    print(f"solve p50   {percentile(timings, 0.5) * 1000:9.1f} ms")
+    print(f"solve max   {max(timings) * 1000:9.1f} ms\n")
+    for name, chosen in [("greedy", picks), ("assigned", assignment)]:
+        print(f"{name:<9} {len(set(chosen.values())):4} distinct videos, score "
+              f"{total_score(candidates, chosen, args.reuse_penalty):.1f} after reuse penalties")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import itertools
+import random
+
+from arabic_pathways.assignment import assign, greedy, total_score
+
+
+def best_by_brute_force(candidates, reuse_penalty, used):
+    return max(total_score(candidates, dict(zip(candidates, items)), reuse_penalty, used)
+               for items in itertools.product(*candidates.values()))
+
+
+def test_assignment_is_optimal_on_small_instances():
+    rng = random.Random(5)
+    for _ in range(150):
+        items = [f"v{n}" for n in range(rng.randint(1, 5))]
+        candidates = {f"t{n}": {item: rng.uniform(0, 10)
+                                for item in rng.sample(items, rng.randint(1, len(items)))}
+                      for n in range(rng.randint(1, 5))}
+        used = {item: rng.randint(0, 2) for item in rng.sample(items, rng.randint(0, len(items)))}
+        reuse_penalty = rng.choice([0, 1, 4, 10])
+        assignment = assign(candidates, reuse_penalty, used)
+        assert set(assignment) == set(candidates)
+        assert abs(total_score(candidates, assignment, reuse_penalty, used)
+                   - best_by_brute_force(candidates, reuse_penalty, used)) < 1e-9
+
+
+def test_reuse_is_traded_against_score():
+    candidates = {topic: {"popular": 10.0, f"own {topic}": 7.0} for topic in "abcde"}
+    assert set(greedy(candidates).values()) == {"popular"}
+    # The second use costs 2 and the third 4, against 3 lost by moving elsewhere
+    assignment = assign(candidates, reuse_penalty=2)
+    assert sum(item == "popular" for item in assignment.values()) == 2
+    assert total_score(candidates, assignment, 2) == 2 * 10 + 3 * 7 - 2
+    # Uses outside the assignment count too
+    assert "popular" not in assign(candidates, reuse_penalty=2, used={"popular": 2}).values()
+    # Topics and items may share names; topics without candidates are left out
+    assert assign({"x": {"x": 1.0}, "y": {}}) == {"x": "x"}
+
+
+def test_many_candidates_per_topic():
+    rng = random.Random(1)
+    candidates = {f"day{n}": {f"video{rng.randrange(2000)}": rng.uniform(0, 20)
+                              for _ in range(500)} for n in range(45)}
+    assignment = assign(candidates)
+    assert len(set(assignment.values())) == 45
+    assert total_score(candidates, assignment) >= total_score(candidates, greedy(candidates))
@@ -0,0 +1,45 @@
+import hashlib
+
+import pytest
+
+from arabic_pathways.audio_writer import StreamingWriter
+
+
+def test_writer_hashes_and_renames_on_success(tmp_path):
+    path = tmp_path / "audio" / "day1_ar.mp3"
+    with StreamingWriter(str(path)) as writer:
+        writer.write(b"\xff\xf3" * 100)
+        assert not path.exists()
+        writer.write(b"\x00" * 10)
+
+    data = path.read_bytes()
+    assert writer.size == len(data) == 210
+    assert writer.sha256 == hashlib.sha256(data).hexdigest()
+    assert list(path.parent.glob(".*.tmp")) == []
+
+
+def test_writer_keeps_previous_file_when_interrupted(tmp_path):
+    path = tmp_path / "day1_ar.mp3"
+    path.write_bytes(b"complete")
+
+    with pytest.raises(ConnectionError):
+        with StreamingWriter(str(path)) as writer:
+            writer.write(b"partial")
+            raise ConnectionError("websocket closed")
+
+    assert path.read_bytes() == b"complete"
+    assert list(tmp_path.glob(".*.tmp")) == []
+
+
+def test_copy_from_streams_other_files(tmp_path):
+    parts = []
+    for i in range(3):
+        part = tmp_path / f"part{i}.mp3"
+        part.write_bytes(bytes([i]) * 100_000)
+        parts.append(part)
+
+    with StreamingWriter(str(tmp_path / "joined.mp3")) as writer:
+        for part in parts:
+            writer.copy_from(str(part))
+
+    assert (tmp_path / "joined.mp3").read_bytes() == b"".join(p.read_bytes() for p in parts)
@@ -0,0 +1,46 @@
+import asyncio
+
+from arabic_pathways import mp3
+from arabic_pathways.audio import synthesize_segments
+from arabic_pathways.batching import align_phrases, batch_text, cut_points, word_key
+from arabic_pathways.segment_cache import SegmentCache
+from arabic_pathways.tts import LocalTTSBackend
+
+
+def test_batch_text_ends_every_phrase():
+    assert batch_text(["مرحبا", "كيف حالك؟", "Thank you."]) == "مرحبا.\nكيف حالك؟\nThank you."
+
+
+def test_word_key_ignores_punctuation_and_diacritics():
+    assert word_key("مَرْحَبًا،") == word_key("مرحبا") == "مرحبا"
+
+
+def test_align_phrases_and_cut_points():
+    words = [[100, 200, "صباح"], [350, 250, "الخير."], [800, 300, "شكرا."]]
+    aligned = align_phrases(["صباح الخير", "شكرا"], words)
+    assert aligned == [words[:2], words[2:]]
+    assert cut_points(aligned) == [700]
+
+    assert align_phrases(["صباح الخير", "شكرا جزيلا"], words) is None
+    assert align_phrases(["صباح", "شكرا"], words) is None
+
+
+def test_batches_are_split_into_cached_segments(tmp_path):
+    cache = SegmentCache(str(tmp_path))
+    backend = LocalTTSBackend(latency=0)
+    texts = ["مرحبا", "صباح الخير", "شكرا", "مع السلامة", "نعم"]
+
+    segments = asyncio.run(synthesize_segments(texts, "ar-EG-SalmaNeural", cache, backend,
+                                               batch_size=4))
+    assert backend.requests == 2
+    assert [[word[2] for word in segment.words] for segment in segments] == [
+        ["مرحبا."], ["صباح", "الخير."], ["شكرا."], ["مع", "السلامة."], ["نعم"]]
+    for segment in segments:
+        start, end = segment.speech_span()
+        assert 0 <= start < end <= segment.duration_ms
+        assert segment.size % mp3.FRAME_SIZE == 0
+
+    # Every phrase is now cached on its own
+    again = asyncio.run(synthesize_segments(texts[1:3], "ar-EG-SalmaNeural", cache, backend))
+    assert backend.requests == 2
+    assert [segment.path for segment in again] == [segment.path for segment in segments[1:3]]
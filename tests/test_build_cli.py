@@ -0,0 +1,47 @@
+import argparse
+
+import pytest
+
+from arabic_pathways.__main__ import (backend_from_args, build_parser, parse_categories,
+                                      parse_day_ranges, select_targets)
+
+
+def test_parse_day_ranges():
+    assert parse_day_ranges("1-40") == list(range(1, 41))
+    assert parse_day_ranges("7,1-3, 12") == [1, 2, 3, 7, 12]
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_day_ranges("1-x")
+
+
+def test_parse_categories():
+    assert parse_categories("all") is None
+    assert parse_categories("none") == []
+    assert parse_categories("education, hobbies") == ["education", "hobbies"]
+
+
+def test_select_targets_covers_every_module():
+    args = build_parser().parse_args(["build"])
+    targets = select_targets(args.days, args.supplementary)
+
+    assert [t.name for t in targets[:40]] == [f"day{day}" for day in range(1, 41)]
+    assert [t.name for t in targets[40:]] == [
+        "education", "hobbies", "emotions", "daily_life", "comparisons"]
+    assert targets[0].audio_path("ar") == "audio_files/day1_ar.mp3"
+    assert targets[-1].text_path("en") == "text_files/supplementary/comparisons_en.txt"
+    assert targets[0].audio_texts("ar")[0] == "مرحبا"
+    assert targets[0].voice("en") == "en-US-JennyNeural"
+
+
+def test_select_targets_rejects_unknown_days():
+    with pytest.raises(SystemExit):
+        select_targets([41], [])
+
+
+def test_rate_limit_defaults_to_none_for_the_local_backend():
+    backend = backend_from_args(build_parser().parse_args(["build", "--backend", "local"]))
+    assert backend.limiter is None
+    backend = backend_from_args(build_parser().parse_args(["build"]))
+    assert backend.limiter.rate == 8
+    backend = backend_from_args(build_parser().parse_args(
+        ["build", "--backend", "local", "--rate-limit", "2"]))
+    assert backend.limiter.rate == 2
@@ -0,0 +1,62 @@
+import json
+import os
+
+from arabic_pathways.corpus import Phrase, load_corpus
+from arabic_pathways.phrases import load_day_phrases, load_supplementary_phrases
+
+
+def write_data(data_dir, hello="Hello"):
+    days, supplementary = data_dir / "days", data_dir / "supplementary"
+    days.mkdir(parents=True, exist_ok=True)
+    supplementary.mkdir(parents=True, exist_ok=True)
+    files = {
+        days / "day01.json": {"Greetings": [{"ar": "مرحبا", "transliteration": "Marhaba",
+                                             "en": hello}]},
+        days / "day02.json": {"Numbers": [{"ar": "واحد", "transliteration": "Wahid", "en": "One"}]},
+        supplementary / "education.json": {"Subjects": [{"ar": "رياضيات",
+                                                         "transliteration": "Riyadiyat",
+                                                         "en": "Math"}]},
+    }
+    for path, phrases in files.items():
+        path.write_text(json.dumps(phrases, ensure_ascii=False), encoding="utf-8")
+
+
+def test_corpus_matches_the_phrase_data(tmp_path):
+    corpus = load_corpus(str(tmp_path / "corpus.pickle"))
+    day_phrases = load_day_phrases()
+
+    assert corpus.days() == list(day_phrases) == list(range(1, 41))
+    assert all(corpus.day_phrases(day) == phrases for day, phrases in day_phrases.items())
+    assert corpus.sections() == list(load_supplementary_phrases())
+    assert corpus.supplementary_phrases("education") == load_supplementary_phrases()["education"]
+    assert not hasattr(corpus.phrases[0], "__dict__")
+
+
+def test_corpus_cache_is_keyed_by_source_mtime_and_hash(tmp_path):
+    data_dir, cache_path = tmp_path / "data", str(tmp_path / "cache" / "corpus.pickle")
+    write_data(data_dir)
+
+    first = load_corpus(cache_path, str(data_dir))
+    assert not first.from_cache
+    assert [(p.day, p.section, p.en) for p in first] == [
+        (1, None, "Hello"), (2, None, "One"), (None, "education", "Math")]
+
+    assert load_corpus(cache_path, str(data_dir)).from_cache
+
+    # A touched but unchanged source is still served from the cache
+    source = data_dir / "days" / "day01.json"
+    os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 10**9))
+    assert load_corpus(cache_path, str(data_dir)).from_cache
+
+    write_data(data_dir, hello="Hi")
+    changed = load_corpus(cache_path, str(data_dir))
+    assert not changed.from_cache
+    assert changed.day_phrases(1)["Greetings"][0]["en"] == "Hi"
+
+    (data_dir / "days" / "day02.json").unlink()
+    assert load_corpus(cache_path, str(data_dir)).days() == [1]
+
+
+def test_phrase_round_trips_through_a_tuple():
+    phrase = Phrase(3, None, "Food", "خبز", "Khubz", "Bread")
+    assert Phrase(*phrase.astuple()).asdict() == phrase.asdict()
@@ -0,0 +1,72 @@
+import asyncio
+
+from arabic_pathways.audio import synthesize_segments
+from arabic_pathways.build import build_targets, day_target
+from arabic_pathways.corpus import Corpus, Phrase, load_corpus
+from arabic_pathways.dedupe import DuplicateGroup, duplicate_groups, spoken_texts
+from arabic_pathways.segment_cache import SegmentCache
+from arabic_pathways.tts import LocalTTSBackend
+
+PHRASES = [
+    Phrase(1, None, "Greetings", "شكرا", "Shukran", "Thank you"),
+    Phrase(1, None, "Greetings", "مرحبا", "Marhaba", "Hello"),
+    Phrase(17, None, "Polite", "شكراً", "shukran", "thank you"),
+    Phrase(20, None, "Polite", "شكرا", "Shukran", "Thanks"),
+    Phrase(None, "daily_life", "Routine", "مرحبا", "Marhaba", "Hello!"),
+]
+
+
+def test_duplicate_groups_and_canonical_spelling():
+    corpus = Corpus(PHRASES)
+    groups = duplicate_groups(corpus, "ar")
+    assert [(group.canonical(), len(group.phrases)) for group in groups] == [
+        ("شكرا", 3), ("مرحبا", 2)]
+    assert groups[0].spellings() == {"شكرا": 2, "شكراً": 1}
+    assert [group.canonical() for group in duplicate_groups(corpus, "en")] == [
+        "Thank you", "Hello"]
+
+    # On a tie the most fully vowelled spelling wins
+    assert DuplicateGroup("ar", "شكرا", PHRASES[2:4]).canonical() == "شكراً"
+
+    # Only spellings that sound alike are spoken with one text; tashkeel
+    # and punctuation change the speech, so they are kept
+    spoken = spoken_texts(PHRASES + [Phrase(3, None, "Polite", "شكـرا", "Shukran", "Thanks")])
+    assert spoken == {"ar": {"شكـرا": "شكرا"}, "en": {"thank you": "Thank you"}}
+
+
+def test_targets_speak_the_shared_spelling():
+    target = day_target(17, {"Polite": [{"ar": "شكـراً", "transliteration": "shukran",
+                                         "en": "thank  you"}]})
+    target.spoken = spoken_texts(PHRASES + [Phrase(17, None, "Polite", "شكـراً", "shukran",
+                                                   "thank  you")])
+    assert target.audio_texts("ar") == ["شكراً"]
+    assert target.audio_texts("en") == ["Thank you"]
+    # Text files and timing labels keep the phrase as written
+    assert target.audio_entries("ar") == [("Polite", "شكـراً")]
+
+
+def test_concurrent_files_synthesize_each_segment_once(tmp_path):
+    cache = SegmentCache(str(tmp_path))
+    backend = LocalTTSBackend(latency=0.01, jitter=0)
+    voice = "ar-EG-SalmaNeural"
+
+    async def build():
+        return await asyncio.gather(
+            synthesize_segments(["شكرا", "مرحبا", "شكرا"], voice, cache, backend),
+            synthesize_segments(["مرحبا", "نعم"], voice, cache, backend),
+            synthesize_segments(["نعم", "شكرا"], voice, cache, backend))
+
+    first, second, third = asyncio.run(build())
+    assert backend.requests == 3
+    assert cache.shared == 4 and not cache.in_flight
+    assert first[0].path == first[2].path == third[1].path
+    assert first[1].path == second[0].path and second[1].path == third[0].path
+
+
+def test_scripts_speak_duplicates_found_over_the_whole_corpus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    corpus = load_corpus()
+    # What the phrase scripts do: build a few days without passing the corpus
+    target = day_target(17, corpus.day_phrases(17), str(tmp_path))
+    asyncio.run(build_targets([target], text_only=True))
+    assert target.spoken == spoken_texts(corpus)
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code, cwd=ROOT):
+    """Names of the modules loaded by running code in a fresh interpreter"""
+    result = subprocess.run([sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+                            cwd=cwd, env={**os.environ, "PYTHONPATH": ROOT},
+                            capture_output=True, text=True, check=True)
+    # The module names are printed last, after anything code printed
+    return set(result.stdout.splitlines()[-1].split())
+
+
+@pytest.mark.parametrize("module", ["arabic_phrases_days_01_07", "arabic_phrases_supplementary",
+                                    "arabic_pathways.phrases"])
+def test_phrase_data_imports_without_tts_machinery(module):
+    modules = loaded_modules(f"import {module}")
+    assert not modules & {"edge_tts", "aiohttp", "asyncio", "arabic_pathways.build"}
+    if module.startswith("arabic_phrases"):
+        # No data file is read, and phrases are not normalized, until needed
+        assert not modules & {"json", "arabic_pathways.normalize"}
+
+
+def test_edge_tts_is_only_loaded_for_the_edge_backend():
+    modules = loaded_modules("from arabic_pathways.tts import create_backend\n"
+                             "import arabic_pathways.build\n"
+                             "create_backend('local')")
+    assert "edge_tts" not in modules and "aiohttp" not in modules
+
+
+def test_text_only_build_does_not_load_edge_tts(tmp_path):
+    modules = loaded_modules("from arabic_pathways.__main__ import main\n"
+                             "assert main(['build', '--text-only', '--days', '1-2', "
+                             "'--supplementary', 'none', '--output-dir', 'out']) == 0",
+                             cwd=tmp_path)
+    assert "edge_tts" not in modules and "aiohttp" not in modules
+    assert (tmp_path / "out" / "text_files" / "day2_en.txt").exists()
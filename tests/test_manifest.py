@@ -0,0 +1,30 @@
+from arabic_pathways.manifest import BuildManifest, audio_digest, text_digest
+
+
+def test_manifest_skips_only_unchanged_existing_outputs(tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    output = tmp_path / "day1_ar.txt"
+    phrases = {"Greetings": [{"ar": "مرحبا", "transliteration": "Marhaba", "en": "Hello"}]}
+    digest = text_digest(phrases, "ar")
+
+    manifest = BuildManifest(manifest_path)
+    assert not manifest.is_fresh(str(output), digest)
+    output.write_text("مرحبا\n", encoding="utf-8")
+    manifest.record(str(output), digest)
+    manifest.save()
+
+    reloaded = BuildManifest(manifest_path)
+    assert reloaded.is_fresh(str(output), digest)
+    assert not reloaded.is_fresh(str(output), text_digest(phrases, "en"))
+    assert not BuildManifest(manifest_path, force=True).is_fresh(str(output), digest)
+
+    output.unlink()
+    assert not reloaded.is_fresh(str(output), digest)
+
+
+def test_audio_digest_depends_on_voice_and_texts():
+    texts = ["مرحبا،", "شكرا،"]
+    assert audio_digest(texts, "ar-EG-SalmaNeural") == \
+        audio_digest(list(texts), "ar-EG-SalmaNeural")
+    assert audio_digest(texts, "ar-EG-SalmaNeural") != audio_digest(texts, "ar-SA-HamedNeural")
+    assert audio_digest(texts, "ar-EG-SalmaNeural") != audio_digest(texts[:1], "ar-EG-SalmaNeural")
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from arabic_pathways import mp3
+from arabic_pathways.audio_writer import StreamingWriter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def id3v2_tag(body):
+    size = len(body)
+    syncsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + syncsafe + body
+
+
+def xing_frame():
+    # MPEG-2 mono: 9 bytes of side information follow the header
+    frame = bytearray(mp3.silent_frame())
+    frame[4 + 9:4 + 13] = b"Info"
+    return bytes(frame)
+
+
+def test_parse_header_of_tts_frames():
+    header = mp3.parse_header(mp3.FRAME_HEADER, 0)
+    assert (header.version, header.layer, header.bitrate, header.sample_rate) == \
+        (mp3.MPEG2, 3, 48000, 24000)
+    assert (header.channels, header.samples, header.length) == (1, 576, mp3.FRAME_SIZE)
+
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz, padded, stereo
+    header = mp3.parse_header(bytes([0xFF, 0xFB, 0x92, 0x00]), 0)
+    assert (header.version, header.bitrate, header.sample_rate) == (mp3.MPEG1, 128000, 44100)
+    assert (header.samples, header.length, header.channels) == (1152, 418, 2)
+
+    assert mp3.parse_header(b"ID3\x04", 0) is None
+    assert mp3.parse_header(bytes([0xFF, 0xF3, 0xF4, 0xC4]), 0) is None  # bad bitrate
+
+
+def test_scan_skips_tags_info_frames_and_junk():
+    frames = mp3.silent_frame() * 5
+    data = id3v2_tag(b"\x00" * 20) + xing_frame() + frames[:288] + b"junk" + frames[288:] \
+        + b"TAG" + bytes(125)
+    info = mp3.scan(data)
+
+    assert info.id3v2_end == 30
+    assert info.frames == 5
+    assert info.duration_ms == 5 * mp3.FRAME_MS
+    assert b"".join(data[start:end] for start, end in info.runs) == frames
+
+
+def test_concat_joins_frames_and_keeps_only_first_tag(tmp_path):
+    first, second = tmp_path / "a.mp3", tmp_path / "b.mp3"
+    tag = id3v2_tag(b"\x00" * 20)
+    first.write_bytes(tag + xing_frame() + mp3.silent_frame() * 3)
+    second.write_bytes(tag + xing_frame() + mp3.silent_frame() * 2)
+
+    with StreamingWriter(str(tmp_path / "out.mp3")) as writer:
+        frames, duration, gap = mp3.concat(writer, [str(first), str(second)])
+
+    assert (frames, duration, gap) == (5, 5 * mp3.FRAME_MS, 0)
+    assert (tmp_path / "out.mp3").read_bytes() == tag + mp3.silent_frame() * 5
+
+
+def test_silence_matches_format_and_rounds_to_whole_frames():
+    assert mp3.silence(500) == mp3.silent_frame() * 21  # 504 ms
+    assert mp3.silence(500) is mp3.silence(500)
+    assert mp3.silence(0) == b""
+
+    # 44.1 kHz MPEG-1 with CRC and padding: silence drops both
+    header = bytes([0xFF, 0xFA, 0x92, 0x00])
+    frame = mp3.parse_header(mp3.silence(100, header), 0)
+    assert (frame.sample_rate, frame.padding, frame.protected) == (44100, 0, False)
+    assert len(mp3.silence(100, header)) == 4 * 417
+
+
+def test_concat_inserts_gaps_between_files(tmp_path):
+    paths = []
+    for name in ["a", "b", "c"]:
+        path = tmp_path / f"{name}.mp3"
+        path.write_bytes(mp3.silent_frame() * 2)
+        paths.append(str(path))
+
+    with StreamingWriter(str(tmp_path / "out.mp3")) as writer:
+        frames, duration, gap = mp3.concat(writer, paths, gap_ms=100)
+
+    assert gap == 96
+    assert (frames, duration) == (6 + 2 * 4, 6 * 24 + 2 * 96)
+    assert writer.size == frames * mp3.FRAME_SIZE
+
+
+def test_concat_rejects_mismatched_streams(tmp_path):
+    low, high = tmp_path / "low.mp3", tmp_path / "high.mp3"
+    low.write_bytes(mp3.silent_frame())
+    high.write_bytes(bytes([0xFF, 0xFB, 0x90, 0xC0]) + bytes(413))  # 44.1 kHz
+
+    with pytest.raises(ValueError):
+        with StreamingWriter(str(tmp_path / "out.mp3")) as writer:
+            mp3.concat(writer, [str(low), str(high)])
+    assert not (tmp_path / "out.mp3").exists()
+
+
+def test_split_pieces_do_not_reach_into_the_previous_piece():
+    # edge-tts output: nearly every frame starts its audio in the bit reservoir
+    with open(os.path.join(ROOT, "audio_files", "day1_ar.mp3"), "rb") as f:
+        data = f.read()
+    pieces = mp3.split(data, [1000, 5000, 9000, 12000])
+    assert sum(mp3.scan(bytes(piece)).frames for piece, _ in pieces) == mp3.scan(data).frames
+    for piece, _ in pieces:
+        piece = bytes(piece)
+        frames = list(mp3.iter_frames(piece))
+        assert mp3.main_data_begin(piece, *frames[0]) == 0
+        available = 0
+        for offset, header in frames:
+            assert mp3.main_data_begin(piece, offset, header) <= available
+            available += mp3.main_data_size(header)
+    # Only a frame or two at each cut is silenced; everything else is untouched
+    start, end = mp3.scan(data).runs[0]
+    joined = b"".join(bytes(piece) for piece, _ in pieces)
+    changed = sum(joined[i:i + mp3.FRAME_SIZE] != data[start + i:start + i + mp3.FRAME_SIZE]
+                  for i in range(0, end - start, mp3.FRAME_SIZE))
+    assert len(joined) == end - start and 4 <= changed <= 8
@@ -0,0 +1,64 @@
+from arabic_pathways.corpus import Corpus, Phrase
+from arabic_pathways.normalize import (arabic_pass, latin_pass, normalize_all, normalize_arabic,
+                                       normalize_latin, normalize_text)
+from arabic_pathways.search import SearchIndex
+from arabic_pathways.store import PhraseStore
+
+
+def test_arabic_spelling_variants_are_unified():
+    assert normalize_arabic("أحمد") == normalize_arabic("إحمد") == normalize_arabic("احمد")
+    assert normalize_arabic("آمن") == "امن"
+    assert normalize_arabic("مع السلامة") == normalize_arabic("مع السلامه")
+    assert normalize_arabic("على") == "علي"
+    assert normalize_arabic("جـمـيـل") == "جميل"
+    assert normalize_arabic("مَعَ الشُّكْرِ") == "مع الشكر"
+    assert normalize_arabic("كيف حالك؟  ") == "كيف حالك"
+
+
+def test_latin_forms_fold_case_accents_and_apostrophes():
+    assert normalize_latin("Ma'a as-Salāma!") == "maa as salama"
+    assert normalize_latin("ʿAmal") == "amal"
+    assert normalize_text("مَعَ Salāma") == "مع salama"
+
+
+def test_queries_keep_hamza_on_waw_and_yaa():
+    for text in ["لدي سؤال", "رئيس", "مَسْؤُول"]:
+        assert normalize_text(text) == normalize_arabic(text)
+
+
+def test_normalize_all_matches_one_text_at_a_time():
+    texts = ["مَعَ السَّلامَة", "", "أهلاً وسهلاً!", "على الطاولة"]
+    assert normalize_all(texts) == [normalize_arabic(text) for text in texts]
+    latin = ["Ahlan wa sahlan", "Ma'a as-salāma"]
+    assert normalize_all(latin, latin_pass) == [normalize_latin(text) for text in latin]
+    # A text containing the separator falls back to per-text normalization
+    assert normalize_all(["a\nb", "ج"], arabic_pass) == ["a\nb", "ج"]
+
+
+def test_corpus_caches_normalized_forms():
+    phrase = Phrase(1, None, "Greetings", "مع السلامة", "Ma'a as-salama", "Goodbye")
+    corpus = Corpus([phrase])
+    assert phrase.cached_normalized == ("مع السلامه", "maa as salama", "goodbye")
+    assert corpus.phrases[0].normalized is phrase.cached_normalized
+    # Records without a corpus compute the forms on first use
+    assert Phrase(1, None, "x", "إلى", "Ila", "To").normalized == ("الي", "ila", "to")
+
+
+def test_store_search_ignores_spelling_variants(tmp_path):
+    phrases = [Phrase(1, None, "Greetings", "مع السلامة", "Ma'a as-salama", "Goodbye"),
+               Phrase(2, None, "Travel", "أذهب إلى المطار", "Adhhab ila al-matar", "I go")]
+    with PhraseStore.open(str(tmp_path / "phrases.db"), Corpus(phrases)) as store:
+        assert [p.en for p in store.search("السلامه")] == ["Goodbye"]
+        assert [p.en for p in store.search("اذهب الي")] == ["I go"]
+        assert [p.en for p in store.search("maa")] == ["Goodbye"]
+
+
+def test_hamza_on_waw_and_yaa_is_found_by_store_and_index(tmp_path):
+    phrases = [Phrase(26, None, "Questions", "لدي سؤال", "Ladayya su'al", "I have a question"),
+               Phrase(21, None, "At Work", "الرئيس", "Ar-ra'is", "the boss")]
+    corpus = Corpus(phrases)
+    index = SearchIndex.build(corpus)
+    with PhraseStore.open(str(tmp_path / "phrases.db"), corpus) as store:
+        for query, en in [("سؤال", "I have a question"), ("الرئيس", "the boss")]:
+            assert [p.en for p in store.search(query)] == [en]
+            assert [match.phrase.en for match in index.search(query)] == [en]
@@ -0,0 +1,41 @@
+import pytest
+
+from arabic_pathways import phrase_data
+from arabic_pathways.phrase_data import (LazyPhrases, available_days, available_sections,
+                                         iter_phrases, lazy_attributes, load_day)
+
+
+def test_data_files_cover_the_curriculum():
+    assert available_days() == list(range(1, 41))
+    assert available_sections() == ["education", "hobbies", "emotions", "daily_life",
+                                     "comparisons"]
+
+
+def test_iter_phrases_reads_only_the_requested_days(monkeypatch):
+    read = []
+    original = phrase_data.read_json
+    monkeypatch.setattr(phrase_data, "read_json", lambda path: read.append(path) or original(path))
+
+    phrases = iter_phrases(days=[20], sections=[])
+    assert read == []  # nothing is read until iteration starts
+    first = next(phrases)
+    assert (first.day, first.section) == (20, None)
+    assert read == [phrase_data.day_path(20)]
+
+    assert all(phrase.day == 20 for phrase in phrases)
+    assert read == [phrase_data.day_path(20)]
+
+
+def test_lazy_phrases_read_each_file_on_first_use(monkeypatch):
+    read = []
+    original = phrase_data.read_json
+    monkeypatch.setattr(phrase_data, "read_json", lambda path: read.append(path) or original(path))
+
+    phrases = LazyPhrases(load_day, [3, 4])
+    attribute = lazy_attributes(phrases, {"day4_phrases": 4})
+    assert list(phrases) == [3, 4] and 5 not in phrases and read == []
+    assert attribute("day4_phrases") is phrases[4]
+    assert read == [phrase_data.day_path(4)]
+    assert phrases.keys() == [3, 4] and len(read) == 1
+    with pytest.raises(AttributeError):
+        attribute("day5_phrases")
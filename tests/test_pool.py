@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from arabic_pathways.pool import ConnectionPool
+from arabic_pathways.tts import LocalTTSBackend
+
+
+def make_pool(size, idle_timeout=30.0):
+    opened, closed = [], []
+
+    async def open_connection():
+        opened.append(len(opened))
+        return opened[-1]
+
+    async def close_connection(connection):
+        closed.append(connection)
+
+    return ConnectionPool(open_connection, close_connection, size, idle_timeout), closed
+
+
+def test_pool_reuses_idle_connections_and_bounds_open_ones():
+    pool, _ = make_pool(2)
+
+    async def request():
+        async with pool.connection():
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(main())
+    assert (pool.opened, pool.reused, pool.peak_open) == (2, 4, 2)
+    assert (pool.open, len(pool.idle)) == (2, 2)
+
+
+def test_pool_closes_failed_and_expired_connections():
+    pool, closed = make_pool(1, idle_timeout=0)
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            async with pool.connection():
+                raise ConnectionError("reset")
+        async with pool.connection():
+            pass
+        await asyncio.sleep(0.01)
+        async with pool.connection():  # the idle one has expired
+            pass
+        await pool.close()
+
+    asyncio.run(main())
+    assert closed == [0, 1, 2]
+    assert (pool.opened, pool.reused, pool.open) == (3, 0, 0)
+
+
+def test_local_backend_only_pays_handshakes_for_new_connections():
+    backend = LocalTTSBackend(latency=0, handshake=0.01, pool_size=2)
+
+    async def main():
+        for _ in range(5):
+            [chunk async for chunk in backend.stream("مرحبا", "ar-EG-SalmaNeural")]
+        await backend.close()
+
+    asyncio.run(main())
+    assert (backend.requests, backend.pool.opened, backend.pool.reused) == (5, 1, 4)
+
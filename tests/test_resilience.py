@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from arabic_pathways.resilience import ResilientBackend, RetryPolicy, TokenBucket
+from arabic_pathways.tts import LocalTTSBackend, LocalTTSError, TTSBackend
+
+
+async def collect(backend, text="Good morning."):
+    return [chunk async for chunk in backend.stream(text, "en-US-JennyNeural")]
+
+
+def test_token_bucket_paces_requests():
+    async def run():
+        bucket = TokenBucket(rate=100, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert 0.04 <= asyncio.run(run()) < 0.5
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(attempts=10, base_delay=0.5, max_delay=4.0, seed=3)
+    delays = [policy.delay(attempt) for attempt in range(10)]
+    assert all(0 <= d <= min(4.0, 0.5 * 2 ** n) for n, d in enumerate(delays))
+    assert len(set(delays)) == len(delays)
+
+
+def test_retries_transient_failures():
+    inner = LocalTTSBackend(latency=0, failure_rate=0.5, seed=11)
+    backend = ResilientBackend(inner, RetryPolicy(attempts=20, base_delay=0, seed=1))
+    for _ in range(10):
+        chunks = asyncio.run(collect(backend))
+        assert any(c["type"] == "audio" for c in chunks)
+    assert backend.retries == inner.failures > 0
+    assert backend.failures == 0
+
+
+def test_gives_up_after_last_attempt():
+    backend = ResilientBackend(LocalTTSBackend(latency=0, failure_rate=1.0, seed=1),
+                               RetryPolicy(attempts=3, base_delay=0))
+    with pytest.raises(LocalTTSError):
+        asyncio.run(collect(backend))
+    assert (backend.retries, backend.failures) == (2, 1)
+
+
+def test_times_out_slow_requests():
+    backend = ResilientBackend(LocalTTSBackend(latency=1.0, jitter=0),
+                               RetryPolicy(attempts=2, base_delay=0), timeout=0.05)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(collect(backend))
+    assert backend.timeouts == 2
+
+
+def test_does_not_retry_programming_errors():
+    class Broken(TTSBackend):
+        name = "broken"
+
+        async def stream(self, text, voice, rate="+0%", pitch="+0Hz"):
+            self.requests += 1
+            raise ValueError("invalid voice")
+            yield  # pylint: disable=unreachable
+
+    inner = Broken()
+    with pytest.raises(ValueError):
+        asyncio.run(collect(ResilientBackend(inner, RetryPolicy(attempts=5, base_delay=0))))
+    assert inner.requests == 1
@@ -0,0 +1,50 @@
+import asyncio
+
+from arabic_pathways.scheduler import JobResult, percentile, print_report, run_jobs
+
+
+def test_run_jobs_respects_concurrency_limit():
+    in_flight = 0
+    peak = 0
+
+    async def job():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    jobs = [(f"job {i}", job) for i in range(10)]
+    results, wall = asyncio.run(run_jobs(jobs, 3))
+
+    assert peak == 3
+    assert [r.label for r in results] == [f"job {i}" for i in range(10)]
+    assert all(r.ok for r in results)
+    assert wall < sum(r.elapsed for r in results)
+
+
+def test_run_jobs_records_failures_without_stopping():
+    async def ok():
+        return None
+
+    async def boom():
+        raise RuntimeError("websocket closed")
+
+    results, _ = asyncio.run(run_jobs([("a", ok), ("b", boom), ("c", ok)], 2))
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert str(results[1].error) == "websocket closed"
+
+
+def test_percentile():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3, 1, 2], 0.5) == 2
+    assert percentile(list(range(1, 101)), 0.95) == 95
+
+
+def test_report_does_not_invent_a_serial_run(capsys):
+    results = [JobResult("a", 2.0), JobResult("b", 2.0)]
+    print_report(results, 2.0, 1)
+    assert capsys.readouterr().out.endswith("Wall clock 2.00s\n")
+    print_report(results, 2.0, 2)
+    assert "speedup over --jobs 1 at most 2.00x" in capsys.readouterr().out
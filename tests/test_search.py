@@ -0,0 +1,99 @@
+import random
+
+from arabic_pathways.__main__ import main
+from arabic_pathways.corpus import Corpus, Phrase
+from arabic_pathways.normalize import normalize_latin
+from arabic_pathways.search import SearchIndex, trigrams
+
+PHRASES = [
+    Phrase(1, None, "Greetings", "مع السلامة", "Ma'a as-salama", "Goodbye"),
+    Phrase(1, None, "Greetings", "السلام عليكم", "As-salamu alaykum", "Peace be upon you"),
+    Phrase(21, None, "At Work", "مكتب", "Maktab", "office"),
+    Phrase(25, None, "Remote Work", "العمل عن بعد", "Al-'amal 'an bu'd", "remote work"),
+    Phrase(25, None, "Remote Work", "العمل من المنزل", "Al-'amal min al-manzil", "work from home"),
+    Phrase(None, "daily_life", "Routine", "أذهب إلى العمل", "Adhhab ila al-'amal", "I go to work"),
+]
+
+
+def ranked(matches):
+    return [match.phrase.en for match in matches]
+
+
+def test_search_ranks_by_words_matched_then_score():
+    index = SearchIndex.build(Corpus(PHRASES))
+    assert ranked(index.search("السلامه")) == ["Goodbye"]
+    # Both words beat one word; the shorter of the equal matches comes first
+    assert ranked(index.search("work from")) == ["work from home", "remote work", "I go to work"]
+    matches = index.search("amal", limit=2)
+    assert ranked(matches) == ["remote work", "work from home"]
+    assert matches[0].fields == ["transliteration"] and matches[0].matched == 1
+
+
+def test_search_scope_and_prefix():
+    index = SearchIndex.build(Corpus(PHRASES))
+    assert ranked(index.search("work", days=[25])) == ["remote work", "work from home"]
+    assert ranked(index.search("work", sections=["daily_life"])) == ["I go to work"]
+    assert ranked(index.search("salam")) == []
+    assert ranked(index.search("salam", prefix=True)) == ["Goodbye", "Peace be upon you"]
+
+
+def test_index_is_persisted_and_rebuilt_when_stale(tmp_path):
+    path = str(tmp_path / "index.pickle")
+    assert not SearchIndex.load(Corpus(PHRASES), path).from_cache
+    cached = SearchIndex.load(Corpus(PHRASES), path)
+    assert cached.from_cache
+    assert ranked(cached.search("office")) == ["office"]
+
+    changed = [*PHRASES[:2], Phrase(21, None, "At Work", "مكتب", "Maktab", "desk")]
+    index = SearchIndex.load(Corpus(changed), path)
+    assert not index.from_cache
+    assert ranked(index.search("office")) == []
+
+
+def test_search_command(tmp_path, capsys):
+    assert main(["search", "مع السلامة", "--index", str(tmp_path / "index.pickle")]) == 0
+    first = capsys.readouterr().out.splitlines()[0]
+    assert first.startswith("  1. Day 1 · ") and "Goodbye" in first
+
+
+def test_fuzzy_finds_misspelled_transliterations():
+    index = SearchIndex.build(Corpus(PHRASES))
+    assert ranked(index.fuzzy("maa salaama")) == ["Goodbye"]
+    matches = index.fuzzy("al amal min almanzel", limit=2)
+    assert ranked(matches) == ["work from home", "remote work"]
+    assert matches[0].score > matches[1].score >= 0.4
+    assert ranked(index.fuzzy("al amal", days=[25, 26])) == ["remote work", "work from home"]
+    assert index.fuzzy("xyz") == []
+
+
+def linear_fuzzy(phrases, query, min_similarity=0.4):
+    """Similarities of every phrase reaching min_similarity, as a linear scan computes them"""
+    grams = trigrams(normalize_latin(query))
+    scores = [2 * len(grams & trigrams(p.normalized[1]))
+              / (len(grams) + len(trigrams(p.normalized[1]))) for p in phrases]
+    return sorted((score for score in scores if score >= min_similarity), reverse=True)
+
+
+def test_fuzzy_keeps_spellings_exactly_at_the_threshold():
+    phrases = [Phrase(1, None, "Words", "با", "ba", "ba"),
+               Phrase(2, None, "Words", "كيف", "kayfa", "how"),
+               Phrase(3, None, "Words", "مشكلة", "mushkila", "problem")]
+    index = SearchIndex.build(Corpus(phrases))
+    for query, word in [("ba mushkslc", "ba"), ("kayfa fgil ila akematar?", "how")]:
+        matches = index.fuzzy(query, 0)
+        assert word in ranked(matches)
+        assert [m.score for m in matches] == linear_fuzzy(phrases, query)
+
+
+def test_fuzzy_ranking_matches_a_linear_scan():
+    rng = random.Random(3)
+    words = ["al", "amal", "salama", "marhaba", "shukran", "kayfa", "haluk", "bayt", "kitab"]
+    phrases = [Phrase(day, None, "Words", "كلمة", " ".join(rng.sample(words, rng.randint(1, 4))),
+                      f"phrase {day}") for day in range(1, 301)]
+    index = SearchIndex.build(Corpus(phrases))
+    assert any(isinstance(entries, int) for entries in index.grams.values())  # bitsets in use
+
+    for query in ["salama al", "kayfa halak", "marhaba bayt kitab", "shukran"]:
+        expected = linear_fuzzy(phrases, query)[:20]
+        assert [round(m.score, 9) for m in index.fuzzy(query, limit=20)] == \
+            [round(score, 9) for score in expected]
@@ -0,0 +1,44 @@
+import os
+
+from arabic_pathways import mp3
+from arabic_pathways.segment_cache import SegmentCache, segment_key
+
+
+def test_segment_key_covers_every_synthesis_input():
+    base = segment_key("مرحبا", "ar-EG-SalmaNeural")
+    assert base == segment_key("مرحبا", "ar-EG-SalmaNeural", "+0%", "+0Hz")
+    assert base != segment_key("مرحبا!", "ar-EG-SalmaNeural")
+    assert base != segment_key("مرحبا", "ar-SA-HamedNeural")
+    assert base != segment_key("مرحبا", "ar-EG-SalmaNeural", rate="-10%")
+    assert base != segment_key("مرحبا", "ar-EG-SalmaNeural", pitch="+5Hz")
+    assert base != segment_key("مرحبا", "ar-EG-SalmaNeural",
+                               output_format="riff-24khz-16bit-mono-pcm")
+
+
+def test_cache_counts_hits_misses_and_bytes(tmp_path):
+    cache = SegmentCache(str(tmp_path))
+    key = segment_key("Hello.", "en-US-JennyNeural")
+
+    audio = mp3.silent_frame() * 42  # 1008 ms
+
+    assert cache.get(key) is None
+    cache.put(key, audio, words=[[100, 300, "Hello."]])
+    assert cache.get(key) == audio
+
+    assert (cache.hits, cache.misses, cache.bytes_written) == (1, 1, len(audio))
+    assert cache.disk_usage() == len(audio) + len(open(cache.meta_path(key), "rb").read())
+    assert list(tmp_path.glob("*/*.tmp")) == []
+
+    segment = cache.load(key)
+    assert segment.words == [[100, 300, "Hello."]]
+    assert segment.duration_ms == 1008
+    assert segment.speech_span() == (100, 400)
+
+
+def test_segment_without_timings_is_a_miss(tmp_path):
+    cache = SegmentCache(str(tmp_path))
+    key = segment_key("Hello.", "en-US-JennyNeural")
+    cache.put(key, b"\xff\xf3" * 10)
+    os.remove(cache.meta_path(key))
+
+    assert cache.load(key) is None
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from arabic_pathways.__main__ import main
+from arabic_pathways.corpus import Corpus, Phrase
+from arabic_pathways.store import PhraseStore, match_expression, search_form
+
+PHRASES = [
+    Phrase(1, None, "Greetings", "مع السلامة", "Ma'a as-salama", "Goodbye"),
+    Phrase(1, None, "Greetings", "مَعَ الشُّكْر", "Ma'a ash-shukr", "With thanks"),
+    Phrase(21, None, "At Work", "مكتب", "Maktab", "office"),
+    Phrase(25, None, "Remote Work", "العمل عن بعد", "Al-'amal 'an bu'd", "remote work"),
+    Phrase(None, "daily_life", "Routine", "أذهب إلى العمل", "Adhhab ila al-'amal", "I go to work"),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with PhraseStore.open(str(tmp_path / "phrases.db"), Corpus(PHRASES)) as phrase_store:
+        yield phrase_store
+
+
+def test_search_ignores_harakat(store):
+    assert search_form("مَعَ") == "مع"
+    assert [phrase.en for phrase in store.search("مع")] == ["Goodbye", "With thanks"]
+
+
+def test_search_by_days_section_and_field(store):
+    assert [p.en for p in store.search("work")] == ["office", "remote work", "I go to work"]
+    assert [p.en for p in store.search("work", days=list(range(20, 31)))] == [
+        "office", "remote work"]
+    assert [p.en for p in store.search("work", sections=["daily_life"])] == ["I go to work"]
+    assert [p.en for p in store.search("work", field="en")] == ["remote work", "I go to work"]
+    assert [p.en for p in store.search("wor", prefix=True, limit=1)] == ["office"]
+
+
+def test_phrases_by_day_and_category(store):
+    assert [p.ar for p in store.phrases(days=[1])] == ["مع السلامة", "مَعَ الشُّكْر"]
+    assert store.phrases(days=[25], category="Remote Work")[0].transliteration == \
+        "Al-'amal 'an bu'd"
+
+
+def test_open_reexports_a_stale_store(tmp_path):
+    path = str(tmp_path / "phrases.db")
+    PhraseStore.open(path, Corpus(PHRASES[:1])).close()
+    with PhraseStore.open(path, Corpus(PHRASES)) as store:
+        assert len(store.phrases()) == len(PHRASES)
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT count(*) FROM phrase_search").fetchone() == (len(PHRASES),)
+
+
+def test_match_expression_quotes_user_input():
+    # Punctuation (including FTS5 syntax) is normalized away before quoting
+    assert match_expression('say "hi" OR', field="en", prefix=True) == 'en : ("say"* "hi"* "or"*)'
+    with pytest.raises(ValueError):
+        match_expression("  ")
+    with pytest.raises(ValueError):
+        match_expression('"?!')
+
+
+def test_query_command_rejects_a_query_without_words(tmp_path):
+    with pytest.raises(SystemExit, match="no words to search for"):
+        main(["query", "؟", "--db", str(tmp_path / "phrases.db")])
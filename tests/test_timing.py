@@ -0,0 +1,40 @@
+import json
+
+from arabic_pathways.segment_cache import Segment
+from arabic_pathways.timing import format_vtt_time, phrase_timings, write_timing_index
+
+
+def test_phrase_timings_accumulate_segment_durations():
+    # 6000 bytes of 48 kbps audio last one second
+    segments = [
+        Segment("a.mp3", 6000, [[100, 300, "مرحبا"]]),
+        Segment("b.mp3", 12000, [[50, 400, "صباح"], [500, 600, "الخير"]]),
+        Segment("c.mp3", 3000, []),
+    ]
+    timings, duration = phrase_timings(segments)
+    assert timings == [(100, 400), (1050, 2100), (3000, 3500)]
+    assert duration == 3500
+
+    timings, duration = phrase_timings(segments, gaps_ms=[250, 250, 0])
+    assert timings == [(100, 400), (1300, 2350), (3500, 4000)]
+    assert duration == 4000
+
+
+def test_format_vtt_time():
+    assert format_vtt_time(0) == "00:00:00.000"
+    assert format_vtt_time(3_723_045) == "01:02:03.045"
+
+
+def test_write_timing_index(tmp_path):
+    json_path, vtt_path = tmp_path / "day1_ar.timings.json", tmp_path / "day1_ar.vtt"
+    entries = [("Greetings", "مرحبا"), ("Greetings", "شكرا")]
+    write_timing_index(str(json_path), str(vtt_path), "audio_files/day1_ar.mp3", entries,
+                       [(100, 400), (700, 1200)], 1500)
+
+    index = json.loads(json_path.read_text(encoding="utf-8"))
+    assert index["audio"] == "day1_ar.mp3"
+    assert index["phrases"][1] == {"category": "Greetings", "text": "شكرا",
+                                   "start_ms": 700, "end_ms": 1200}
+    assert vtt_path.read_text(encoding="utf-8") == (
+        "WEBVTT\n\n1\n00:00:00.100 --> 00:00:00.400\nمرحبا\n"
+        "\n2\n00:00:00.700 --> 00:00:01.200\nشكرا\n")
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from arabic_pathways import mp3
+from arabic_pathways.tts import LocalTTSBackend, LocalTTSError, create_backend
+
+
+async def collect(backend, text):
+    return [chunk async for chunk in backend.stream(text, "ar-EG-SalmaNeural")]
+
+
+def test_local_backend_streams_frames_and_word_boundaries():
+    backend = LocalTTSBackend(latency=0, seed=1)
+    chunks = asyncio.run(collect(backend, "صباح الخير"))
+
+    words = [c["text"] for c in chunks if c["type"] == "WordBoundary"]
+    audio = b"".join(c["data"] for c in chunks if c["type"] == "audio")
+
+    assert words == ["صباح", "الخير"]
+    assert len(audio) % mp3.FRAME_SIZE == 0
+    assert audio[:4] == mp3.FRAME_HEADER
+    assert audio[:mp3.FRAME_SIZE] == mp3.silent_frame()
+    assert backend.requests == 1
+
+
+def test_local_backend_failure_rate_is_reproducible():
+    def failures(seed):
+        backend = LocalTTSBackend(latency=0, failure_rate=0.5, seed=seed)
+        outcomes = []
+        for _ in range(20):
+            try:
+                asyncio.run(collect(backend, "Hello there."))
+                outcomes.append(True)
+            except LocalTTSError:
+                outcomes.append(False)
+        return outcomes, backend.failures
+
+    first, count = failures(7)
+    assert (first, count) == failures(7)
+    assert 0 < count < 20
+
+
+def test_create_backend_rejects_unknown_names():
+    assert create_backend("local", latency=0).name == "local"
+    with pytest.raises(ValueError):
+        create_backend("nope")
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import threading
+import time
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import video_search
+from arabic_pathways.response_cache import ResponseCache, request_key
+from video_search import (QuotaExceeded, QuotaScheduler, YouTubeClient, affordable_topics,
+                          find_videos, missing_topics, search_youtube_video, topic_cost)
+
+
+class FakeResource:
+    def __init__(self, youtube, respond):
+        self.youtube = youtube
+        self.respond = respond
+
+    def list(self, **params):
+        return FakeRequest(self.youtube, self.respond, params)
+
+
+class FakeRequest:
+    def __init__(self, youtube, respond, params):
+        self.youtube = youtube
+        self.respond = respond
+        self.params = params
+        self.headers = {}
+        self.callbacks = []
+
+    def add_response_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def execute(self, http=None):
+        youtube = self.youtube
+        with youtube.lock:
+            youtube.calls.append(self.params)
+            youtube.active += 1
+            youtube.peak = max(youtube.peak, youtube.active)
+        time.sleep(youtube.latency)
+        with youtube.lock:
+            youtube.active -= 1
+        resp = httplib2.Response({"status": 200, "etag": youtube.etag})
+        if self.headers.get("If-None-Match") == youtube.etag:
+            resp.status = 304
+            raise HttpError(resp, b"")
+        for callback in self.callbacks:
+            callback(resp)
+        return self.respond(self.params)
+
+
+class FakeYouTube:
+    """Stands in for the API client: every topic finds two videos, one preferred"""
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.etag = '"v1"'
+        # Video IDs every search finds besides its own two
+        self.shared = []
+
+    def search(self):
+        return FakeResource(self, lambda params: {"items": [
+            {"id": {"videoId": video_id}}
+            for video_id in [f"{params['q']}#{n}" for n in range(2)] + self.shared]})
+
+    def videos(self):
+        return FakeResource(self, lambda params: {"items": [
+            fake_video(video_id) for video_id in params["id"].split(",")]})
+
+
+def fake_video(video_id):
+    """IDs ending in 0 are popular elsewhere, others are from a preferred channel;
+    "popular" videos are both"""
+    if video_id.startswith("popular"):
+        views, channel = "10000000", "Easy Arabic"
+    elif video_id.endswith("0"):
+        views, channel = "900", "Somebody"
+    else:
+        views, channel = "100", "Easy Arabic"
+    return {"id": video_id, "contentDetails": {"duration": "PT5M"},
+            "statistics": {"viewCount": views}, "snippet": {"channelTitle": channel}}
+
+
+def test_search_prefers_channels_then_views():
+    youtube = FakeYouTube(latency=0)
+    client = YouTubeClient(youtube)
+    video_id = asyncio.run(search_youtube_video(client, "arabic numbers"))
+    client.close()
+    assert video_id.endswith("#1")
+    assert [call.get("id") for call in youtube.calls] == [None, f"{video_id[:-1]}0,{video_id}"]
+
+
+def test_days_and_categories_are_searched_concurrently(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    youtube = FakeYouTube()
+    client = YouTubeClient(youtube, concurrency=8, quota=QuotaScheduler(rate=1000, path=None))
+    videos = {"day1": "kept", "day2": ""}
+    supp_videos = {}
+    topics = missing_topics(videos, supp_videos)
+    assert len(topics) == 39 + len(video_search.SUPPLEMENTARY_CATEGORIES)
+
+    start = time.perf_counter()
+    found = asyncio.run(find_videos(client, topics))
+    wall = time.perf_counter() - start
+    client.close()
+
+    # One search per topic, and the 88 candidates' details in two batches
+    assert all(found) and client.requests == len(topics) + 2
+    assert youtube.peak == 8
+    assert wall < client.requests * youtube.latency / 3
+    saved = json.loads((tmp_path / "videos.json").read_text())
+    assert saved["day1"] == "kept" and saved["day2"].endswith("#1") and len(saved) == 40
+    assert set(json.loads((tmp_path / "videos_supplementary.json").read_text())) == \
+        set(video_search.SUPPLEMENTARY_CATEGORIES)
+
+
+def test_quota_is_charged_per_endpoint_and_kept_for_the_day(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "quota.json")
+    quota = QuotaScheduler(budget=250, rate=1000, path=path)
+    topics = missing_topics({f"day{day}": "kept" for day in range(1, 38)}, {
+        category: "kept" for category in video_search.SUPPLEMENTARY_CATEGORIES})
+    runnable, deferred = affordable_topics(topics, quota)
+    assert len(runnable) == 2 and len(deferred) == 1
+
+    client = YouTubeClient(FakeYouTube(latency=0), quota=quota)
+    assert all(asyncio.run(find_videos(client, runnable)))
+    assert quota.spent() == 201 and quota.calls == {"search": 2, "videos": 1}
+    quota.save()
+
+    # A later run the same day starts from what is left and refuses another search
+    later = QuotaScheduler(budget=250, rate=1000, path=path)
+    assert later.remaining() == 49 and affordable_topics(deferred, later) == ([], deferred)
+    with pytest.raises(QuotaExceeded):
+        asyncio.run(YouTubeClient(FakeYouTube(), quota=later).search("anything"))
+    assert later.refused == 1 and later.spent() == 0
+
+
+def test_responses_are_cached_and_revalidated_with_etags(tmp_path):
+    assert request_key("videos", {"id": "b,a", "part": "snippet"}) == \
+        request_key("videos", {"part": "snippet", "id": "a,b"})
+    root = str(tmp_path / "responses")
+    youtube = FakeYouTube(latency=0)
+
+    def search(ttls, topic="arabic numbers"):
+        quota = QuotaScheduler(rate=1000, path=None)
+        client = YouTubeClient(youtube, quota=quota, cache=ResponseCache(root, ttls))
+        cost = topic_cost(client, topic)
+        video_id = asyncio.run(search_youtube_video(client, topic))
+        client.close()
+        return video_id, cost, quota.spent(), client.cache
+
+    # One search response and the details of its two videos
+    first, cost, spent, cache = search({"search": 3600, "videos": 3600})
+    assert (cost, spent, cache.misses) == (101, 101, 3)
+
+    # Fresh responses come from disk without any request
+    again, cost, spent, cache = search({"search": 3600, "videos": 3600})
+    assert again == first and (cost, spent, cache.hits) == (0, 0, 3) and len(youtube.calls) == 2
+
+    # A stale search is revalidated: unchanged (304), then changed on the server
+    again, _, _, cache = search({"videos": 3600})
+    assert again == first and cache.revalidated == 1 and cache.misses == 0
+    youtube.etag = '"v2"'
+    again, _, _, cache = search({"videos": 3600})
+    assert again == first and cache.revalidated == 0 and cache.misses == 1
+
+
+def test_video_details_are_batched_across_topics():
+    youtube = FakeYouTube(latency=0.01)
+    youtube.shared = [f"shared{n}0" for n in range(10)]
+    client = YouTubeClient(youtube, quota=QuotaScheduler(rate=1000, path=None))
+    topics = [({}, f"topic{n}", f"topic {n}", lambda videos: None) for n in range(30)]
+    found = asyncio.run(find_videos(client, topics))
+    client.close()
+
+    assert found == [f"learn topic {n} تعلم العربية#1" for n in range(30)]
+    batches = [call["id"].split(",") for call in youtube.calls if "id" in call]
+    requested = [video_id for batch in batches for video_id in batch]
+    # 60 own and 10 shared candidates, each requested once, 50 at a time
+    assert [len(batch) for batch in batches] == [50, 20]
+    assert len(set(requested)) == len(requested) == 70
+
+
+def test_videos_are_assigned_across_topics_to_limit_reuse(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    youtube = FakeYouTube(latency=0)
+    # Every search also finds one video that is the best match for all of them
+    youtube.shared = ["popular0"]
+    client = YouTubeClient(youtube, quota=QuotaScheduler(rate=1000, path=None))
+    videos = {f"day{day}": "kept" for day in range(6, 41)}
+    topics = missing_topics(videos, {category: "kept"
+                                     for category in video_search.SUPPLEMENTARY_CATEGORIES})
+    assert len(topics) == 5
+
+    # It scores 5 above each topic's own video: worth a second use (penalty 4), not a third (8)
+    found = asyncio.run(find_videos(client, topics))
+    assert found.count("popular0") == 2
+    assert all(video_id.endswith("#1") for video_id in found if video_id != "popular0")
+    saved = json.loads((tmp_path / "videos.json").read_text())
+    assert list(saved.values()).count("popular0") == 2
+
+    # Videos kept by topics that are not searched count as uses
+    videos = {f"day{day}": "popular0" if day < 3 else "kept" for day in range(1, 41)}
+    topics = [topic for topic in missing_topics(videos, {}, everything=True)
+              if topic[1] in ("day3", "day4")]
+    used = video_search.kept_videos(topics, videos)
+    assert used == {"popular0": 2, "kept": 36}
+    assert "popular0" not in asyncio.run(find_videos(client, topics, used=used))
+    client.close()
+
+
+def test_max_results_is_limited_to_one_search_page():
+    parser = video_search.build_parser()
+    assert parser.parse_args(["--max-results", "50"]).max_results == 50
+    for value in ["0", "51"]:
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--max-results", value])
+
+
+def test_a_malformed_search_response_does_not_hold_back_other_topics():
+    youtube = FakeYouTube(latency=0)
+    search = youtube.search
+
+    def search_without_items():
+        resource = search()
+        respond = resource.respond
+        resource.respond = lambda params: {} if params["q"].startswith("learn topic 1 ") \
+            else respond(params)
+        return resource
+
+    youtube.search = search_without_items
+    client = YouTubeClient(youtube, quota=QuotaScheduler(rate=1000, path=None))
+    topics = [({}, f"topic{n}", f"topic {n}", lambda videos: None) for n in range(3)]
+    found = asyncio.run(asyncio.wait_for(find_videos(client, topics), 5))
+    client.close()
+    assert found[1] is None and found[0].endswith("#1") and found[2].endswith("#1")
@@ -1,11 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+import argparse
+import asyncio
 import json
+import math
 import os
+import threading
 import time
 import re
 
+from arabic_pathways.assignment import DEFAULT_REUSE_PENALTY, assign, greedy, total_score
+from arabic_pathways.resilience import TokenBucket
+from arabic_pathways.response_cache import DEFAULT_CACHE_DIR, ResponseCache
+
 YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
 
+VIDEOS_PATH = 'videos.json'
+SUPPLEMENTARY_VIDEOS_PATH = 'videos_supplementary.json'
+DAYS = range(1, 41)  # 40 days as per README
+SUPPLEMENTARY_CATEGORIES = ['education', 'hobbies', 'emotions', 'daily_life', 'comparisons']
+# YouTube API requests in flight at once
+DEFAULT_CONCURRENCY = 8
+# Most video IDs one videos.list request accepts
+MAX_VIDEO_IDS = 50
+# Most results one search.list request returns (its maxResults limit)
+MAX_SEARCH_RESULTS = 50
+
+# Quota units charged per request by the YouTube Data API
+QUOTA_COSTS = {'search': 100, 'videos': 1}
+# Every topic needs one search and one videos lookup
+TOPIC_COST = QUOTA_COSTS['search'] + QUOTA_COSTS['videos']
+DEFAULT_DAILY_QUOTA = 10000
+DEFAULT_RATE_LIMIT = 20  # requests per second
+QUOTA_PATH = '.youtube_cache/quota.json'
+# The daily quota resets at midnight Pacific time
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+# Relevance of a candidate video: a 3-10 minute length outweighs a
+# preferred channel, which outweighs any difference in views (scored as
+# log10 of the view count)
+DURATION_SCORE = 100.0
+PREFERRED_SCORE = 10.0
+
+# Hours a cached response is used without asking the API whether it changed
+DEFAULT_SEARCH_TTL = 7 * 24
+DEFAULT_VIDEOS_TTL = 24
+
 def init_youtube():
     """Initialize YouTube API client"""
     return build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
@@ -91,82 +135,414 @@ PREFERRED_CHANNELS = [
     "Madinah Arabic"
 ]
 
-def search_youtube_video(youtube, query, max_results=10):
-    """Search for an Arabic video matching criteria"""
+def log(label, message):
+    """Print message, prefixed with the topic it is about"""
+    print(f"[{label}] {message}" if label else message)
+
+
+class QuotaExceeded(Exception):
+    """A request would take the day's quota spending over the budget"""
+
+
+def quota_day():
+    return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaScheduler:
+    """Charges YouTube Data API quota units against a daily budget.
+
+    Each request is charged its endpoint's cost (QUOTA_COSTS) before it is
+    sent, and takes a token from a token bucket that paces requests to
+    `rate` per second. A request that would take the day's spending over
+    the budget raises QuotaExceeded instead. Units spent are kept in
+    `path` for the current quota day, so later runs on the same day start
+    from what is left.
+    """
+
+    def __init__(self, budget=DEFAULT_DAILY_QUOTA, rate=DEFAULT_RATE_LIMIT, path=QUOTA_PATH):
+        self.budget = budget
+        self.path = path
+        self.day = quota_day()
+        self.spent_before = self.load()
+        self.units = {}
+        self.calls = {}
+        self.refused = 0
+        self.limiter = TokenBucket(rate)
+
+    def load(self):
+        """Units already spent today by earlier runs"""
+        if self.path is None or not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'r') as f:
+            ledger = json.load(f)
+        return ledger['spent'] if ledger.get('day') == self.day else 0
+
+    def save(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'day': self.day, 'spent': self.spent_today()}, f)
+
+    def spent(self):
+        """Units spent by this run"""
+        return sum(self.units.values())
+
+    def spent_today(self):
+        return self.spent_before + self.spent()
+
+    def remaining(self):
+        return max(0, self.budget - self.spent_today())
+
+    async def charge(self, endpoint):
+        """Take the cost of one `endpoint` request from the budget, then wait for its turn"""
+        cost = QUOTA_COSTS[endpoint]
+        if cost > self.remaining():
+            self.refused += 1
+            raise QuotaExceeded(f"{endpoint}.list needs {cost} units, "
+                                f"{self.remaining()} of {self.budget} left today")
+        # Charged before waiting, so concurrent requests cannot overspend together
+        self.units[endpoint] = self.units.get(endpoint, 0) + cost
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        await self.limiter.acquire()
+
+    def print_stats(self):
+        calls = ', '.join(f"{endpoint}.list {count}× {QUOTA_COSTS[endpoint]}"
+                          for endpoint, count in self.calls.items())
+        print(f"Quota: {self.spent()} units this run ({calls or 'no requests'}), "
+              f"{self.spent_today()} of {self.budget} used today, "
+              f"{self.refused} requests refused, "
+              f"{self.limiter.waited:.1f}s waiting on the rate limit")
+
+
+def search_query(topic):
+    """Add educational terms to a topic"""
+    return f"learn {topic} تعلم العربية"
+
+
+def search_params(query, max_results=10):
+    return dict(
+        q=query,
+        part='snippet',
+        type='video',
+        videoDefinition='high',
+        videoEmbeddable='true',
+        relevanceLanguage='ar',
+        maxResults=max_results
+    )
+
+
+def videos_params(video_ids):
+    return dict(
+        part='contentDetails,statistics,snippet',
+        id=','.join(video_ids)
+    )
+
+
+class YouTubeClient:
+    """Runs YouTube Data API requests on worker threads, `concurrency` at a time.
+
+    The API client's requests block, so each one is executed on a thread
+    pool while the event loop moves on to other topics. httplib2
+    connections are not thread safe, so every worker thread gets its own.
+    Every request sent is charged to `quota` (a QuotaScheduler).
+
+    With a ResponseCache, a fresh cached response is returned without any
+    request, and a stale one is revalidated with its ETag: a 304 answer
+    reuses the cached body. Video details are cached one video at a time,
+    so they can be reused whichever batch they were fetched in.
+    """
+
+    def __init__(self, youtube, concurrency=DEFAULT_CONCURRENCY, quota=None, cache=None):
+        self.youtube = youtube
+        self.quota = quota if quota is not None else QuotaScheduler(path=None)
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self.local = threading.local()
+        self.requests = 0
+
+    def http(self):
+        if not hasattr(self.local, 'http'):
+            self.local.http = build_http()
+        return self.local.http
+
+    def run(self, request):
+        """(response, ETag) of a request, with a None response for 304 Not Modified"""
+        headers = {}
+        request.add_response_callback(headers.update)
+        try:
+            response = request.execute(http=self.http())
+        except HttpError as e:
+            if e.resp.status != 304:
+                raise
+            response = None
+        return response, headers.get('etag')
+
+    def cached(self, endpoint, params):
+        """The fresh cached response to a request, or None"""
+        if self.cache is None:
+            return None
+        entry = self.cache.load(endpoint, params)
+        return entry.response if self.cache.fresh(endpoint, entry) else None
+
+    def cached_video(self, video_id):
+        """Fresh cached details of one video, or None"""
+        response = self.cached('videos', videos_params([video_id]))
+        return response['items'][0] if response and response['items'] else None
+
+    async def send(self, endpoint, params, etag=None):
+        """(response, ETag) of `endpoint`.list(**params); the response is None for a 304"""
+        request = getattr(self.youtube, endpoint)().list(**params)
+        if etag:
+            request.headers['If-None-Match'] = etag
+        await self.quota.charge(endpoint)
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.run, request)
+
+    async def execute(self, endpoint, params):
+        """Response to `endpoint`.list(**params), from the cache when it is fresh"""
+        entry = self.cache.load(endpoint, params) if self.cache is not None else None
+        if self.cache is not None and self.cache.fresh(endpoint, entry):
+            self.cache.hits += 1
+            return entry.response
+
+        response, etag = await self.send(endpoint, params, entry.etag if entry else None)
+        if self.cache is None:
+            return response
+        if response is None:
+            self.cache.revalidated += 1
+            response, etag = entry.response, entry.etag
+        else:
+            self.cache.misses += 1
+        self.cache.put(endpoint, params, response, etag)
+        return response
+
+    async def search(self, query, max_results=10):
+        return await self.execute('search', search_params(query, max_results))
+
+    async def videos(self, video_ids):
+        """{video ID: details} of up to MAX_VIDEO_IDS videos.
+
+        Videos fresh in the cache are not requested; the rest take one
+        request. Videos the API does not return (deleted or private) are
+        left out.
+        """
+        found = {}
+        missing = []
+        for video_id in video_ids:
+            item = self.cached_video(video_id)
+            if item is not None:
+                self.cache.hits += 1
+                found[video_id] = item
+            else:
+                missing.append(video_id)
+        if not missing:
+            return found
+
+        response, _ = await self.send('videos', videos_params(missing))
+        for item in response['items']:
+            found[item['id']] = item
+            if self.cache is not None:
+                self.cache.misses += 1
+                self.cache.put('videos', videos_params([item['id']]), {'items': [item]},
+                               item.get('etag'))
+        return found
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+class VideoBatcher:
+    """Looks up the video details of many topics with as few videos.list calls as possible.
+
+    Each topic hands in the IDs its search found with details(), or
+    leave()s without any, exactly once; until every topic has, the last
+    partial batch is held back. IDs are deduplicated across topics, those fresh
+    in the client's cache are answered from it, and a request for
+    MAX_VIDEO_IDS of the rest goes out as soon as that many are waiting.
+    The remainder is requested once every topic has handed in its IDs, so
+    a run makes ceil(distinct IDs / MAX_VIDEO_IDS) calls. Each topic gets
+    back the details of its own IDs.
+    """
+
+    def __init__(self, client, topics=1, batch_size=MAX_VIDEO_IDS):
+        self.client = client
+        self.waiting = topics
+        self.batch_size = min(batch_size, MAX_VIDEO_IDS)
+        self.pending = []
+        # {video ID: Future of its details, None if the API did not return it}
+        self.futures = {}
+        self.tasks = set()
+        self.calls = 0
+
+    async def details(self, video_ids):
+        """Details of the videos among video_ids that the API returned, in their order"""
+        loop = asyncio.get_running_loop()
+        try:
+            for video_id in video_ids:
+                if video_id in self.futures:
+                    continue
+                self.futures[video_id] = loop.create_future()
+                item = self.client.cached_video(video_id)
+                if item is not None:
+                    self.client.cache.hits += 1
+                    self.futures[video_id].set_result(item)
+                else:
+                    self.pending.append(video_id)
+            while len(self.pending) >= self.batch_size:
+                self.flush()
+        finally:
+            self.leave()
+
+        results = await asyncio.gather(*(self.futures[video_id] for video_id in video_ids),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [item for item in results if item is not None]
+
+    def leave(self):
+        """Mark one topic as done handing in IDs"""
+        self.waiting -= 1
+        if self.waiting <= 0 and self.pending:
+            self.flush()
+
+    def flush(self):
+        batch, self.pending = self.pending[:self.batch_size], self.pending[self.batch_size:]
+        self.calls += 1
+        task = asyncio.ensure_future(self.fetch(batch))
+        # The event loop only keeps weak references to tasks
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def fetch(self, batch):
+        try:
+            found = await self.client.videos(batch)
+        except Exception as e:
+            for video_id in batch:
+                self.futures[video_id].set_exception(e)
+            return
+        for video_id in batch:
+            self.futures[video_id].set_result(found.get(video_id))
+
+
+def is_preferred(channel_title):
+    """Check if video is from a preferred channel"""
+    return any(re.search(channel, channel_title, re.IGNORECASE) for channel in PREFERRED_CHANNELS)
+
+
+def video_score(video):
+    """Relevance of a video as a lesson, ordered like rank_videos"""
+    score = math.log10(int(video['statistics']['viewCount']) + 1)
+    if is_preferred(video['snippet']['channelTitle']):
+        score += PREFERRED_SCORE
+    if 180 <= parse_duration(video['contentDetails']['duration']) <= 600:
+        score += DURATION_SCORE
+    return score
+
+
+def candidate_scores(video_ids, videos):
+    """{video ID: score} of a topic's candidates.
+
+    Without any video details, the first search result is the only
+    candidate, as it is for pick_video.
+    """
+    scores = {video['id']: video_score(video) for video in videos}
+    if not scores and video_ids:
+        scores[video_ids[0]] = 0.0
+    return scores
+
+
+def rank_videos(videos):
+    """Split 3-10 minute videos into (preferred, other) lists of (id, views, channel).
+
+    Both lists are sorted by views, most viewed first.
+    """
+    preferred_videos = []
+    other_videos = []
+
+    for video in videos:
+        duration = parse_duration(video['contentDetails']['duration'])
+        views = int(video['statistics']['viewCount'])
+        channel_title = video['snippet']['channelTitle']
+
+        # Videos between 3-10 minutes
+        if 180 <= duration <= 600:
+            if is_preferred(channel_title):
+                preferred_videos.append((video['id'], views, channel_title))
+            else:
+                other_videos.append((video['id'], views, channel_title))
+
+    preferred_videos.sort(key=lambda x: x[1], reverse=True)
+    other_videos.sort(key=lambda x: x[1], reverse=True)
+    return preferred_videos, other_videos
+
+
+def pick_video(video_ids, videos, label=None):
+    """Print the best candidates among videos and return the chosen video ID"""
+    preferred_videos, other_videos = rank_videos(videos)
+
+    if preferred_videos:
+        candidates = preferred_videos
+        log(label, f"Found {len(preferred_videos)} videos from preferred channels:")
+    elif other_videos:
+        candidates = other_videos
+        log(label, "No videos from preferred channels found. Using other videos:")
+    else:
+        log(label, "No suitable videos found (3-10 minutes duration)")
+        # If no videos match our criteria, return the first video from the search results
+        return video_ids[0] if video_ids else None
+
+    for i, (video_id, views, channel) in enumerate(candidates[:3], 1):
+        log(label, f"  {i}. {channel} - {views} views - https://youtube.com/watch?v={video_id}")
+    # Return the video with the most views
+    return candidates[0][0]
+
+
+async def find_candidates(client, query, max_results=10, label=None, batcher=None):
+    """(search result IDs, video details) of a topic, or None if there are none.
+
+    Video details are looked up through batcher, a VideoBatcher shared
+    with the other topics being searched (by default one of its own).
+    """
+    if batcher is None:
+        batcher = VideoBatcher(client)
+    # Other topics' last batch waits until this one hands in its IDs or leaves
+    handed_in = False
     try:
-        # Add educational terms to query
-        full_query = f"learn {query} تعلم العربية"
-        
-        print(f"Searching for: {full_query}")
-        
-        request = youtube.search().list(
-            q=full_query,
-            part='snippet',
-            type='video',
-            videoDefinition='high',
-            videoEmbeddable='true',
-            relevanceLanguage='ar',
-            maxResults=max_results
-        )
-        response = request.execute()
-        
+        full_query = search_query(query)
+
+        log(label, f"Searching for: {full_query}")
+        response = await client.search(full_query, max_results)
+
         # Get video durations to filter
         video_ids = [item['id']['videoId'] for item in response['items']]
+        handed_in = True
+        videos = await batcher.details(video_ids)
         if not video_ids:
-            print("No videos found in search results")
+            log(label, "No videos found in search results")
             return None
-            
-        duration_request = youtube.videos().list(
-            part='contentDetails,statistics,snippet',
-            id=','.join(video_ids)
-        )
-        duration_response = duration_request.execute()
-        
-        # First, check for videos from preferred channels
-        preferred_videos = []
-        other_videos = []
-        
-        for i, video in enumerate(duration_response['items']):
-            duration = parse_duration(video['contentDetails']['duration'])
-            views = int(video['statistics']['viewCount'])
-            channel_title = video['snippet']['channelTitle']
-            
-            # Check if video is from a preferred channel
-            is_preferred = any(re.search(channel, channel_title, re.IGNORECASE) for channel in PREFERRED_CHANNELS)
-            
-            # Videos between 3-10 minutes
-            if 180 <= duration <= 600:
-                if is_preferred:
-                    preferred_videos.append((video['id'], views, channel_title))
-                else:
-                    other_videos.append((video['id'], views, channel_title))
-        
-        # Sort preferred videos by views (descending)
-        preferred_videos.sort(key=lambda x: x[1], reverse=True)
-        other_videos.sort(key=lambda x: x[1], reverse=True)
-        
-        # Print information about found videos
-        if preferred_videos:
-            print(f"Found {len(preferred_videos)} videos from preferred channels:")
-            for i, (video_id, views, channel) in enumerate(preferred_videos[:3], 1):
-                print(f"  {i}. {channel} - {views} views - https://youtube.com/watch?v={video_id}")
-            
-            # Return the preferred video with the most views
-            return preferred_videos[0][0]
-        elif other_videos:
-            print(f"No videos from preferred channels found. Using other videos:")
-            for i, (video_id, views, channel) in enumerate(other_videos[:3], 1):
-                print(f"  {i}. {channel} - {views} views - https://youtube.com/watch?v={video_id}")
-            
-            # Return the video with the most views
-            return other_videos[0][0]
-        else:
-            print("No suitable videos found (3-10 minutes duration)")
-            # If no videos match our criteria, return the first video from the search results
-            return video_ids[0] if video_ids else None
-        
+        return video_ids, videos
+
     except Exception as e:
-        print(f"Error searching YouTube: {e}")
+        log(label, f"Error searching YouTube: {e}")
+        return None
+    finally:
+        if not handed_in:
+            batcher.leave()
+
+
+async def search_youtube_video(client, query, max_results=10, label=None, batcher=None):
+    """Search for an Arabic video matching criteria"""
+    found = await find_candidates(client, query, max_results, label, batcher)
+    if found is None:
+        return None
+    try:
+        return pick_video(*found, label)
+    except Exception as e:
+        log(label, f"Error searching YouTube: {e}")
         return None
 
 def parse_duration(duration):
@@ -182,101 +558,209 @@ def parse_duration(duration):
     
     return hours * 3600 + minutes * 60 + seconds
 
-def update_videos_json(videos):
+def load_videos(path):
+    """Video IDs saved at path, or an empty dict"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def update_videos_json(videos, path=VIDEOS_PATH):
     """Update videos.json with new video IDs"""
     try:
-        with open('videos.json', 'w') as f:
+        with open(path, 'w') as f:
             json.dump(videos, f, indent=2)
-        print("Successfully updated videos.json")
+        print(f"Successfully updated {path}")
         return True
     except Exception as e:
-        print(f"Error updating videos.json: {e}")
+        print(f"Error updating {path}: {e}")
         return False
 
-def update_supplementary_videos_json(videos):
+def update_supplementary_videos_json(videos, path=SUPPLEMENTARY_VIDEOS_PATH):
     """Update videos_supplementary.json with new video IDs"""
-    try:
-        with open('videos_supplementary.json', 'w') as f:
-            json.dump(videos, f, indent=2)
-        print("Successfully updated videos_supplementary.json")
-        return True
-    except Exception as e:
-        print(f"Error updating videos_supplementary.json: {e}")
-        return False
+    return update_videos_json(videos, path)
 
-def main():
-    if not YOUTUBE_API_KEY:
-        print("Error: YOUTUBE_API_KEY environment variable not set")
-        return
-    
-    youtube = init_youtube()
-    
-    # Process daily content
-    try:
-        videos = {}
-        if os.path.exists('videos.json'):
-            with open('videos.json', 'r') as f:
-                videos = json.load(f)
-        
-        for day in range(1, 41):  # Process 40 days as per README
-            print(f"\nProcessing Day {day}...")
-            topic = get_topic(day, "day")
-            
-            # Skip if we already have this video with a non-empty ID
-            if f"day{day}" in videos and videos[f"day{day}"]:
+def missing_topics(videos, supp_videos, everything=False):
+    """(videos, key, topic, save) for every day and category without a video yet.
+
+    With everything, topics that have a video are searched again too.
+    """
+    topics = []
+    for day in DAYS:
+        key = f'day{day}'
+        # Skip if we already have this video with a non-empty ID
+        if videos.get(key):
+            if not everything:
                 print(f"Already have video for day {day}")
                 continue
-            elif f"day{day}" in videos and not videos[f"day{day}"]:
-                print(f"Empty video ID for day {day}, searching for a new one...")
-                
-            print(f"Searching for Arabic videos...")
-            video_id = search_youtube_video(youtube, topic)
-            if video_id:
-                videos[f'day{day}'] = video_id
-                print(f"Found video: https://youtube.com/watch?v={video_id}")
-                # Save progress
-                update_videos_json(videos)
-            else:
-                print("No suitable video found")
-            
-            # Respect YouTube API quotas
-            time.sleep(1)
-    except Exception as e:
-        print(f"Error processing daily content: {e}")
-    
-    # Process supplementary content
-    try:
-        supp_videos = {}
-        if os.path.exists('videos_supplementary.json'):
-            with open('videos_supplementary.json', 'r') as f:
-                supp_videos = json.load(f)
-        
-        categories = ['education', 'hobbies', 'emotions', 'daily_life', 'comparisons']
-        for category in categories:
-            print(f"\nProcessing category: {category}")
-            topic = get_topic(category, "supplementary")
-            
-            # Skip if we already have this video with a non-empty ID
-            if category in supp_videos and supp_videos[category]:
+        elif key in videos:
+            print(f"Empty video ID for day {day}, searching for a new one...")
+        topics.append((videos, key, get_topic(day, "day"), update_videos_json))
+
+    for category in SUPPLEMENTARY_CATEGORIES:
+        if supp_videos.get(category):
+            if not everything:
                 print(f"Already have video for category {category}")
                 continue
-            elif category in supp_videos and not supp_videos[category]:
-                print(f"Empty video ID for category {category}, searching for a new one...")
-                
-            print(f"Searching for Arabic videos...")
-            video_id = search_youtube_video(youtube, topic)
-            if video_id:
-                supp_videos[category] = video_id
-                print(f"Found video: https://youtube.com/watch?v={video_id}")
-                # Save progress
-                update_supplementary_videos_json(supp_videos)
-            else:
-                print("No suitable video found")
-            
-            # Respect YouTube API quotas
-            time.sleep(1)
-    except Exception as e:
-        print(f"Error processing supplementary content: {e}")
+        elif category in supp_videos:
+            print(f"Empty video ID for category {category}, searching for a new one...")
+        topics.append((supp_videos, category, get_topic(category, "supplementary"),
+                       update_supplementary_videos_json))
+    return topics
+
+def topic_cost(client, topic, max_results=10):
+    """Quota units searching for a topic would cost, given the client's cached responses"""
+    params = search_params(search_query(topic), max_results)
+    response = client.cached('search', params)
+    if response is None:
+        return TOPIC_COST
+    video_ids = [item['id']['videoId'] for item in response['items']]
+    if all(client.cached_video(video_id) is not None for video_id in video_ids):
+        return 0
+    # At most one videos.list call, usually shared with other topics
+    return QUOTA_COSTS['videos']
+
+def affordable_topics(topics, quota, cost=lambda topic: TOPIC_COST):
+    """Split topics into those today's remaining quota can pay for and those deferred.
+
+    cost(topic) gives the units a topic needs; topics are taken in order.
+    """
+    remaining = quota.remaining()
+    runnable = []
+    deferred = []
+    for topic in topics:
+        units = cost(topic[2])
+        if units <= remaining:
+            remaining -= units
+            runnable.append(topic)
+        else:
+            deferred.append(topic)
+    return runnable, deferred
+
+def kept_videos(topics, *stores):
+    """{video ID: number of topics outside topics that keep it} over stores"""
+    searched = {(id(videos), key) for videos, key, _, _ in topics}
+    used = {}
+    for videos in stores:
+        for key, video_id in videos.items():
+            if video_id and (id(videos), key) not in searched:
+                used[video_id] = used.get(video_id, 0) + 1
+    return used
+
+def print_assignment(candidates, assignment, reuse_penalty, used):
+    picks = greedy(candidates)
+    print(f"\nAssignment: {len(assignment)} topics, {len(set(assignment.values()))} distinct "
+          f"videos (best per topic alone: {len(set(picks.values()))}), score "
+          f"{total_score(candidates, assignment, reuse_penalty, used):.1f} vs "
+          f"{total_score(candidates, picks, reuse_penalty, used):.1f} after reuse penalties")
+
+async def find_videos(client, topics, max_results=10, reuse_penalty=DEFAULT_REUSE_PENALTY,
+                      used=None):
+    """Search for all topics at once, then give each a video and save them.
+
+    Days and supplementary categories share one pool of workers, so the
+    run takes about as long as its slowest `client.concurrency`-th of the
+    requests rather than the sum of all of them. The video details of all
+    topics are looked up together by one VideoBatcher.
+
+    Videos are assigned to all topics together (arabic_pathways.assignment)
+    to maximize their total video_score, with every reuse of a video,
+    including by the topics in `used` that are not searched, costing
+    reuse_penalty more than the one before. Returns the video ID (or None)
+    of each topic.
+    """
+    batcher = VideoBatcher(client, len(topics))
+    found = await asyncio.gather(*(find_candidates(client, topic, max_results, key, batcher)
+                                   for _, key, topic, _ in topics))
+
+    candidates = {}
+    for (_, key, _, _), result in zip(topics, found):
+        candidates[key] = candidate_scores(*result) if result else {}
+    assignment = assign(candidates, reuse_penalty, used)
+
+    saves = {}
+    for videos, key, _, save in topics:
+        video_id = assignment.get(key)
+        if video_id:
+            videos[key] = video_id
+            saves[id(videos)] = (save, videos)
+            log(key, f"Assigned video: https://youtube.com/watch?v={video_id} "
+                     f"(score {candidates[key][video_id]:.1f}, {len(candidates[key])} candidates)")
+        else:
+            log(key, "No suitable video found")
+    for save, videos in saves.values():
+        save(videos)
+    if assignment:
+        print_assignment(candidates, assignment, reuse_penalty, used)
+    return [assignment.get(key) for _, key, _, _ in topics]
+
+def max_results(value):
+    """argparse type for --max-results: 1 to MAX_SEARCH_RESULTS"""
+    count = int(value)
+    if not 1 <= count <= MAX_SEARCH_RESULTS:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_SEARCH_RESULTS}")
+    return count
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Find YouTube videos for days and supplementary categories")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"YouTube API requests in flight at once "
+                             f"(default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--quota", type=int, default=DEFAULT_DAILY_QUOTA,
+                        help=f"Daily quota budget in units (default: {DEFAULT_DAILY_QUOTA})")
+    parser.add_argument("--rate-limit", type=float, default=DEFAULT_RATE_LIMIT,
+                        help=f"YouTube API requests per second (default: {DEFAULT_RATE_LIMIT})")
+    parser.add_argument("--all", action="store_true",
+                        help="Search every topic again, including those that have a video")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help=f"Directory of cached API responses (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--search-ttl", type=float, default=DEFAULT_SEARCH_TTL,
+                        help=f"Hours to reuse cached search results "
+                             f"(default: {DEFAULT_SEARCH_TTL})")
+    parser.add_argument("--videos-ttl", type=float, default=DEFAULT_VIDEOS_TTL,
+                        help=f"Hours to reuse cached video details (default: {DEFAULT_VIDEOS_TTL})")
+    parser.add_argument("--max-results", type=max_results, default=10,
+                        help=f"Candidate videos per topic, up to {MAX_SEARCH_RESULTS} "
+                             "(default: 10)")
+    parser.add_argument("--reuse-penalty", type=float, default=DEFAULT_REUSE_PENALTY,
+                        help="Score given up by each further use of one video "
+                             f"(default: {DEFAULT_REUSE_PENALTY})")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not YOUTUBE_API_KEY:
+        print("Error: YOUTUBE_API_KEY environment variable not set")
+        return
+
+    videos = load_videos(VIDEOS_PATH)
+    supp_videos = load_videos(SUPPLEMENTARY_VIDEOS_PATH)
+    quota = QuotaScheduler(args.quota, args.rate_limit)
+    cache = ResponseCache(args.cache_dir, {'search': args.search_ttl * 3600,
+                                           'videos': args.videos_ttl * 3600})
+    client = YouTubeClient(init_youtube(), args.concurrency, quota, cache)
+    topics, deferred = affordable_topics(missing_topics(videos, supp_videos, args.all), quota,
+                                         lambda topic: topic_cost(client, topic, args.max_results))
+    if deferred:
+        print(f"⚠ Deferring {len(deferred)} topics to a later day: {quota.remaining()} of "
+              f"{quota.budget} quota units left, {TOPIC_COST} needed per uncached topic")
+    if not topics:
+        client.close()
+        return
+
+    start = time.perf_counter()
+    try:
+        found = asyncio.run(find_videos(client, topics, args.max_results, args.reuse_penalty,
+                                        kept_videos(topics, videos, supp_videos)))
+    finally:
+        client.close()
+        quota.save()
+    print(f"\n✓ Found {sum(1 for video_id in found if video_id)} of {len(topics)} videos "
+          f"with {client.requests} API requests in {time.perf_counter() - start:.1f}s "
+          f"({client.quota.calls.get('videos', 0)} videos.list calls)")
+    quota.print_stats()
+    cache.print_stats()
 
 if __name__ == "__main__":
     main()